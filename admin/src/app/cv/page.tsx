@@ -72,8 +72,10 @@ export default function CVEditorPage() {
   const [hasChanges, setHasChanges] = useState(false);
   const [lastSaved, setLastSaved] = useState<Date | null>(null);
   const [cvName, setCvName] = useState('Resume');
+  const [cvId, setCvId] = useState<string | undefined>(undefined);
 
   const compileTimeoutRef = useRef<NodeJS.Timeout | null>(null);
+  const compileRequestRef = useRef(0);
 
   // Load existing CV on mount
   useEffect(() => {
@@ -92,7 +94,7 @@ export default function CVEditorPage() {
     }
 
     compileTimeoutRef.current = setTimeout(() => {
-      compileLatex(latexSource);
+      compileLatex(latexSource, true);
     }, 1000); // 1 second debounce
 
     return () => {
@@ -109,6 +111,7 @@ export default function CVEditorPage() {
       setLatexSource(data.latex_source);
       setOriginalSource(data.latex_source);
       setCvName(data.name);
+      setCvId(data.id);
       // Compile on load
       compileLatex(data.latex_source);
     } catch (error) {
@@ -117,14 +120,19 @@ export default function CVEditorPage() {
     }
   };
 
-  const compileLatex = async (source: string) => {
+  const compileLatex = async (source: string, draft = false) => {
+    // Drafts supersede each other on the server; only the newest result counts
+    const requestId = ++compileRequestRef.current;
     setIsCompiling(true);
     setErrors([]);
     setWarnings([]);
 
     try {
-      const response = await cvApi.compileCV(source, false);
+      const response = draft
+        ? await cvApi.compileDraft(source, cvId)
+        : await cvApi.compileCV(source, false);
       const result = response.data;
+      if (requestId !== compileRequestRef.current) return;
 
       if (result.success) {
         setPdfUrl(result.pdf_url);
@@ -135,9 +143,12 @@ export default function CVEditorPage() {
       setWarnings(result.warnings || []);
       setCompilationTime(result.compilation_time_ms || 0);
     } catch (error: any) {
+      if (requestId !== compileRequestRef.current) return;
       setErrors([error.message || 'Compilation failed']);
     } finally {
-      setIsCompiling(false);
+      if (requestId === compileRequestRef.current) {
+        setIsCompiling(false);
+      }
     }
   };
 
@@ -12,6 +12,8 @@ interface Template {
   category: string;
 }
 
+const API_URL = process.env.NEXT_PUBLIC_API_URL || 'https://api.alamin.rocks';
+
 interface TemplateSelectorProps {
   onSelect: (template: { id: string; latex_template: string }) => void;
   onClose: () => void;
@@ -22,6 +24,7 @@ export function TemplateSelector({ onSelect, onClose }: TemplateSelectorProps) {
   const [loading, setLoading] = useState(true);
   const [selectedId, setSelectedId] = useState<string | null>(null);
   const [applying, setApplying] = useState(false);
+  const [brokenPreviews, setBrokenPreviews] = useState<Set<string>>(new Set());
 
   useEffect(() => {
     fetchTemplates();
@@ -101,6 +104,16 @@ export function TemplateSelector({ onSelect, onClose }: TemplateSelectorProps) {
                     </div>
                   )}
 
+                  {template.preview_image && !brokenPreviews.has(template.id) && (
+                    <img
+                      src={`${API_URL}${template.preview_image}`}
+                      alt={`${template.name} preview`}
+                      loading="lazy"
+                      className="w-full aspect-[210/297] object-cover object-top rounded-md mb-3 bg-white"
+                      onError={() => setBrokenPreviews(prev => new Set(prev).add(template.id))}
+                    />
+                  )}
+
                   <div className="flex items-center gap-3 mb-3">
                     <div className="w-10 h-10 bg-gray-700 rounded-lg flex items-center justify-center">
                       <FileText className="w-5 h-5 text-gray-400" />
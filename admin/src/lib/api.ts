@@ -101,6 +101,8 @@ export const translationApi = {
     api.get("/api/translations/achievements", { params: { lang } }),
   getExperiences: (lang: string = "en") =>
     api.get("/api/translations/experiences", { params: { lang } }),
+  getBundle: (lang: string = "en", featured: boolean = false) =>
+    api.get("/api/translations/bundle", { params: { lang, featured } }),
   getCompleteness: () => api.get("/api/translations/completeness"),
 
   // Admin endpoints for managing translations
@@ -122,6 +124,15 @@ export const translationApi = {
     api.post(`/api/translations/ui/${key}`, null, {
       params: { language_code: languageCode, value },
     }),
+  importTranslations: (
+    kind: "content" | "ui",
+    rows: Record<string, string>[] | string
+  ) =>
+    typeof rows === "string"
+      ? api.post(`/api/translations/import/${kind}`, rows, {
+          headers: { "Content-Type": "text/csv" },
+        })
+      : api.post(`/api/translations/import/${kind}`, rows),
   deleteContentTranslation: (
     tableName: string,
     recordId: string,
@@ -208,6 +219,12 @@ export const cvApi = {
     api.put("/api/cv/source", { latex_source, name }),
   compileCV: (latex_source: string, save?: boolean, name?: string) =>
     api.post("/api/cv/compile", { latex_source, save, name }),
+  compileDraft: (latex_source: string, cv_id?: string) =>
+    api.post("/api/cv/compile", { latex_source, cv_id, draft: true }),
+  compileCVAsync: (latex_source: string, save?: boolean, name?: string) =>
+    api.post("/api/cv/compile", { latex_source, save, name, async_mode: true }),
+  getCompileJob: (jobId: string) => api.get(`/api/cv/compile/${jobId}`),
+  cancelCompileJob: (jobId: string) => api.delete(`/api/cv/compile/${jobId}`),
   createCV: (latex_source: string, name?: string) =>
     api.post("/api/cv", { latex_source, name }),
   updateCV: (id: string, data: { name?: string; latex_source?: string; is_active?: boolean }) =>
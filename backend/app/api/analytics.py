@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
 from app.core.dependencies import get_db
+from app.services.analytics import empty_overview, overview_aggregates
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,104 +17,17 @@ router = APIRouter()
 
 @router.get("/overview")
 async def get_analytics_overview(
-    db: AsyncSession = Depends(get_db),
     days: int = Query(default=30, description="Number of days to look back")
 ) -> Dict:
     """Get analytics overview data"""
     try:
-        # Calculate date range
-        end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=days)
-        
-        # Get contact message stats
-        contact_stats_query = text("""
-            SELECT 
-                COUNT(*) as total_messages,
-                COUNT(CASE WHEN is_read = true THEN 1 END) as read_messages,
-                COUNT(CASE WHEN is_replied = true THEN 1 END) as replied_messages,
-                COUNT(CASE WHEN created_at >= :start_date THEN 1 END) as recent_messages
-            FROM contact_messages
-        """)
-        
-        contact_result = await db.execute(
-            contact_stats_query,
-            {"start_date": start_date}
-        )
-        contact_stats = contact_result.first()
-        
-        # Get project stats
-        project_stats_query = text("""
-            SELECT 
-                COUNT(*) as total_projects,
-                COUNT(CASE WHEN is_featured = true THEN 1 END) as featured_projects,
-                COUNT(DISTINCT category) as total_categories
-            FROM projects
-        """)
-        
-        project_result = await db.execute(project_stats_query)
-        project_stats = project_result.first()
-        
-        # Get skills stats
-        skills_stats_query = text("""
-            SELECT 
-                COUNT(*) as total_skills,
-                COUNT(DISTINCT category) as skill_categories,
-                AVG(proficiency) as avg_proficiency
-            FROM skills
-        """)
-        
-        skills_result = await db.execute(skills_stats_query)
-        skills_stats = skills_result.first()
-        
-        # Get experience stats
-        experience_stats_query = text("""
-            SELECT 
-                COUNT(*) as total_experiences,
-                COUNT(CASE WHEN is_current = true THEN 1 END) as current_positions
-            FROM experiences
-        """)
-        
-        experience_result = await db.execute(experience_stats_query)
-        experience_stats = experience_result.first()
-        
-        return {
-            "overview": {
-                "total_messages": contact_stats.total_messages if contact_stats else 0,
-                "read_messages": contact_stats.read_messages if contact_stats else 0,
-                "replied_messages": contact_stats.replied_messages if contact_stats else 0,
-                "recent_messages": contact_stats.recent_messages if contact_stats else 0,
-                "total_projects": project_stats.total_projects if project_stats else 0,
-                "featured_projects": project_stats.featured_projects if project_stats else 0,
-                "project_categories": project_stats.total_categories if project_stats else 0,
-                "total_skills": skills_stats.total_skills if skills_stats else 0,
-                "skill_categories": skills_stats.skill_categories if skills_stats else 0,
-                "avg_skill_proficiency": float(skills_stats.avg_proficiency) if skills_stats and skills_stats.avg_proficiency else 0,
-                "total_experiences": experience_stats.total_experiences if experience_stats else 0,
-                "current_positions": experience_stats.current_positions if experience_stats else 0,
-            },
-            "period": {
-                "days": days,
-                "start_date": start_date.isoformat(),
-                "end_date": end_date.isoformat()
-            }
-        }
+        return await overview_aggregates.get(days)
     except Exception as e:
         logger.error(f"Error fetching analytics overview: {e}")
+        end_date = datetime.utcnow()
+        start_date = end_date - timedelta(days=days)
         return {
-            "overview": {
-                "total_messages": 0,
-                "read_messages": 0,
-                "replied_messages": 0,
-                "recent_messages": 0,
-                "total_projects": 0,
-                "featured_projects": 0,
-                "project_categories": 0,
-                "total_skills": 0,
-                "skill_categories": 0,
-                "avg_skill_proficiency": 0,
-                "total_experiences": 0,
-                "current_positions": 0,
-            },
+            "overview": empty_overview(),
             "period": {
                 "days": days,
                 "start_date": start_date.isoformat(),
@@ -5,6 +5,8 @@ from typing import Dict, Optional
 from fastapi import APIRouter, HTTPException, Header, status
 from pydantic import BaseModel
 
+from app.core.state_store import state_store
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -26,12 +28,27 @@ class TokenData(BaseModel):
 # In-memory token storage for demo (in production, use proper JWT with database)
 active_tokens: Dict[str, TokenData] = {}
 
+
+def _dump_tokens() -> dict:
+    return {token: data.model_dump(mode="json") for token, data in active_tokens.items()}
+
+
+def _load_tokens(data: dict):
+    active_tokens.clear()
+    active_tokens.update({token: TokenData.model_validate(value) for token, value in data.items()})
+
+
+# Shared across workers when a shared state backend is configured. Expired
+# tokens found on reads are only dropped locally; every worker checks expiry.
+_tokens = state_store.register("auth_tokens", _dump_tokens, _load_tokens)
+
 # Simple demo credentials (in production, use proper authentication)
 DEMO_CREDENTIALS = {
     "admin": "admin123"
 }
 
 @router.post("/login", response_model=LoginResponse)
+@_tokens.writer
 async def login(request: LoginRequest):
     """
     Authenticate admin user and return access token
@@ -81,6 +98,7 @@ class TokenRequest(BaseModel):
     token: str
 
 @router.post("/verify")
+@_tokens.reader
 async def verify_token(request: TokenRequest):
     """
     Verify if token is valid
@@ -115,6 +133,7 @@ async def verify_token(request: TokenRequest):
         )
 
 @router.post("/logout")
+@_tokens.writer
 async def logout(request: TokenRequest):
     """
     Logout and invalidate token
@@ -136,6 +155,7 @@ async def logout(request: TokenRequest):
         )
 
 @router.get("/me")
+@_tokens.reader
 async def get_current_user(token: Optional[str] = None, authorization: Optional[str] = Header(None)):
     """
     Get current user info. Accepts token as query param or Bearer token in Authorization header.
@@ -1,7 +1,8 @@
 import logging
-from typing import List, Optional
+from typing import Any, Awaitable, Callable, List, Optional, Type
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
+from pydantic import BaseModel
 
 from app.schemas.content import (
     HeroResponse, HeroUpdateRequest,
@@ -15,17 +16,48 @@ from app.schemas.content import (
     ReorderRequest,
 )
 from app.services import content as content_service
+from app.utils.snapshots import SnapshotStore, render_snapshot, snapshot_response
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Serialized GET responses, rebuilt only after a write to their collection
+_snapshots = SnapshotStore()
+
+
+async def _snapshot(
+    request: Request,
+    collection: str,
+    fetch: Callable[[], Awaitable[Any]],
+    model: Type[BaseModel],
+    variant: Optional[str] = None
+) -> Response:
+    """Serve a collection from its snapshot, serializing it once per version."""
+    name = f"{collection}:{variant}" if variant else collection
+    # Read the version first so a write during the fetch leaves this stale
+    version = await content_service.get_version(collection)
+    snapshot = _snapshots.lookup(name, version)
+    if snapshot is None:
+        data = await fetch()
+        if isinstance(data, list):
+            payload = [model.model_validate(item, from_attributes=True).model_dump(mode="json") for item in data]
+        else:
+            payload = model.model_validate(data, from_attributes=True).model_dump(mode="json")
+        if variant and not payload:
+            # Only variants with data get a snapshot; otherwise any made-up
+            # ?category= would add an entry
+            snapshot = render_snapshot(name, version, payload)
+        else:
+            snapshot = _snapshots.store(name, version, payload)
+    return snapshot_response(request, *snapshot)
+
 
 # ============ Hero Endpoints ============
 
 @router.get("/hero", response_model=HeroResponse)
-async def get_hero():
+async def get_hero(request: Request):
     """Get hero section content."""
-    return await content_service.get_hero()
+    return await _snapshot(request, "hero", content_service.get_hero, HeroResponse)
 
 
 @router.put("/hero", response_model=HeroResponse)
@@ -38,9 +70,9 @@ async def update_hero(request: HeroUpdateRequest):
 # ============ About Endpoints ============
 
 @router.get("/about", response_model=AboutResponse)
-async def get_about():
+async def get_about(request: Request):
     """Get about section content."""
-    return await content_service.get_about()
+    return await _snapshot(request, "about", content_service.get_about, AboutResponse)
 
 
 @router.put("/about", response_model=AboutResponse)
@@ -53,9 +85,9 @@ async def update_about(request: AboutUpdateRequest):
 # ============ Experience Endpoints ============
 
 @router.get("/experiences", response_model=List[ExperienceResponse])
-async def get_experiences():
+async def get_experiences(request: Request):
     """Get all experience entries."""
-    return await content_service.get_experiences()
+    return await _snapshot(request, "experiences", content_service.get_experiences, ExperienceResponse)
 
 
 @router.get("/experiences/{exp_id}", response_model=ExperienceResponse)
@@ -101,9 +133,11 @@ async def bulk_update_experiences(experiences: List[dict]):
 # ============ Skills Endpoints ============
 
 @router.get("/skills", response_model=List[SkillResponse])
-async def get_skills(category: Optional[str] = None):
+async def get_skills(request: Request, category: Optional[str] = None):
     """Get all skill entries."""
-    return await content_service.get_skills(category)
+    return await _snapshot(
+        request, "skills", lambda: content_service.get_skills(category), SkillResponse, category
+    )
 
 
 @router.get("/skills/{skill_id}", response_model=SkillResponse)
@@ -149,9 +183,9 @@ async def bulk_update_skills(skills: List[dict]):
 # ============ Education Endpoints ============
 
 @router.get("/education", response_model=List[EducationResponse])
-async def get_education():
+async def get_education(request: Request):
     """Get all education entries."""
-    return await content_service.get_education_list()
+    return await _snapshot(request, "education", content_service.get_education_list, EducationResponse)
 
 
 @router.get("/education/{edu_id}", response_model=EducationResponse)
@@ -197,9 +231,12 @@ async def bulk_update_education(education: List[dict]):
 # ============ Achievements Endpoints ============
 
 @router.get("/achievements", response_model=List[AchievementResponse])
-async def get_achievements(category: Optional[str] = None):
+async def get_achievements(request: Request, category: Optional[str] = None):
     """Get all achievement entries."""
-    return await content_service.get_achievements(category)
+    return await _snapshot(
+        request, "achievements", lambda: content_service.get_achievements(category),
+        AchievementResponse, category
+    )
 
 
 @router.get("/achievements/{ach_id}", response_model=AchievementResponse)
@@ -245,9 +282,9 @@ async def bulk_update_achievements(achievements: List[dict]):
 # ============ Certifications Endpoints ============
 
 @router.get("/certifications", response_model=List[CertificationResponse])
-async def get_certifications():
+async def get_certifications(request: Request):
     """Get all certification entries."""
-    return await content_service.get_certifications()
+    return await _snapshot(request, "certifications", content_service.get_certifications, CertificationResponse)
 
 
 @router.get("/certifications/{cert_id}", response_model=CertificationResponse)
@@ -293,9 +330,9 @@ async def bulk_update_certifications(certifications: List[dict]):
 # ============ Contact Info Endpoints ============
 
 @router.get("/contact-info", response_model=ContactInfoResponse)
-async def get_contact_info():
+async def get_contact_info(request: Request):
     """Get contact information."""
-    return await content_service.get_contact_info()
+    return await _snapshot(request, "contact_info", content_service.get_contact_info, ContactInfoResponse)
 
 
 @router.put("/contact-info", response_model=ContactInfoResponse)
@@ -1,33 +1,52 @@
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, HTTPException, Response
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import PlainTextResponse
 
+from app.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from app.models.cv import CompilationResult, CompileJob
 from app.schemas.cv import (
+    CVCacheStatsResponse,
+    CVCompileJobResponse,
     CVCompileRequest,
     CVCompileResponse,
     CVListResponse,
     CVResponse,
     CVSourceRequest,
     CVSourceResponse,
+    CVStorageReport,
+    CVStorageStatsResponse,
     CVTemplateResponse,
     CVUpdateRequest,
 )
 from app.services.cv import (
+    cancel_compile_job,
     compile_latex,
     create_cv_document,
     delete_cv_document,
     get_active_cv,
     get_all_cvs,
+    get_compile_cache_stats,
+    get_compile_metrics,
+    get_compile_job,
     get_cv_by_id,
     get_template_by_id,
+    get_template_preview,
+    get_storage_stats,
     get_templates,
+    resolve_pdf_path,
+    run_storage_cleanup,
+    submit_compile_job,
+    template_preview_url,
     update_cv_document,
     PDF_OUTPUT_PATH,
 )
+from app.services.cv_cache import is_cached_pdf_name
+from app.services.cv_compiler import CompileQueueFullError
+from app.utils.file_delivery import conditional_file_response
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -131,56 +150,158 @@ async def update_cv_source(request: CVSourceRequest):
     )
 
 
-@router.post("/compile", response_model=CVCompileResponse)
-async def compile_cv(request: CVCompileRequest):
-    """Compile LaTeX source to PDF."""
-    result = await compile_latex(request.latex_source)
+def _job_response(job: CompileJob) -> CVCompileJobResponse:
+    result = job.result
+    return CVCompileJobResponse(
+        job_id=job.id,
+        status=job.status.value,
+        success=result.success if result else None,
+        pdf_url=result.pdf_path if result else None,
+        errors=result.errors if result else [],
+        warnings=result.warnings if result else [],
+        diagnostics=result.diagnostics if result else [],
+        compilation_time_ms=result.compilation_time_ms if result else 0,
+        cached=result.cached if result else False,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at
+    )
+
+
+async def _save_compiled_source(result: CompilationResult, latex_source: str, name: Optional[str] = None):
+    cv = await get_active_cv()
+    if not cv:
+        cv = await create_cv_document(latex_source, name or "Resume")
+    # Pointing the document at its PDF also keeps the janitor away from it
+    await update_cv_document(cv.id, latex_source=latex_source, pdf_path=result.pdf_path)
+
+
+@router.post("/compile", response_model=Union[CVCompileResponse, CVCompileJobResponse])
+async def compile_cv(request: CVCompileRequest, response: Response):
+    """Compile LaTeX source to PDF.
+
+    With ``async_mode`` the job is queued and its ID returned right away;
+    poll ``GET /compile/{job_id}`` for the result. ``draft`` compiles a
+    single pass for live preview, and a newer draft for the same ``cv_id``
+    cancels the one still in flight.
+    """
+    if request.async_mode:
+        on_complete = None
+        if request.save:
+            async def on_complete(result: CompilationResult):
+                await _save_compiled_source(result, request.latex_source, request.name)
+
+        try:
+            job = await submit_compile_job(
+                request.latex_source,
+                cv_id=request.cv_id,
+                draft=request.draft,
+                on_complete=on_complete
+            )
+        except CompileQueueFullError:
+            raise HTTPException(status_code=503, detail="Compile queue is full, try again shortly")
+
+        response.status_code = status.HTTP_202_ACCEPTED
+        return _job_response(job)
+
+    try:
+        result = await compile_latex(
+            request.latex_source,
+            cv_id=request.cv_id,
+            draft=request.draft
+        )
+    except CompileQueueFullError:
+        raise HTTPException(status_code=503, detail="Compile queue is full, try again shortly")
 
     if request.save and result.success:
-        cv = await get_active_cv()
-        if cv:
-            await update_cv_document(cv.id, latex_source=request.latex_source)
-        else:
-            await create_cv_document(request.latex_source, request.name or "Resume")
+        await _save_compiled_source(result, request.latex_source, request.name)
 
     return CVCompileResponse(
         success=result.success,
         pdf_url=result.pdf_path,
         errors=result.errors,
         warnings=result.warnings,
-        compilation_time_ms=result.compilation_time_ms
+        diagnostics=result.diagnostics,
+        compilation_time_ms=result.compilation_time_ms,
+        cached=result.cached
     )
 
 
+@router.get("/compile/metrics", response_class=PlainTextResponse)
+async def get_compile_engine_metrics():
+    """Get CV engine counters and histograms in the Prometheus text format."""
+    return PlainTextResponse(get_compile_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
+@router.get("/compile/cache", response_model=CVCacheStatsResponse)
+async def get_compile_cache():
+    """Get compile cache hit/miss counters."""
+    return await get_compile_cache_stats()
+
+
+@router.get("/storage", response_model=CVStorageStatsResponse)
+async def get_storage():
+    """Get CV storage usage and janitor results."""
+    return await get_storage_stats()
+
+
+@router.post("/storage/cleanup", response_model=CVStorageReport)
+async def cleanup_storage():
+    """Apply the CV storage retention policy now."""
+    return await run_storage_cleanup()
+
+
+@router.get("/compile/{job_id}", response_model=CVCompileJobResponse)
+async def get_compile_status(job_id: str):
+    """Get the status of a queued compile job."""
+    job = await get_compile_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Compile job not found")
+    return _job_response(job)
+
+
+@router.delete("/compile/{job_id}")
+async def cancel_compile(job_id: str):
+    """Cancel a queued or running compile job."""
+    job = await get_compile_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Compile job not found")
+    if not await cancel_compile_job(job_id):
+        raise HTTPException(status_code=409, detail="Compile job already finished")
+    return {"success": True, "message": "Compile job cancelled"}
+
+
 @router.get("/pdf/{filename}")
-async def get_pdf(filename: str):
+async def get_pdf(filename: str, request: Request):
     """Serve compiled PDF file."""
     pdf_path = PDF_OUTPUT_PATH / filename
-    if not pdf_path.exists():
+    if not pdf_path.is_file():
         raise HTTPException(status_code=404, detail="PDF not found")
 
-    return FileResponse(
-        path=str(pdf_path),
+    # Cached PDFs are content-addressed, so their URL never changes meaning
+    return await conditional_file_response(
+        request,
+        pdf_path,
         media_type="application/pdf",
-        filename=filename
+        filename=filename,
+        immutable=is_cached_pdf_name(filename)
     )
 
 
 @router.get("/download")
-async def download_cv():
+async def download_cv(request: Request):
     """Download the active CV PDF."""
     cv = await get_active_cv()
     if not cv or not cv.pdf_path:
         raise HTTPException(status_code=404, detail="No compiled CV available")
 
-    filename = cv.pdf_path.split("/")[-1]
-    pdf_path = PDF_OUTPUT_PATH / filename
-
-    if not pdf_path.exists():
+    pdf_path = resolve_pdf_path(cv.pdf_path)
+    if not pdf_path.is_file():
         raise HTTPException(status_code=404, detail="PDF file not found")
 
-    return FileResponse(
-        path=str(pdf_path),
+    return await conditional_file_response(
+        request,
+        pdf_path,
         media_type="application/pdf",
         filename=f"{cv.name.replace(' ', '_')}_CV.pdf"
     )
@@ -195,13 +316,39 @@ async def list_templates():
             id=t.id,
             name=t.name,
             description=t.description,
-            preview_image=t.preview_image,
+            preview_image=template_preview_url(t) if t.preview_image else None,
             category=t.category
         )
         for t in templates
     ]
 
 
+@router.get("/templates/{template_id}/preview.png")
+async def get_template_preview_image(template_id: str, request: Request, v: Optional[str] = None):
+    """Get a template's first page as a PNG thumbnail."""
+    template = await get_template_by_id(template_id)
+    if not template:
+        raise HTTPException(status_code=404, detail="Template not found")
+
+    version, preview_path, pending = await get_template_preview(template)
+    if preview_path is None:
+        if pending:
+            raise HTTPException(
+                status_code=503,
+                detail="Preview is being rendered",
+                headers={"Retry-After": "5"}
+            )
+        raise HTTPException(status_code=404, detail="Preview not available")
+
+    # Versioned URLs never change content, so browsers can keep them forever
+    return await conditional_file_response(
+        request,
+        preview_path,
+        media_type="image/png",
+        immutable=v == version
+    )
+
+
 @router.get("/templates/{template_id}")
 async def get_template(template_id: str):
     """Get a specific template with its LaTeX source."""
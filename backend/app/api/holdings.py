@@ -3,6 +3,8 @@ from datetime import datetime
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query
 
+from app.core.state_store import state_store
+
 from app.schemas.holdings import (
     StockHolding, StockHoldingCreate, StockHoldingUpdate,
     RealEstateProperty, RealEstatePropertyCreate, RealEstatePropertyUpdate,
@@ -62,6 +64,32 @@ _zakat_data = {
 }
 
 
+
+def _dump_state() -> dict:
+    return {
+        "stocks": _stocks,
+        "real_estate": _real_estate,
+        "business_interests": _business_interests,
+        "income_sources": _income_sources,
+        "balance_sheet": _balance_sheet,
+        "zakat_data": _zakat_data,
+    }
+
+
+def _load_state(data: dict):
+    global _stocks, _real_estate, _business_interests, _income_sources, _balance_sheet, _zakat_data
+    _stocks = data["stocks"]
+    _real_estate = data["real_estate"]
+    _business_interests = data["business_interests"]
+    _income_sources = data["income_sources"]
+    _balance_sheet = data["balance_sheet"]
+    _zakat_data = data["zakat_data"]
+
+
+# Shared across workers when a shared state backend is configured
+_state = state_store.register("holdings", _dump_state, _load_state)
+
+
 def _compute_stock(stock: dict) -> dict:
     """Compute stock values."""
     value = stock["shares"] * stock["current_price"]
@@ -100,12 +128,14 @@ def _compute_business(biz: dict) -> dict:
 
 # Stock endpoints
 @router.get("/stocks", response_model=List[StockHolding])
+@_state.reader
 async def get_stocks():
     """Get all stock holdings."""
     return [_compute_stock(s) for s in _stocks]
 
 
 @router.post("/stocks", response_model=StockHolding)
+@_state.writer
 async def create_stock(stock: StockHoldingCreate):
     """Create a new stock holding."""
     new_id = max([s["id"] for s in _stocks], default=0) + 1
@@ -115,6 +145,7 @@ async def create_stock(stock: StockHoldingCreate):
 
 
 @router.put("/stocks/{stock_id}", response_model=StockHolding)
+@_state.writer
 async def update_stock(stock_id: int, stock: StockHoldingUpdate):
     """Update a stock holding."""
     for i, s in enumerate(_stocks):
@@ -126,6 +157,7 @@ async def update_stock(stock_id: int, stock: StockHoldingUpdate):
 
 
 @router.delete("/stocks/{stock_id}")
+@_state.writer
 async def delete_stock(stock_id: int):
     """Delete a stock holding."""
     global _stocks
@@ -135,12 +167,14 @@ async def delete_stock(stock_id: int):
 
 # Real Estate endpoints
 @router.get("/real-estate", response_model=List[RealEstateProperty])
+@_state.reader
 async def get_real_estate():
     """Get all real estate properties."""
     return [_compute_property(p) for p in _real_estate]
 
 
 @router.post("/real-estate", response_model=RealEstateProperty)
+@_state.writer
 async def create_property(prop: RealEstatePropertyCreate):
     """Create a new property."""
     new_id = max([p["id"] for p in _real_estate], default=0) + 1
@@ -150,6 +184,7 @@ async def create_property(prop: RealEstatePropertyCreate):
 
 
 @router.put("/real-estate/{property_id}", response_model=RealEstateProperty)
+@_state.writer
 async def update_property(property_id: int, prop: RealEstatePropertyUpdate):
     """Update a property."""
     for i, p in enumerate(_real_estate):
@@ -161,6 +196,7 @@ async def update_property(property_id: int, prop: RealEstatePropertyUpdate):
 
 
 @router.delete("/real-estate/{property_id}")
+@_state.writer
 async def delete_property(property_id: int):
     """Delete a property."""
     global _real_estate
@@ -170,12 +206,14 @@ async def delete_property(property_id: int):
 
 # Business Interest endpoints
 @router.get("/business", response_model=List[BusinessInterest])
+@_state.reader
 async def get_business_interests():
     """Get all business interests."""
     return [_compute_business(b) for b in _business_interests]
 
 
 @router.post("/business", response_model=BusinessInterest)
+@_state.writer
 async def create_business(biz: BusinessInterestCreate):
     """Create a new business interest."""
     new_id = max([b["id"] for b in _business_interests], default=0) + 1
@@ -185,6 +223,7 @@ async def create_business(biz: BusinessInterestCreate):
 
 
 @router.put("/business/{business_id}", response_model=BusinessInterest)
+@_state.writer
 async def update_business(business_id: int, biz: BusinessInterestUpdate):
     """Update a business interest."""
     for i, b in enumerate(_business_interests):
@@ -196,6 +235,7 @@ async def update_business(business_id: int, biz: BusinessInterestUpdate):
 
 
 @router.delete("/business/{business_id}")
+@_state.writer
 async def delete_business(business_id: int):
     """Delete a business interest."""
     global _business_interests
@@ -205,12 +245,14 @@ async def delete_business(business_id: int):
 
 # Income Source endpoints
 @router.get("/income-sources", response_model=List[IncomeSource])
+@_state.reader
 async def get_income_sources():
     """Get all income sources."""
     return _income_sources
 
 
 @router.post("/income-sources", response_model=IncomeSource)
+@_state.writer
 async def create_income_source(source: IncomeSourceCreate):
     """Create a new income source."""
     new_id = max([s["id"] for s in _income_sources], default=0) + 1
@@ -221,12 +263,14 @@ async def create_income_source(source: IncomeSourceCreate):
 
 # Balance Sheet and Summary endpoints
 @router.get("/balance-sheet", response_model=BalanceSheetSummary)
+@_state.reader
 async def get_balance_sheet():
     """Get balance sheet summary."""
     return _balance_sheet
 
 
 @router.put("/balance-sheet", response_model=BalanceSheetSummary)
+@_state.writer
 async def update_balance_sheet(data: BalanceSheetSummary):
     """Update balance sheet."""
     global _balance_sheet
@@ -235,12 +279,14 @@ async def update_balance_sheet(data: BalanceSheetSummary):
 
 
 @router.get("/zakat", response_model=ZakatData)
+@_state.reader
 async def get_zakat():
     """Get zakat calculation data."""
     return _zakat_data
 
 
 @router.put("/zakat", response_model=ZakatData)
+@_state.writer
 async def update_zakat(data: ZakatData):
     """Update zakat data."""
     global _zakat_data
@@ -249,6 +295,7 @@ async def update_zakat(data: ZakatData):
 
 
 @router.get("/summary", response_model=HoldingsSummary)
+@_state.reader
 async def get_holdings_summary():
     """Get complete holdings summary."""
     stocks = [_compute_stock(s) for s in _stocks]
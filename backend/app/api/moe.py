@@ -3,6 +3,8 @@ from datetime import datetime
 from typing import List
 from fastapi import APIRouter, HTTPException
 
+from app.core.state_store import state_store
+
 from app.schemas.moe import (
     Persona, PersonaCreate, PersonaUpdate,
     Principle, PrincipleCreate, PrincipleUpdate,
@@ -154,6 +156,32 @@ _super_objective = "MoE - Allah SWT's Satisfaction"
 _target_date = "March 31st, 2026"
 
 
+
+def _dump_state() -> dict:
+    return {
+        "personas": _personas,
+        "principles": _principles,
+        "schedule_blocks": _schedule_blocks,
+        "lifestyle_guidelines": _lifestyle_guidelines,
+        "non_negotiables": _non_negotiables,
+        "dua_for_success": _dua_for_success,
+    }
+
+
+def _load_state(data: dict):
+    global _personas, _principles, _schedule_blocks, _lifestyle_guidelines, _non_negotiables, _dua_for_success
+    _personas = data["personas"]
+    _principles = data["principles"]
+    _schedule_blocks = data["schedule_blocks"]
+    _lifestyle_guidelines = data["lifestyle_guidelines"]
+    _non_negotiables = data["non_negotiables"]
+    _dua_for_success = data["dua_for_success"]
+
+
+# Shared across workers when a shared state backend is configured
+_state = state_store.register("moe", _dump_state, _load_state)
+
+
 def _add_timestamps(obj: dict) -> dict:
     """Add timestamps to object."""
     return {
@@ -165,12 +193,14 @@ def _add_timestamps(obj: dict) -> dict:
 
 # Persona endpoints
 @router.get("/personas", response_model=List[Persona])
+@_state.reader
 async def get_personas():
     """Get all personas."""
     return [_add_timestamps(p) for p in _personas]
 
 
 @router.post("/personas", response_model=Persona)
+@_state.writer
 async def create_persona(persona: PersonaCreate):
     """Create a new persona."""
     new_id = max([p["id"] for p in _personas], default=0) + 1
@@ -180,6 +210,7 @@ async def create_persona(persona: PersonaCreate):
 
 
 @router.put("/personas/{persona_id}", response_model=Persona)
+@_state.writer
 async def update_persona(persona_id: int, persona: PersonaUpdate):
     """Update a persona."""
     for i, p in enumerate(_personas):
@@ -191,6 +222,7 @@ async def update_persona(persona_id: int, persona: PersonaUpdate):
 
 
 @router.delete("/personas/{persona_id}")
+@_state.writer
 async def delete_persona(persona_id: int):
     """Delete a persona."""
     global _personas
@@ -200,6 +232,7 @@ async def delete_persona(persona_id: int):
 
 # Milestones
 @router.post("/personas/{persona_id}/milestones", response_model=MilestoneResponse)
+@_state.writer
 async def add_milestone(persona_id: int, milestone: MilestoneCreate):
     """Add a milestone to a persona."""
     for p in _personas:
@@ -213,12 +246,14 @@ async def add_milestone(persona_id: int, milestone: MilestoneCreate):
 
 # Principle endpoints
 @router.get("/principles", response_model=List[Principle])
+@_state.reader
 async def get_principles():
     """Get all principles."""
     return [_add_timestamps(p) for p in _principles]
 
 
 @router.post("/principles", response_model=Principle)
+@_state.writer
 async def create_principle(principle: PrincipleCreate):
     """Create a new principle."""
     new_id = max([p["id"] for p in _principles], default=0) + 1
@@ -228,6 +263,7 @@ async def create_principle(principle: PrincipleCreate):
 
 
 @router.put("/principles/{principle_id}", response_model=Principle)
+@_state.writer
 async def update_principle(principle_id: int, principle: PrincipleUpdate):
     """Update a principle."""
     for i, p in enumerate(_principles):
@@ -239,6 +275,7 @@ async def update_principle(principle_id: int, principle: PrincipleUpdate):
 
 
 @router.delete("/principles/{principle_id}")
+@_state.writer
 async def delete_principle(principle_id: int):
     """Delete a principle."""
     global _principles
@@ -248,12 +285,14 @@ async def delete_principle(principle_id: int):
 
 # Schedule endpoints
 @router.get("/schedule/blocks", response_model=List[ScheduleBlock])
+@_state.reader
 async def get_schedule_blocks():
     """Get all schedule blocks."""
     return _schedule_blocks
 
 
 @router.post("/schedule/blocks", response_model=ScheduleBlock)
+@_state.writer
 async def create_schedule_block(block: ScheduleBlockCreate):
     """Create a new schedule block."""
     new_id = max([b["id"] for b in _schedule_blocks], default=0) + 1
@@ -263,6 +302,7 @@ async def create_schedule_block(block: ScheduleBlockCreate):
 
 
 @router.get("/schedule/table", response_model=ScheduleTable)
+@_state.reader
 async def get_schedule_table():
     """Get the schedule table."""
     return _schedule_table
@@ -270,12 +310,14 @@ async def get_schedule_table():
 
 # Lifestyle endpoints
 @router.get("/lifestyle/guidelines", response_model=List[LifestyleGuideline])
+@_state.reader
 async def get_lifestyle_guidelines():
     """Get all lifestyle guidelines."""
     return _lifestyle_guidelines
 
 
 @router.post("/lifestyle/guidelines", response_model=LifestyleGuideline)
+@_state.writer
 async def create_lifestyle_guideline(guideline: LifestyleGuidelineCreate):
     """Create a new lifestyle guideline."""
     new_id = max([g["id"] for g in _lifestyle_guidelines], default=0) + 1
@@ -285,12 +327,14 @@ async def create_lifestyle_guideline(guideline: LifestyleGuidelineCreate):
 
 
 @router.get("/lifestyle/non-negotiables", response_model=List[str])
+@_state.reader
 async def get_non_negotiables():
     """Get all non-negotiables."""
     return _non_negotiables
 
 
 @router.put("/lifestyle/non-negotiables", response_model=List[str])
+@_state.writer
 async def update_non_negotiables(items: List[str]):
     """Update non-negotiables."""
     global _non_negotiables
@@ -299,12 +343,14 @@ async def update_non_negotiables(items: List[str]):
 
 
 @router.get("/lifestyle/dua", response_model=str)
+@_state.reader
 async def get_dua():
     """Get du'a for success."""
     return _dua_for_success
 
 
 @router.put("/lifestyle/dua", response_model=str)
+@_state.writer
 async def update_dua(dua: str):
     """Update du'a for success."""
     global _dua_for_success
@@ -314,6 +360,7 @@ async def update_dua(dua: str):
 
 # Summary endpoint
 @router.get("/summary", response_model=MoESummary)
+@_state.reader
 async def get_moe_summary():
     """Get complete MoE summary."""
     return MoESummary(
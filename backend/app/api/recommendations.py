@@ -2,8 +2,9 @@ from fastapi import APIRouter, HTTPException, Query
 from typing import List, Optional
 from app.models.portfolio import LinkedInRecommendation
 from datetime import datetime
+from app.core.response_cache import cached_route
 
-router = APIRouter()
+router = APIRouter(route_class=cached_route("recommendations"))
 
 # LinkedIn recommendations data based on the profile
 recommendations_data = [
@@ -7,8 +7,9 @@ from app.models.resume import (
 from app.schemas.resume import ResumeResponse
 from app.services.resume import ResumeService
 from app.core.dependencies import get_resume_service
+from app.core.response_cache import cached_route
 
-router = APIRouter()
+router = APIRouter(route_class=cached_route("resume"))
 
 
 @router.get("/resume", response_model=ResumeResponse)
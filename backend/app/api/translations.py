@@ -2,9 +2,16 @@
 Translation API endpoints
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from typing import Dict, List, Optional
+import csv
+import io
+import json
 
+from fastapi import APIRouter, HTTPException, Query, Request
+from typing import Any, Dict, List, Literal, Optional
+
+from app.core.config import settings
+
+from app.core.response_cache import cached_route
 from app.services.translations import translation_service
 from app.models.translations import (
     Language, TranslationsResponse, LanguagesResponse,
@@ -13,7 +20,10 @@ from app.models.translations import (
     TranslatedExperience
 )
 
-router = APIRouter(prefix="/translations", tags=["translations"])
+router = APIRouter(prefix="/translations", tags=["translations"], route_class=cached_route("translations"))
+# Served from the in-memory catalog, which reloads on its own; caching on
+# top would only hold edits back
+catalog_router = APIRouter(prefix="/translations", tags=["translations"])
 
 @router.get("/languages")
 async def get_languages():
@@ -24,7 +34,7 @@ async def get_languages():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching languages: {str(e)}")
 
-@router.get("/ui/{language_code}")
+@catalog_router.get("/ui/{language_code}")
 async def get_ui_translations(language_code: str = "en"):
     """Get UI translations for a specific language"""
     try:
@@ -117,6 +127,24 @@ async def get_experiences_with_translations(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching experiences: {str(e)}")
 
+@router.get("/bundle")
+async def get_page_bundle(
+    lang: str = Query("en", description="Language code for translations"),
+    featured: bool = Query(False, description="Get only featured projects")
+):
+    """Get all homepage sections with translations in one response"""
+    try:
+        bundle = await translation_service.get_page_bundle(lang, featured)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching page bundle: {str(e)}")
+    if bundle is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Translated content is temporarily unavailable",
+            headers={"Retry-After": "5"}
+        )
+    return bundle
+
 @router.get("/completeness")
 async def get_translation_completeness():
     """Get translation completeness statistics"""
@@ -159,6 +187,58 @@ async def add_or_update_ui_translation(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error updating UI translation: {str(e)}")
 
+def _body_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"Import bodies are limited to {settings.translation_import_max_bytes} bytes"
+    )
+
+async def _read_import_body(request: Request) -> bytes:
+    """The request body, refused as soon as it passes the import size limit"""
+    limit = settings.translation_import_max_bytes
+    declared = request.headers.get("content-length")
+    if declared is not None:
+        try:
+            if int(declared) > limit:
+                raise _body_too_large()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid Content-Length header")
+    # Chunked bodies have no length up front; count while streaming
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > limit:
+            raise _body_too_large()
+    return bytes(body)
+
+async def _read_import_rows(request: Request) -> List[Any]:
+    """Rows of a JSON array body, or of a CSV body with a header line"""
+    body = await _read_import_body(request)
+    try:
+        if "csv" in request.headers.get("content-type", ""):
+            rows = list(csv.DictReader(io.StringIO(body.decode("utf-8-sig"))))
+        else:
+            rows = json.loads(body)
+    except (ValueError, csv.Error) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid import body: {str(e)}")
+    if not isinstance(rows, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array of rows")
+    if len(rows) > settings.translation_import_max_rows:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.translation_import_max_rows} rows per import"
+        )
+    return rows
+
+@router.post("/import/{kind}")
+async def import_translations(kind: Literal["content", "ui"], request: Request):
+    """Bulk add or update content or UI translations from JSON or CSV (Admin only)"""
+    rows = await _read_import_rows(request)
+    try:
+        return await translation_service.import_translations(kind, rows)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error importing translations: {str(e)}")
+
 @router.delete("/content/{table_name}/{record_id}/{field_name}")
 async def delete_content_translation(
     table_name: str,
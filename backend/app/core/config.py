@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, List, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -13,6 +13,75 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
     frontend_url: str = "alamin.rocks"
     admin_url: str = "admin.alamin.rocks"
+    file_io_workers: int = 4
+
+    # Logging
+    log_level: str = "INFO"
+    access_log_sample_rate: float = 1.0  # share of 2xx responses written to the access log
+    access_log_slow_seconds: float = 1.0  # slower requests are always logged
+
+    # asyncpg pool for raw-SQL services
+    db_pool_min_size: int = 2
+    db_pool_max_size: int = 10
+    db_statement_cache_size: int = 256
+    db_command_timeout: float = 10.0
+    db_connect_timeout: float = 5.0
+    db_health_check_interval: int = 30
+    db_reconnect_max_delay: int = 60
+
+    # SQLAlchemy engine for ORM sessions
+    db_engine_pool_size: int = 5
+    db_engine_max_overflow: int = 10
+    db_engine_pool_timeout: float = 10.0
+    db_engine_pool_recycle: int = 1800  # seconds; -1 keeps connections forever
+    db_engine_pool_pre_ping: bool = True
+    db_engine_warm_connections: int = 2  # opened at startup, before the first request
+
+    # Where in-memory stores keep shared state: "memory" (per process) or
+    # "redis" (redis_url, consistent across workers)
+    state_backend: str = "memory"
+    state_poll_seconds: float = 5.0
+    state_lock_timeout: float = 10.0  # how long a write waits for another worker's
+    state_lock_ttl: float = 30.0  # lifetime of a held lock, extended while the write runs
+
+    # How often the admin analytics overview is recomputed in the background
+    analytics_refresh_seconds: int = 60
+
+    # Translated content falls back through these languages, then default_language,
+    # e.g. TRANSLATION_FALLBACKS='{"pt-BR": ["pt"], "bn": ["en"]}'
+    default_language: str = "en"
+    translation_fallbacks: Dict[str, List[str]] = {}
+    translation_catalog_poll_seconds: float = 5.0  # how soon other workers' UI string edits show up
+    # Each poll re-reads this far behind the newest updated_at seen, for rows
+    # that commit late or were stamped by a host with a slower clock
+    translation_catalog_overlap_seconds: float = 60.0
+    translation_import_max_rows: int = 50000
+    translation_import_max_bytes: int = 16 * 1024 * 1024  # request body, before parsing
+    translation_reconcile_seconds: int = 3600  # recount completeness stats from scratch
+
+    # Cache for read-mostly public GET endpoints
+    response_cache_enabled: bool = True
+    response_cache_ttl_seconds: int = 300
+    response_cache_max_entries: int = 1024
+    # Share entries across workers via redis_url; write invalidations reach
+    # every worker through redis_url either way
+    response_cache_redis: bool = False
+
+    # CV compile engine
+    cv_compile_workers: int = 2
+    cv_compile_queue_size: int = 32
+    cv_compile_timeout: int = 60
+    cv_compile_engine: str = "pdflatex"  # "pdflatex" or "latexmk"
+    cv_compile_max_passes: int = 3
+    cv_incremental_builds: bool = False
+    cv_warm_format: bool = False  # precompiled .fmt for template preambles
+    cv_preview_dpi: int = 60
+    cv_cache_max_bytes: int = 256 * 1024 * 1024
+    cv_cache_max_age_days: int = 30
+    cv_storage_quota_bytes: int = 1024 * 1024 * 1024
+    cv_retention_per_document: int = 5
+    cv_janitor_interval_seconds: int = 3600
+    cv_orphan_grace_hours: int = 24
 
     class Config:
         env_file = ".env"
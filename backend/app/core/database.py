@@ -0,0 +1,129 @@
+"""
+SQLAlchemy async engine and sessions.
+
+The engine's pool is sized and recycled from settings and warmed at
+startup, so the first requests after a deploy don't pay for connection
+setup. Sessions for read-only requests run on autocommit connections and
+skip the BEGIN/ROLLBACK round trips of an implicit transaction.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+
+class Database:
+    """Async engine with a tuned, warmed pool and read/write session factories."""
+
+    def __init__(
+        self,
+        url: str,
+        pool_size: int,
+        max_overflow: int,
+        pool_timeout: float,
+        pool_recycle: int,
+        pool_pre_ping: bool,
+        warm_connections: int
+    ):
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.warm_connections = min(warm_connections, pool_size)
+        # No connection is made until first use or warm-up
+        self.engine = create_async_engine(
+            url,
+            echo=settings.debug,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            connect_args={
+                "timeout": settings.db_connect_timeout,
+                "command_timeout": settings.db_command_timeout,
+            }
+        )
+        # Shares the pool; asyncpg's autocommit is a client-side flag, so
+        # switching a connection to it costs no round trip
+        self.read_engine = self.engine.execution_options(isolation_level="AUTOCOMMIT")
+        self.sessions = async_sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
+        self.read_sessions = async_sessionmaker(self.read_engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def start(self):
+        """Open ``warm_connections`` connections; an unreachable database is not fatal."""
+        if self.warm_connections <= 0:
+            return
+        results = await asyncio.gather(
+            *(self.engine.connect() for _ in range(self.warm_connections)),
+            return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        for result in results:
+            if not isinstance(result, BaseException):
+                # Back to the pool, still connected
+                await result.close()
+        if errors:
+            logger.warning(
+                f"Warmed {len(results) - len(errors)}/{len(results)} database connections: {errors[0]}"
+            )
+        else:
+            logger.info(f"Warmed {len(results)} database connections")
+
+    async def stop(self):
+        await self.engine.dispose()
+
+    @asynccontextmanager
+    async def session(self, read_only: bool = False) -> AsyncIterator[AsyncSession]:
+        factory = self.read_sessions if read_only else self.sessions
+        async with factory() as session:
+            yield session
+
+    def stats(self) -> Dict[str, Any]:
+        pool = self.engine.pool
+        checked_out = pool.checkedout()
+        capacity = self.pool_size + self.max_overflow
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": checked_out,
+            "overflow": max(pool.overflow(), 0),
+            "capacity": capacity,
+            "utilization": checked_out / capacity if capacity else 0.0,
+        }
+
+
+database = Database(
+    settings.database_url.replace("postgresql://", "postgresql+asyncpg://"),
+    pool_size=settings.db_engine_pool_size,
+    max_overflow=settings.db_engine_max_overflow,
+    pool_timeout=settings.db_engine_pool_timeout,
+    pool_recycle=settings.db_engine_pool_recycle,
+    pool_pre_ping=settings.db_engine_pool_pre_ping,
+    warm_connections=settings.db_engine_warm_connections
+)
+
+
+def _connection_states() -> Dict[tuple, int]:
+    stats = database.stats()
+    return {("idle",): stats["checked_in"], ("busy",): stats["checked_out"]}
+
+
+registry.callback(
+    "db_engine_connections", "Connections in the SQLAlchemy pool by state",
+    _connection_states, ["state"]
+)
+registry.callback(
+    "db_engine_overflow_connections", "Connections open beyond the SQLAlchemy pool size",
+    lambda: database.stats()["overflow"]
+)
+registry.callback(
+    "db_engine_pool_utilization", "Checked-out share of the SQLAlchemy pool's capacity",
+    lambda: database.stats()["utilization"]
+)
@@ -0,0 +1,183 @@
+"""
+Shared asyncpg connection pool.
+
+The pool is created at startup and closed at shutdown. Services that run
+raw SQL ask it for the pool and fall back to their defaults when the
+database is unreachable. A background task checks the pool's health and
+reconnects with exponential backoff, so a database outage is never
+latched for the life of the process.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Dict, Optional
+
+import asyncpg
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+HEALTH_CHECK_TIMEOUT = 5.0
+RECONNECT_BASE_DELAY = 1.0
+
+
+class DatabasePool:
+    """asyncpg pool with health checks and reconnect backoff."""
+
+    def __init__(
+        self,
+        dsn: str,
+        min_size: int,
+        max_size: int,
+        statement_cache_size: int,
+        command_timeout: float,
+        connect_timeout: float,
+        health_check_interval: int,
+        reconnect_max_delay: int
+    ):
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max(min_size, max_size)
+        self.statement_cache_size = statement_cache_size
+        self.command_timeout = command_timeout
+        self.connect_timeout = connect_timeout
+        self.health_check_interval = health_check_interval
+        self.reconnect_max_delay = reconnect_max_delay
+        self._pool: Optional[asyncpg.Pool] = None
+        self._failures = 0
+        self._next_attempt = 0.0
+        self._connect_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def available(self) -> bool:
+        return self._pool is not None
+
+    async def start(self):
+        """Connect and start health checks; an unreachable database is not fatal."""
+        await self._connect()
+        if self._task is None:
+            self._task = asyncio.create_task(self._monitor(), name="db-pool-monitor")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._pool:
+            pool, self._pool = self._pool, None
+            try:
+                await asyncio.wait_for(pool.close(), timeout=HEALTH_CHECK_TIMEOUT)
+            except (asyncio.TimeoutError, Exception):
+                pool.terminate()
+
+    async def get(self) -> Optional[asyncpg.Pool]:
+        """Get the pool, or None while the database is unavailable.
+
+        When the pool is down, a reconnect is attempted at most once per
+        backoff interval; other callers get None instead of waiting.
+        """
+        if self._pool:
+            return self._pool
+        if time.monotonic() < self._next_attempt or self._connect_lock.locked():
+            return None
+        await self._connect()
+        return self._pool
+
+    async def _connect(self):
+        async with self._connect_lock:
+            if self._pool:
+                return
+            try:
+                self._pool = await asyncpg.create_pool(
+                    self.dsn,
+                    min_size=self.min_size,
+                    max_size=self.max_size,
+                    statement_cache_size=self.statement_cache_size,
+                    command_timeout=self.command_timeout,
+                    timeout=self.connect_timeout
+                )
+            except Exception as e:
+                self._failures += 1
+                delay = min(self.reconnect_max_delay, RECONNECT_BASE_DELAY * 2 ** (self._failures - 1))
+                # Jitter so several workers don't reconnect in lockstep
+                delay *= random.uniform(0.8, 1.2)
+                self._next_attempt = time.monotonic() + delay
+                logger.warning(f"Database unavailable, retrying in {delay:.1f}s: {e}")
+                return
+            if self._failures:
+                logger.info(f"Database connection restored after {self._failures} failed attempts")
+            self._failures = 0
+            self._next_attempt = 0.0
+
+    async def _monitor(self):
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            try:
+                await self._check()
+            except Exception as e:
+                logger.error(f"Database pool health check failed: {e}", exc_info=True)
+
+    async def _check(self):
+        pool = self._pool
+        if pool is None:
+            if time.monotonic() >= self._next_attempt:
+                await self._connect()
+            return
+        try:
+            await asyncio.wait_for(pool.fetchval("SELECT 1"), timeout=HEALTH_CHECK_TIMEOUT)
+        except Exception as e:
+            logger.warning(f"Database health check failed, reconnecting: {e}")
+            self._pool = None
+            pool.terminate()
+            await self._connect()
+
+    def stats(self) -> Dict[str, Any]:
+        pool = self._pool
+        return {
+            "available": pool is not None,
+            "size": pool.get_size() if pool else 0,
+            "idle": pool.get_idle_size() if pool else 0,
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "failed_attempts": self._failures,
+        }
+
+
+db_pool = DatabasePool(
+    settings.database_url,
+    min_size=settings.db_pool_min_size,
+    max_size=settings.db_pool_max_size,
+    statement_cache_size=settings.db_statement_cache_size,
+    command_timeout=settings.db_command_timeout,
+    connect_timeout=settings.db_connect_timeout,
+    health_check_interval=settings.db_health_check_interval,
+    reconnect_max_delay=settings.db_reconnect_max_delay
+)
+
+
+def _connection_states() -> Dict[tuple, int]:
+    stats = db_pool.stats()
+    return {("idle",): stats["idle"], ("busy",): stats["size"] - stats["idle"]}
+
+
+registry.callback(
+    "db_pool_connections", "Connections in the asyncpg pool by state",
+    _connection_states, ["state"]
+)
+registry.callback(
+    "db_pool_max_connections", "Upper bound on the asyncpg pool size",
+    lambda: db_pool.max_size
+)
+registry.callback(
+    "db_pool_available", "Whether the database is currently reachable (1) or in backoff (0)",
+    lambda: 1 if db_pool.available else 0
+)
+registry.callback(
+    "db_pool_failed_connects", "Consecutive failed connection attempts",
+    lambda: db_pool.stats()["failed_attempts"]
+)
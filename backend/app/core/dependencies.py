@@ -1,18 +1,19 @@
 from functools import lru_cache
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
+from app.core.database import database
 from app.services.contact import ContactService
 from app.services.portfolio import PortfolioService
 from app.services.resume import ResumeService
 
-# Database setup
-DATABASE_URL = settings.database_url.replace("postgresql://", "postgresql+asyncpg://")
-engine = create_async_engine(DATABASE_URL, echo=settings.debug)
-AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+# Database setup; the engine is created and managed in app.core.database
+engine = database.engine
+AsyncSessionLocal = database.sessions
+
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
 @lru_cache()
 def get_contact_service() -> ContactService:
@@ -30,10 +31,11 @@ def get_resume_service() -> ResumeService:
     return ResumeService()
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session"""
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
\ No newline at end of file
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Get database session
+
+    Read-only requests get an autocommit session, so their queries don't
+    open a transaction.
+    """
+    async with database.session(read_only=request.method in READ_ONLY_METHODS) as session:
+        yield session
@@ -1,16 +1,43 @@
+import atexit
+import json
 import logging
 import logging.config
+import logging.handlers
+import queue
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 from pydantic import BaseModel
 
+from app.core.config import settings
+
+_listeners: List[logging.handlers.QueueListener] = []
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line, with any ``extra={"fields": ...}`` merged in"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
 class LogConfig(BaseModel):
     """Logging configuration"""
     LOGGER_NAME: str = "app"
+    ACCESS_LOGGER_NAME: str = "app.access"
     LOG_FORMAT: str = "%(levelname)s - %(message)s | %(pathname)s:%(lineno)d"
-    LOG_LEVEL: str = "DEBUG"
-    
+    LOG_LEVEL: str = settings.log_level.upper()
+
     # Logging config
     version: int = 1
     disable_existing_loggers: bool = False
@@ -19,6 +46,9 @@ class LogConfig(BaseModel):
             "format": LOG_FORMAT,
             "datefmt": "%Y-%m-%d %H:%M:%S",
         },
+        "json": {
+            "()": JSONFormatter,
+        },
     }
     handlers: Dict[str, Any] = {
         "default": {
@@ -26,23 +56,61 @@ class LogConfig(BaseModel):
             "class": "logging.StreamHandler",
             "stream": "ext://sys.stderr",
         },
+        "access": {
+            "formatter": "json",
+            "class": "logging.StreamHandler",
+            "stream": "ext://sys.stdout",
+        },
     }
     loggers: Dict[str, Any] = {
         LOGGER_NAME: {"handlers": ["default"], "level": LOG_LEVEL},
+        ACCESS_LOGGER_NAME: {"handlers": ["access"], "level": "INFO", "propagate": False},
     }
 
+
+def _stop_listeners():
+    while _listeners:
+        _listeners.pop().stop()
+
+
+def _queue_handlers(logger: logging.Logger):
+    """Move a logger's handlers behind a queue drained by a background thread.
+
+    Records are formatted when enqueued, so %-style arguments are still only
+    rendered for enabled levels, but stream writes happen off the caller's
+    thread and never block the event loop.
+    """
+    handlers = logger.handlers[:]
+    if not handlers:
+        return
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    _listeners.append(listener)
+
+
 def setup_logging():
     """Configure logging for the application"""
     log_config = LogConfig()
-    
-    logging.config.dictConfig(log_config.dict())
-    
+
+    _stop_listeners()
+    logging.config.dictConfig(log_config.model_dump())
+    for name in (log_config.LOGGER_NAME, log_config.ACCESS_LOGGER_NAME):
+        _queue_handlers(logging.getLogger(name))
+
     # Set up root logger
     logger = logging.getLogger()
     logger.setLevel(log_config.LOG_LEVEL)
-    
+
     # Suppress some noisy loggers
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("watchfiles").setLevel(logging.WARNING)
-    
-    return logger
\ No newline at end of file
+
+    return logger
+
+
+# Flush queued records on exit
+atexit.register(_stop_listeners)
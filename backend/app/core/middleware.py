@@ -1,58 +1,188 @@
-import time
 import logging
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+import random
+import time
+from typing import Optional
+from starlette.datastructures import MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.core.metrics import registry
 from app.utils.exceptions import AppException
 
 logger = logging.getLogger(__name__)
+access_logger = logging.getLogger("app.access")
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total",
+    "Requests by route template, method and status",
+    ["route", "method", "status"]
+)
+HTTP_REQUEST_SECONDS = registry.histogram(
+    "http_request_duration_seconds",
+    "Time to serve a request, including the response body, by route template and method",
+    ["route", "method"]
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight",
+    "Requests currently being served"
+)
+
+# Requests that matched no route (404s, mounted static files) share one
+# label so raw URLs never become series
+UNMATCHED_ROUTE = "unmatched"
+# Likewise for methods: the verb is client-supplied, so anything outside the
+# standard set is labelled "other"
+OTHER_METHOD = "other"
+_METHOD_LABELS = {method: method for method in ("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")}
+# Status label strings, built once rather than per request
+_STATUS_LABELS = {code: str(code) for code in range(100, 600)}
+
+# Both middlewares are plain ASGI rather than BaseHTTPMiddleware: that one
+# runs every request in a task group and re-streams the response body
+# through a memory channel, which costs time and breaks streaming.
+
+
+class LoggingMiddleware:
+    """Middleware for the per-request access log
+
+    Each request produces one structured record on the ``app.access`` logger.
+    Successful (2xx) responses are sampled at ``access_log_sample_rate``
+    unless slower than ``access_log_slow_seconds``; everything else is
+    always logged.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: Optional[float] = None, slow_seconds: Optional[float] = None):
+        self.app = app
+        self.sample_rate = settings.access_log_sample_rate if sample_rate is None else sample_rate
+        self.slow_seconds = settings.access_log_slow_seconds if slow_seconds is None else slow_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+        response_bytes = 0
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code, response_bytes
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add process time header
+                MutableHeaders(scope=message)["X-Process-Time"] = str(time.perf_counter() - start_time)
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging requests and responses"""
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
-        
-        # Log request
-        logger.info(f"Request: {request.method} {request.url.path}")
-        
         try:
-            response = await call_next(request)
-            process_time = time.time() - start_time
-            
-            # Log response
-            logger.info(
-                f"Response: {request.method} {request.url.path} "
-                f"- Status: {response.status_code} - Time: {process_time:.3f}s"
-            )
-            
-            # Add process time header
-            response.headers["X-Process-Time"] = str(process_time)
-            
-            return response
-            
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            process_time = time.time() - start_time
             logger.error(
-                f"Error: {request.method} {request.url.path} "
-                f"- Error: {str(e)} - Time: {process_time:.3f}s"
+                "Error: %s %s - Error: %s - Time: %.3fs",
+                scope["method"], scope["path"], e, time.perf_counter() - start_time
             )
             raise
+        finally:
+            self._log(scope, status_code, response_bytes, time.perf_counter() - start_time)
+
+    def _log(self, scope: Scope, status_code: int, response_bytes: int, duration: float):
+        if not access_logger.isEnabledFor(logging.INFO):
+            return
+        if (
+            200 <= status_code < 300
+            and duration < self.slow_seconds
+            and self.sample_rate < 1.0
+            and random.random() >= self.sample_rate
+        ):
+            return
+        client = scope.get("client")
+        access_logger.info(
+            "%s %s %d",
+            scope["method"], scope["path"], status_code,
+            extra={"fields": {
+                "method": scope["method"],
+                "path": scope["path"],
+                "query": scope.get("query_string", b"").decode("latin-1"),
+                "status": status_code,
+                "duration_ms": round(duration * 1000, 3),
+                "bytes": response_bytes,
+                "client": client[0] if client else None,
+            }}
+        )
+
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+class MetricsMiddleware:
+    """Middleware recording request counts and latency per route template
+
+    The route template is read from the matched route after the request has
+    been routed, so ``/api/cv/abc`` is recorded as ``/api/cv/{cv_id}``.
+    Label values are existing strings, and children are created once per
+    combination, so recording is a few dict lookups and additions.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            template = getattr(route, "path_format", None) or UNMATCHED_ROUTE
+            method = _METHOD_LABELS.get(scope["method"], OTHER_METHOD)
+            HTTP_REQUEST_SECONDS.labels(template, method).observe(time.perf_counter() - start_time)
+            HTTP_REQUESTS.labels(template, method, _STATUS_LABELS.get(status_code) or str(status_code)).inc()
+
+
+class ErrorHandlingMiddleware:
     """Middleware for handling exceptions"""
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except AppException:
             # Re-raise app exceptions as they already have proper format
             raise
         except Exception as e:
             # Log unexpected errors
-            logger.error(f"Unhandled exception: {str(e)}", exc_info=True)
+            logger.error("Unhandled exception: %s", e, exc_info=True)
+            if response_started:
+                # Too late to replace a response that is already on the wire
+                raise
             # Return generic error for unexpected exceptions
-            return Response(
+            response = Response(
                 content="Internal server error",
                 status_code=500
-            )
\ No newline at end of file
+            )
+            await response(scope, receive, send)
@@ -0,0 +1,319 @@
+"""
+Response cache for read-mostly public endpoints.
+
+GET responses are cached as the already-serialized JSON body, keyed by path
+and query string, in a process-local LRU with a TTL. With
+``response_cache_redis``, Redis (``settings.redis_url``) is a second tier
+shared by all workers.
+
+Entries are grouped by tag, one per router. A successful write through the
+same router (PUT/POST/PATCH/DELETE) drops every entry for its tag, locally
+and in Redis, and tells the other workers to do the same over pub/sub. The
+invalidations go out whenever ``redis_url`` is set, shared tier or not;
+without Redis, other workers serve their entries until the TTL runs out.
+
+Responses built from fallback data, because a backend such as the database
+was unavailable, are not cached: services call ``mark_degraded()`` when they
+fall back.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple, Type
+
+import redis.asyncio as aioredis
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+REDIS_PREFIX = "response-cache"
+INVALIDATION_CHANNEL = f"{REDIS_PREFIX}:invalidate"
+# How long to stop using Redis after it fails
+REDIS_RETRY_SECONDS = 30
+
+Handler = Callable[[Request], Awaitable[Response]]
+
+# One-item list per cached request, flipped by mark_degraded(); a list so
+# tasks and threads started by the endpoint (which copy the context) flip
+# the same flag
+_degraded: ContextVar[Optional[list]] = ContextVar("response_cache_degraded", default=None)
+
+
+def mark_degraded():
+    """Keep the response being built out of the cache: it holds fallback data."""
+    flag = _degraded.get()
+    if flag is not None:
+        flag[0] = True
+
+
+class ResponseCache:
+    """Two-tier (local LRU + optional Redis) cache of JSON response bodies."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: int,
+        redis_url: Optional[str] = None,
+        share_entries: bool = False
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # Invalidations always go through redis_url; entries only when shared
+        self.redis_url = redis_url
+        self.share_entries = share_entries
+        # key -> (expires_at, body)
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._tag_keys: Dict[str, Set[str]] = {}
+        # Bumped on invalidation so a miss that started before a write
+        # doesn't store what it read
+        self._generations: Dict[str, int] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._redis = None
+        self._redis_down_until = 0.0
+        self._listener: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(tag: str, request: Request) -> str:
+        # Sort the query so ?a=1&b=2 and ?b=2&a=1 share an entry
+        query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        return f"{tag}:{request.url.path}?{query}"
+
+    async def start(self):
+        """Subscribe to invalidations from other workers when Redis is enabled."""
+        if self.redis_url and self._listener is None:
+            self._listener = asyncio.create_task(self._listen(), name="response-cache-invalidations")
+
+    async def stop(self):
+        if self._listener:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+    async def serve(self, tag: str, request: Request, handler: Handler) -> Response:
+        """Serve a GET from the cache, calling the endpoint on a miss."""
+        key = self.key(tag, request)
+        body = self._get_local(key)
+        if body is not None:
+            self.hits += 1
+            return self._response(body, "HIT")
+
+        body = await self._get_redis(key)
+        if body is not None:
+            self.redis_hits += 1
+            self._set_local(tag, key, body)
+            return self._response(body, "HIT")
+
+        # Concurrent misses for the same key wait for the first one
+        pending = self._inflight.get(key)
+        if pending is not None:
+            body = await asyncio.shield(pending)
+            if body is not None:
+                self.hits += 1
+                return self._response(body, "HIT")
+            return await handler(request)
+
+        self.misses += 1
+        generation = self._generations.get(tag, 0)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        body = None
+        degraded = [False]
+        token = _degraded.set(degraded)
+        try:
+            try:
+                response = await handler(request)
+            finally:
+                _degraded.reset(token)
+            if degraded[0]:
+                # Nor should browsers or proxies keep it
+                response.headers["Cache-Control"] = "no-store"
+            elif self._cacheable(response) and self._generations.get(tag, 0) == generation:
+                body = bytes(response.body)
+                self._set_local(tag, key, body)
+                await self._set_redis(tag, key, body)
+                response.headers["X-Cache"] = "MISS"
+            return response
+        finally:
+            self._inflight.pop(key, None)
+            future.set_result(body)
+
+    async def invalidate(self, tag: str):
+        """Drop all entries for a tag, in this worker and everywhere else."""
+        self._drop_local(tag)
+        redis = self._get_redis_client()
+        if redis is None:
+            return
+        try:
+            tag_set = f"{REDIS_PREFIX}:tag:{tag}"
+            keys = await redis.smembers(tag_set) if self.share_entries else None
+            async with redis.pipeline(transaction=False) as pipe:
+                if keys:
+                    pipe.delete(*keys)
+                if self.share_entries:
+                    pipe.delete(tag_set)
+                pipe.publish(INVALIDATION_CHANNEL, tag)
+                await pipe.execute()
+        except Exception as e:
+            self._redis_failed(e)
+
+    def _cacheable(self, response: Response) -> bool:
+        return (
+            response.status_code == 200
+            and response.media_type == "application/json"
+            and hasattr(response, "body")
+        )
+
+    @staticmethod
+    def _response(body: bytes, status: str) -> Response:
+        return Response(content=body, media_type="application/json", headers={"X-Cache": status})
+
+    def _get_local(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, body = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return body
+
+    def _set_local(self, tag: str, key: str, body: bytes):
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, body)
+        self._entries.move_to_end(key)
+        self._tag_keys.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._tag_keys.get(evicted.split(":", 1)[0], set()).discard(evicted)
+
+    def _drop_local(self, tag: str):
+        self._generations[tag] = self._generations.get(tag, 0) + 1
+        for key in self._tag_keys.pop(tag, set()):
+            self._entries.pop(key, None)
+
+    def _get_redis_client(self):
+        if not self.redis_url or time.monotonic() < self._redis_down_until:
+            return None
+        if self._redis is None:
+            self._redis = aioredis.from_url(self.redis_url, socket_timeout=1, socket_connect_timeout=1)
+        return self._redis
+
+    def _redis_failed(self, error: Exception):
+        logger.warning(f"Response cache Redis tier unavailable for {REDIS_RETRY_SECONDS}s: {error}")
+        self._redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+
+    async def _get_redis(self, key: str) -> Optional[bytes]:
+        redis = self._get_redis_client() if self.share_entries else None
+        if redis is None:
+            return None
+        try:
+            return await redis.get(f"{REDIS_PREFIX}:{key}")
+        except Exception as e:
+            self._redis_failed(e)
+            return None
+
+    async def _set_redis(self, tag: str, key: str, body: bytes):
+        redis = self._get_redis_client() if self.share_entries else None
+        if redis is None:
+            return
+        redis_key = f"{REDIS_PREFIX}:{key}"
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.set(redis_key, body, ex=self.ttl_seconds)
+                pipe.sadd(f"{REDIS_PREFIX}:tag:{tag}", redis_key)
+                pipe.expire(f"{REDIS_PREFIX}:tag:{tag}", self.ttl_seconds)
+                await pipe.execute()
+        except Exception as e:
+            self._redis_failed(e)
+
+    async def _listen(self):
+        while True:
+            redis = self._get_redis_client()
+            if redis is None:
+                await asyncio.sleep(REDIS_RETRY_SECONDS)
+                continue
+            try:
+                async with redis.pubsub() as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self._drop_local(message["data"].decode("utf-8"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._redis_failed(e)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.redis_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": ((self.hits + self.redis_hits) / lookups) if lookups else 0.0,
+        }
+
+
+def cached_route(tag: str) -> Type[APIRoute]:
+    """Route class that caches a router's GETs and invalidates them on its writes.
+
+    Use as ``APIRouter(route_class=cached_route("projects"))``.
+    """
+
+    class CachedRoute(APIRoute):
+        def get_route_handler(self) -> Handler:
+            handler = super().get_route_handler()
+            if not settings.response_cache_enabled:
+                return handler
+
+            if self.methods == {"GET"}:
+                async def cached_handler(request: Request) -> Response:
+                    return await response_cache.serve(tag, request, handler)
+            else:
+                async def cached_handler(request: Request) -> Response:
+                    response = await handler(request)
+                    if response.status_code < 400:
+                        await response_cache.invalidate(tag)
+                    return response
+            return cached_handler
+
+    return CachedRoute
+
+
+response_cache = ResponseCache(
+    max_entries=settings.response_cache_max_entries,
+    ttl_seconds=settings.response_cache_ttl_seconds,
+    redis_url=settings.redis_url,
+    share_entries=settings.response_cache_redis
+)
+
+registry.callback(
+    "response_cache_lookups_total", "Response cache lookups by result",
+    lambda: {
+        ("hit",): response_cache.hits,
+        ("redis_hit",): response_cache.redis_hits,
+        ("miss",): response_cache.misses,
+    },
+    ["result"], kind="counter"
+)
+registry.callback(
+    "response_cache_hit_ratio", "Share of response cache lookups served from either tier",
+    lambda: response_cache.stats()["hit_rate"]
+)
+registry.callback(
+    "response_cache_entries", "Responses held in the local cache tier",
+    lambda: response_cache.stats()["entries"]
+)
@@ -0,0 +1,316 @@
+"""
+Shared state for in-memory stores.
+
+Services that keep their data in module globals or instance attributes
+register it here as a named ``SharedState`` with a dump/load pair. With the
+default "memory" backend nothing changes: each process owns its data. With
+the "redis" backend (``settings.redis_url``) every state is also kept in
+Redis, so all workers behind ``uvicorn --workers N`` see the same data:
+
+- reads stay local; a state reloads from Redis only after another worker
+  announced a write on the invalidation channel, or when its version has
+  not been checked for ``state_poll_seconds`` (in case a message was lost)
+- writes hold a per-state Redis lock, reload if behind, apply the change,
+  store the new snapshot under the next version and announce it; a write
+  that raises publishes nothing, and one that cannot get the lock within
+  ``state_lock_timeout`` fails with a 503
+
+If Redis goes away, states keep serving and accepting writes locally and
+retry Redis after a back-off.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+import orjson
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.utils.exceptions import AppException
+
+logger = logging.getLogger(__name__)
+
+REDIS_PREFIX = "state"
+INVALIDATION_CHANNEL = f"{REDIS_PREFIX}:invalidate"
+# How long to stop using Redis after it fails
+REDIS_RETRY_SECONDS = 30
+
+Dump = Callable[[], Any]
+Load = Callable[[Any], None]
+
+
+class StateLockTimeout(AppException):
+    """Another worker held a state's lock for longer than we could wait."""
+
+    def __init__(self, name: str):
+        super().__init__(
+            status_code=503,
+            detail=f"The {name} state is busy, try again shortly",
+            headers={"Retry-After": "1"}
+        )
+
+
+class MemoryBackend:
+    """Process-local state; nothing to share."""
+
+    shared = False
+
+
+class RedisBackend:
+    """Versioned state snapshots in Redis hashes, with pub/sub invalidation."""
+
+    shared = True
+
+    def __init__(self, url: str, lock_timeout: float, lock_ttl: float):
+        self.url = url
+        self.lock_timeout = lock_timeout
+        # How long a held lock lives without being extended; writers extend it
+        # while they run, so this only bounds how long a dead worker blocks others
+        self.lock_ttl = lock_ttl
+        self._redis = None
+        self._down_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def _client(self):
+        if self._redis is None:
+            self._redis = aioredis.from_url(self.url, socket_timeout=2, socket_connect_timeout=2)
+        return self._redis
+
+    def failed(self, error: Exception):
+        logger.warning(f"Shared state Redis backend unavailable for {REDIS_RETRY_SECONDS}s: {error}")
+        self._down_until = time.monotonic() + REDIS_RETRY_SECONDS
+
+    async def version(self, name: str) -> Optional[int]:
+        value = await self._client().hget(f"{REDIS_PREFIX}:{name}", "version")
+        return int(value) if value is not None else None
+
+    async def load(self, name: str) -> Optional[Tuple[int, bytes]]:
+        version, data = await self._client().hmget(f"{REDIS_PREFIX}:{name}", "version", "data")
+        if version is None or data is None:
+            return None
+        return int(version), data
+
+    async def save(self, name: str, data: bytes) -> int:
+        key = f"{REDIS_PREFIX}:{name}"
+        async with self._client().pipeline(transaction=True) as pipe:
+            pipe.hincrby(key, "version", 1)
+            pipe.hset(key, "data", data)
+            version, _ = await pipe.execute()
+        await self._client().publish(INVALIDATION_CHANNEL, f"{name}:{version}")
+        return version
+
+    def lock(self, name: str):
+        return self._client().lock(
+            f"{REDIS_PREFIX}:{name}:lock",
+            timeout=self.lock_ttl,
+            blocking_timeout=self.lock_timeout
+        )
+
+    async def keep_locked(self, lock):
+        """Extend a held lock until cancelled."""
+        while True:
+            await asyncio.sleep(self.lock_ttl / 3)
+            try:
+                await lock.extend(self.lock_ttl, replace_ttl=True)
+            except Exception as e:
+                logger.warning(f"Could not extend a state lock: {e}")
+                return
+
+    async def listen(self, on_invalidate: Callable[[str, int], None]):
+        while True:
+            if not self.available:
+                await asyncio.sleep(REDIS_RETRY_SECONDS)
+                continue
+            try:
+                async with self._client().pubsub() as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            name, _, version = message["data"].decode("utf-8").rpartition(":")
+                            on_invalidate(name, int(version))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed(e)
+
+    async def close(self):
+        if self._redis is not None:
+            await self._redis.close()
+            self._redis = None
+
+
+class SharedState:
+    """One named piece of in-memory state, kept in step across workers."""
+
+    def __init__(self, store: "StateStore", name: str, dump: Dump, load: Load):
+        self.store = store
+        self.name = name
+        self._dump = dump
+        self._load = load
+        self.version = 0
+        self._stale = True
+        self._checked_at = 0.0
+        self._sync_lock = asyncio.Lock()
+
+    @property
+    def _backend(self):
+        backend = self.store.backend
+        return backend if backend.shared and backend.available else None
+
+    def invalidate(self, version: int):
+        if version > self.version:
+            self._stale = True
+
+    async def sync(self):
+        """Reload from the backend if another worker may have written."""
+        if self._backend is None:
+            return
+        if not self._stale and time.monotonic() - self._checked_at < self.store.poll_seconds:
+            return
+        async with self._sync_lock:
+            if self._stale or time.monotonic() - self._checked_at >= self.store.poll_seconds:
+                try:
+                    await self._refresh()
+                except Exception as e:
+                    self.store.backend.failed(e)
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[None]:
+        """Apply a change under the state's lock and publish the result.
+
+        Raises ``StateLockTimeout`` if the lock cannot be acquired. If the
+        change raises, nothing is published and the state reloads from the
+        backend on the next read.
+        """
+        backend = self._backend
+        lock = None
+        if backend is not None:
+            try:
+                lock = backend.lock(self.name)
+                acquired = await lock.acquire()
+            except Exception as e:
+                backend.failed(e)
+                backend = lock = None
+            else:
+                if not acquired:
+                    logger.warning(f"Timed out waiting for the {self.name} state lock")
+                    raise StateLockTimeout(self.name)
+        keep_locked = None
+        try:
+            if backend is not None:
+                try:
+                    await self._refresh()
+                except Exception as e:
+                    backend.failed(e)
+                    backend = None
+                else:
+                    keep_locked = asyncio.create_task(backend.keep_locked(lock))
+            try:
+                yield
+            except BaseException:
+                if backend is not None:
+                    # The change may be half applied; reload the shared copy
+                    # on the next read, whatever version it is at
+                    self.version = 0
+                    self._stale = True
+                raise
+            if backend is not None:
+                try:
+                    self.version = await backend.save(self.name, orjson.dumps(self._dump()))
+                    self._checked_at = time.monotonic()
+                except Exception as e:
+                    backend.failed(e)
+        finally:
+            if keep_locked is not None:
+                keep_locked.cancel()
+                await asyncio.gather(keep_locked, return_exceptions=True)
+            if lock is not None:
+                try:
+                    await lock.release()
+                except Exception:
+                    # Expired or unreachable locks free themselves on timeout
+                    pass
+
+    async def _refresh(self):
+        backend = self.store.backend
+        version = await backend.version(self.name)
+        if version is None:
+            # First worker to see this state seeds it with its defaults
+            self.version = await backend.save(self.name, orjson.dumps(self._dump()))
+        elif version != self.version:
+            snapshot = await backend.load(self.name)
+            if snapshot is not None:
+                self._load(orjson.loads(snapshot[1]))
+                self.version = snapshot[0]
+        self._stale = False
+        self._checked_at = time.monotonic()
+
+    def reader(self, func):
+        """Decorate an async function that reads this state."""
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            await self.sync()
+            return await func(*args, **kwargs)
+        return wrapper
+
+    def writer(self, func):
+        """Decorate an async function that modifies this state."""
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            async with self.write():
+                return await func(*args, **kwargs)
+        return wrapper
+
+
+class StateStore:
+    """Registry of shared states and their backend."""
+
+    def __init__(self, backend, poll_seconds: float):
+        self.backend = backend
+        self.poll_seconds = poll_seconds
+        self._states: Dict[str, SharedState] = {}
+        self._listener: Optional[asyncio.Task] = None
+
+    def register(self, name: str, dump: Dump, load: Load) -> SharedState:
+        """Register state under a unique name; re-registering replaces it.
+
+        ``dump`` returns the state as JSON-serializable data and ``load``
+        replaces the in-memory state with what ``dump`` produced.
+        """
+        state = self._states[name] = SharedState(self, name, dump, load)
+        return state
+
+    async def start(self):
+        if self.backend.shared and self._listener is None:
+            self._listener = asyncio.create_task(
+                self.backend.listen(self._invalidate), name="state-store-invalidations"
+            )
+
+    async def stop(self):
+        if self._listener:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self.backend.shared:
+            await self.backend.close()
+
+    def _invalidate(self, name: str, version: int):
+        state = self._states.get(name)
+        if state is not None:
+            state.invalidate(version)
+
+
+def _backend():
+    if settings.state_backend == "redis" and settings.redis_url:
+        return RedisBackend(settings.redis_url, settings.state_lock_timeout, settings.state_lock_ttl)
+    return MemoryBackend()
+
+
+state_store = StateStore(_backend(), poll_seconds=settings.state_poll_seconds)
@@ -22,9 +22,26 @@ from app.api import (
     translations,
 )
 from app.core.config import settings
+from app.core.database import database
+from app.core.db_pool import db_pool
 from app.core.logging import setup_logging
-from app.core.middleware import ErrorHandlingMiddleware, LoggingMiddleware
+from app.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from app.core.metrics import registry as metrics_registry
+from app.core.middleware import ErrorHandlingMiddleware, LoggingMiddleware, MetricsMiddleware
+from app.core.response_cache import response_cache
+from app.core.state_store import state_store
+from app.services.analytics import overview_aggregates
+from app.services.cv import (
+    compile_pool,
+    prepare_storage,
+    storage_janitor,
+    template_previews,
+    warm_formats,
+)
+from app.services.translations import translation_service
+from app.utils import async_files
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
@@ -44,6 +61,7 @@ app = FastAPI(
 # Add middleware
 app.add_middleware(ErrorHandlingMiddleware)
 app.add_middleware(LoggingMiddleware)
+app.add_middleware(MetricsMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -81,6 +99,12 @@ async def health_check():
     return {"status": "healthy", "service": settings.app_name, "version": "1.0.0"}
 
 
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics():
+    """Prometheus metrics for the whole process"""
+    return PlainTextResponse(metrics_registry.render(), media_type=METRICS_CONTENT_TYPE)
+
+
 # Include routers with API versioning
 api_v1_prefix = "/api/v1"
 
@@ -108,6 +132,9 @@ app.include_router(
 app.include_router(
     translations.router, prefix="/api", tags=["translations"]
 )
+app.include_router(
+    translations.catalog_router, prefix="/api", tags=["translations"]
+)
 app.include_router(
     analytics.router, prefix="/api/analytics", tags=["analytics"]
 )
@@ -137,7 +164,17 @@ if static_path.exists():
 @app.on_event("startup")
 async def startup_event():
     logger.info(f"{settings.app_name} starting up...")
-    # TODO: Initialize database connection
+    await database.start()
+    await db_pool.start()
+    await state_store.start()
+    await translation_service.start()
+    await response_cache.start()
+    await overview_aggregates.start()
+    await prepare_storage()
+    await compile_pool.start()
+    await storage_janitor.start()
+    if settings.cv_warm_format:
+        await warm_formats.start()
     # TODO: Run migrations
 
 
@@ -145,4 +182,14 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info(f"{settings.app_name} shutting down...")
-    # TODO: Close database connections
+    await template_previews.stop()
+    await warm_formats.stop()
+    await storage_janitor.stop()
+    await compile_pool.stop()
+    async_files.shutdown()
+    await overview_aggregates.stop()
+    await response_cache.stop()
+    await translation_service.stop()
+    await state_store.stop()
+    await db_pool.stop()
+    await database.stop()
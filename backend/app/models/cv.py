@@ -10,6 +10,14 @@ class CVStatus(str, Enum):
     ARCHIVED = "archived"
 
 
+class CompileJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
 class CVDocument(BaseModel):
     id: str
     name: str
@@ -32,9 +40,28 @@ class CVTemplate(BaseModel):
     created_at: datetime
 
 
+class TexDiagnostic(BaseModel):
+    level: str  # "error", "warning" or "badbox"
+    message: str
+    line: Optional[int] = None
+    package: Optional[str] = None
+    context: Optional[str] = None
+
+
 class CompilationResult(BaseModel):
     success: bool
     pdf_path: Optional[str] = None
     errors: List[str] = []
     warnings: List[str] = []
+    diagnostics: List[TexDiagnostic] = []
     compilation_time_ms: int = 0
+    cached: bool = False
+
+
+class CompileJob(BaseModel):
+    id: str
+    status: CompileJobStatus = CompileJobStatus.QUEUED
+    result: Optional[CompilationResult] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -294,4 +294,16 @@ class TranslationsResponse(BaseModel):
 
 class LanguagesResponse(BaseModel):
     """Response containing all available languages"""
-    languages: List[Language]
\ No newline at end of file
+    languages: List[Language]
+
+class ImportRowError(BaseModel):
+    """A rejected row of a bulk import, numbered from 1"""
+    row: int
+    error: str
+
+class TranslationImportResult(BaseModel):
+    """Outcome of a bulk translation import"""
+    kind: str
+    received: int
+    imported: int
+    errors: List[ImportRowError] = []
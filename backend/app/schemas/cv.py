@@ -2,6 +2,8 @@ from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
 
+from app.models.cv import TexDiagnostic
+
 
 class CVSourceRequest(BaseModel):
     latex_source: str
@@ -12,6 +14,9 @@ class CVCompileRequest(BaseModel):
     latex_source: str
     save: bool = False
     name: Optional[str] = None
+    cv_id: Optional[str] = None
+    draft: bool = False
+    async_mode: bool = False
 
 
 class CVCompileResponse(BaseModel):
@@ -19,7 +24,24 @@ class CVCompileResponse(BaseModel):
     pdf_url: Optional[str] = None
     errors: List[str] = []
     warnings: List[str] = []
+    diagnostics: List[TexDiagnostic] = []
+    compilation_time_ms: int = 0
+    cached: bool = False
+
+
+class CVCompileJobResponse(BaseModel):
+    job_id: str
+    status: str
+    success: Optional[bool] = None
+    pdf_url: Optional[str] = None
+    errors: List[str] = []
+    warnings: List[str] = []
+    diagnostics: List[TexDiagnostic] = []
     compilation_time_ms: int = 0
+    cached: bool = False
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
 
 
 class CVResponse(BaseModel):
@@ -57,3 +79,28 @@ class CVUpdateRequest(BaseModel):
     name: Optional[str] = None
     latex_source: Optional[str] = None
     is_active: Optional[bool] = None
+
+
+class CVCacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    evicted_bytes: int
+    max_bytes: int
+    max_age_seconds: int
+
+
+class CVStorageReport(BaseModel):
+    ran_at: datetime
+    files_deleted: int
+    bytes_reclaimed: int
+    bytes_in_use: int
+    quota_bytes: int
+
+
+class CVStorageStatsResponse(BaseModel):
+    total_bytes_reclaimed: int
+    last_run: Optional[CVStorageReport] = None
+    quota_bytes: int
+    interval_seconds: int
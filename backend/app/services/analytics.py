@@ -0,0 +1,180 @@
+"""
+Precomputed aggregates for the admin analytics dashboard.
+
+The overview counts are computed in one round trip and cached per look-back
+window. A background task recomputes the windows that have been asked for
+recently, so the dashboard reads a cached row instead of scanning
+contact_messages on every load.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import database
+
+logger = logging.getLogger(__name__)
+
+# Everything the overview needs, in a single statement
+OVERVIEW_QUERY = text("""
+    WITH contact_stats AS (
+        SELECT
+            COUNT(*) as total_messages,
+            COUNT(CASE WHEN is_read = true THEN 1 END) as read_messages,
+            COUNT(CASE WHEN is_replied = true THEN 1 END) as replied_messages,
+            COUNT(CASE WHEN created_at >= :start_date THEN 1 END) as recent_messages
+        FROM contact_messages
+    ),
+    project_stats AS (
+        SELECT
+            COUNT(*) as total_projects,
+            COUNT(CASE WHEN is_featured = true THEN 1 END) as featured_projects,
+            COUNT(DISTINCT category) as total_categories
+        FROM projects
+    ),
+    skills_stats AS (
+        SELECT
+            COUNT(*) as total_skills,
+            COUNT(DISTINCT category) as skill_categories,
+            AVG(proficiency) as avg_proficiency
+        FROM skills
+    ),
+    experience_stats AS (
+        SELECT
+            COUNT(*) as total_experiences,
+            COUNT(CASE WHEN is_current = true THEN 1 END) as current_positions
+        FROM experiences
+    )
+    SELECT * FROM contact_stats, project_stats, skills_stats, experience_stats
+""")
+
+
+def empty_overview() -> Dict[str, Any]:
+    return {
+        "total_messages": 0,
+        "read_messages": 0,
+        "replied_messages": 0,
+        "recent_messages": 0,
+        "total_projects": 0,
+        "featured_projects": 0,
+        "project_categories": 0,
+        "total_skills": 0,
+        "skill_categories": 0,
+        "avg_skill_proficiency": 0,
+        "total_experiences": 0,
+        "current_positions": 0,
+    }
+
+
+def _period(days: int, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+    return {
+        "days": days,
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat()
+    }
+
+
+class OverviewAggregates:
+    """Overview aggregates per look-back window, refreshed in the background."""
+
+    def __init__(
+        self,
+        sessions: Callable[[], AsyncSession],
+        refresh_seconds: int,
+        max_windows: int = 8
+    ):
+        self._sessions = sessions
+        self.refresh_seconds = refresh_seconds
+        self.max_windows = max_windows
+        # days -> (computed_at, result); most recently requested last
+        self._results: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._inflight: Dict[int, asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name="analytics-overview-refresh")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def get(self, days: int) -> Dict[str, Any]:
+        """Overview for a window; computed inline only the first time it is asked for."""
+        cached = self._results.get(days)
+        if cached is not None:
+            self._results.move_to_end(days)
+            if time.monotonic() - cached[0] >= self.refresh_seconds and days not in self._inflight:
+                # Serve the stale result and refresh behind it
+                self._refresh(days).add_done_callback(functools.partial(self._refreshed, days))
+            return cached[1]
+        return await asyncio.shield(self._refresh(days))
+
+    def _refresh(self, days: int) -> asyncio.Task:
+        # One computation per window at a time
+        task = self._inflight.get(days)
+        if task is None:
+            task = self._inflight[days] = asyncio.create_task(self._compute(days))
+            task.add_done_callback(lambda _: self._inflight.pop(days, None))
+        return task
+
+    @staticmethod
+    def _refreshed(days: int, task: asyncio.Task):
+        # Nobody awaits a background refresh; retrieve its failure here
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Analytics overview refresh for {days} days failed: {task.exception()}")
+
+    async def _compute(self, days: int) -> Dict[str, Any]:
+        end_date = datetime.utcnow()
+        start_date = end_date - timedelta(days=days)
+        async with self._sessions() as session:
+            row = (await session.execute(OVERVIEW_QUERY, {"start_date": start_date})).first()
+
+        result = {
+            "overview": {
+                "total_messages": row.total_messages,
+                "read_messages": row.read_messages,
+                "replied_messages": row.replied_messages,
+                "recent_messages": row.recent_messages,
+                "total_projects": row.total_projects,
+                "featured_projects": row.featured_projects,
+                "project_categories": row.total_categories,
+                "total_skills": row.total_skills,
+                "skill_categories": row.skill_categories,
+                "avg_skill_proficiency": float(row.avg_proficiency) if row.avg_proficiency else 0,
+                "total_experiences": row.total_experiences,
+                "current_positions": row.current_positions,
+            } if row else empty_overview(),
+            "period": _period(days, start_date, end_date)
+        }
+        self._results[days] = (time.monotonic(), result)
+        self._results.move_to_end(days)
+        while len(self._results) > self.max_windows:
+            self._results.popitem(last=False)
+        return result
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            for days in list(self._results):
+                try:
+                    await self._refresh(days)
+                except Exception as e:
+                    # Keep serving the last good result
+                    logger.warning(f"Analytics overview refresh for {days} days failed: {e}")
+
+
+overview_aggregates = OverviewAggregates(
+    database.read_sessions,
+    refresh_seconds=settings.analytics_refresh_seconds
+)
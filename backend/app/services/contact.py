@@ -4,6 +4,7 @@ import uuid
 import logging
 from app.schemas.contact import ContactRequest, ContactResponse
 from app.core.config import settings
+from app.core.state_store import state_store
 
 logger = logging.getLogger(__name__)
 
@@ -48,42 +49,54 @@ class ContactService:
                 status="unread"
             )
         ]
-    
+
+        # Shared across workers when a shared state backend is configured
+        self._state = state_store.register("contacts", self._dump_state, self._load_state)
+
+    def _dump_state(self) -> list:
+        return [item.model_dump(mode="json") for item in self.contacts]
+
+    def _load_state(self, data: list):
+        self.contacts = [ContactResponse.model_validate(item) for item in data]
+
     async def send_message(self, contact_data: ContactRequest) -> ContactResponse:
         """
         Process contact message submission
         """
-        try:
-            contact_id = str(uuid.uuid4())
-            contact_response = ContactResponse(
-                id=contact_id,
-                name=contact_data.name,
-                email=contact_data.email,
-                subject=contact_data.subject,
-                message=contact_data.message,
-                created_at=datetime.now(),
-                status="pending"
-            )
+        async with self._state.write():
+            try:
+                contact_id = str(uuid.uuid4())
+                contact_response = ContactResponse(
+                    id=contact_id,
+                    name=contact_data.name,
+                    email=contact_data.email,
+                    subject=contact_data.subject,
+                    message=contact_data.message,
+                    created_at=datetime.now(),
+                    status="pending"
+                )
             
-            # Store in memory (later replace with database)
-            self.contacts.append(contact_response)
+                # Store in memory (later replace with database)
+                self.contacts.append(contact_response)
             
-            # TODO: Implement email sending logic
-            # TODO: Store in database
+                # TODO: Implement email sending logic
+                # TODO: Store in database
             
-            logger.info(f"Contact message received from {contact_data.email}")
-            return contact_response
+                logger.info(f"Contact message received from {contact_data.email}")
+                return contact_response
             
-        except Exception as e:
-            logger.error(f"Error processing contact message: {str(e)}")
-            raise
+            except Exception as e:
+                logger.error(f"Error processing contact message: {str(e)}")
+                raise
     
     async def get_all_messages(self) -> list[ContactResponse]:
         """Get all contact messages"""
+        await self._state.sync()
         return self.contacts
     
     async def get_message_by_id(self, message_id: str) -> Optional[ContactResponse]:
         """Get specific contact message by ID"""
+        await self._state.sync()
         for contact in self.contacts:
             if contact.id == message_id:
                 return contact
@@ -91,22 +104,25 @@ class ContactService:
     
     async def update_message_status(self, message_id: str, status: str) -> Optional[ContactResponse]:
         """Update message status"""
-        for contact in self.contacts:
-            if contact.id == message_id:
-                contact.status = status
-                return contact
-        return None
+        async with self._state.write():
+            for contact in self.contacts:
+                if contact.id == message_id:
+                    contact.status = status
+                    return contact
+            return None
     
     async def delete_message(self, message_id: str) -> bool:
         """Delete a message"""
-        for i, contact in enumerate(self.contacts):
-            if contact.id == message_id:
-                del self.contacts[i]
-                return True
-        return False
+        async with self._state.write():
+            for i, contact in enumerate(self.contacts):
+                if contact.id == message_id:
+                    del self.contacts[i]
+                    return True
+            return False
     
     async def get_message_stats(self) -> dict:
         """Get message statistics"""
+        await self._state.sync()
         total = len(self.contacts)
         unread = len([c for c in self.contacts if c.status == "unread"])
         read = len([c for c in self.contacts if c.status == "read"])
@@ -1,8 +1,10 @@
+import functools
 import logging
 import uuid
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
+from app.core.state_store import state_store
 from app.models.content import (
     HeroContent,
     AboutContent,
@@ -27,6 +29,80 @@ _achievements: Dict[str, AchievementEntry] = {}
 _certifications: Dict[str, CertificationEntry] = {}
 _contact_info: Optional[ContactInfoContent] = None
 
+# Per-collection version, bumped on every write so readers can tell
+# whether a serialized snapshot is still current
+_versions: Dict[str, int] = {}
+
+
+_ENTRY_MODELS = {
+    "experiences": ExperienceEntry,
+    "skills": SkillEntry,
+    "education": EducationEntry,
+    "achievements": AchievementEntry,
+    "certifications": CertificationEntry,
+}
+
+
+def _dump_state() -> Dict[str, Any]:
+    return {
+        "hero": _hero_content.model_dump(mode="json") if _hero_content else None,
+        "about": _about_content.model_dump(mode="json") if _about_content else None,
+        "contact_info": _contact_info.model_dump(mode="json") if _contact_info else None,
+        "experiences": [e.model_dump(mode="json") for e in _experiences.values()],
+        "skills": [e.model_dump(mode="json") for e in _skills.values()],
+        "education": [e.model_dump(mode="json") for e in _education.values()],
+        "achievements": [e.model_dump(mode="json") for e in _achievements.values()],
+        "certifications": [e.model_dump(mode="json") for e in _certifications.values()],
+        "versions": _versions,
+    }
+
+
+def _load_state(data: Dict[str, Any]):
+    global _hero_content, _about_content, _contact_info
+    global _experiences, _skills, _education, _achievements, _certifications, _versions
+
+    _hero_content = HeroContent.model_validate(data["hero"]) if data["hero"] else None
+    _about_content = AboutContent.model_validate(data["about"]) if data["about"] else None
+    _contact_info = ContactInfoContent.model_validate(data["contact_info"]) if data["contact_info"] else None
+    entries = {
+        name: {item["id"]: model.model_validate(item) for item in data[name]}
+        for name, model in _ENTRY_MODELS.items()
+    }
+    _experiences = entries["experiences"]
+    _skills = entries["skills"]
+    _education = entries["education"]
+    _achievements = entries["achievements"]
+    _certifications = entries["certifications"]
+    _versions = data["versions"]
+
+
+# Shared across workers when a shared state backend is configured
+_state = state_store.register("content", _dump_state, _load_state)
+
+
+async def get_version(collection: str) -> int:
+    """Current version of a content collection."""
+    await _state.sync()
+    return _versions.get(collection, 0)
+
+
+def _reads(func):
+    """Mark a function as reading content."""
+    return _state.reader(func)
+
+
+def _writes(collection: str):
+    """Mark a function as modifying a collection."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            async with _state.write():
+                result = await func(*args, **kwargs)
+                _versions[collection] = _versions.get(collection, 0) + 1
+                return result
+        return wrapper
+    return decorator
+
 
 # Initialize with default data
 def _init_defaults():
@@ -84,10 +160,12 @@ _init_defaults()
 
 
 # Hero content operations
+@_reads
 async def get_hero() -> HeroContent:
     return _hero_content
 
 
+@_writes("hero")
 async def update_hero(data: Dict[str, Any]) -> HeroContent:
     global _hero_content
     if _hero_content is None:
@@ -102,10 +180,12 @@ async def update_hero(data: Dict[str, Any]) -> HeroContent:
 
 
 # About content operations
+@_reads
 async def get_about() -> AboutContent:
     return _about_content
 
 
+@_writes("about")
 async def update_about(data: Dict[str, Any]) -> AboutContent:
     global _about_content
     if _about_content is None:
@@ -120,14 +200,17 @@ async def update_about(data: Dict[str, Any]) -> AboutContent:
 
 
 # Experience operations
+@_reads
 async def get_experiences() -> List[ExperienceEntry]:
     return sorted(_experiences.values(), key=lambda x: x.order)
 
 
+@_reads
 async def get_experience(exp_id: str) -> Optional[ExperienceEntry]:
     return _experiences.get(exp_id)
 
 
+@_writes("experiences")
 async def create_experience(data: Dict[str, Any]) -> ExperienceEntry:
     now = datetime.now()
     exp_id = str(uuid.uuid4())
@@ -144,6 +227,7 @@ async def create_experience(data: Dict[str, Any]) -> ExperienceEntry:
     return entry
 
 
+@_writes("experiences")
 async def update_experience(exp_id: str, data: Dict[str, Any]) -> Optional[ExperienceEntry]:
     if exp_id not in _experiences:
         return None
@@ -158,6 +242,7 @@ async def update_experience(exp_id: str, data: Dict[str, Any]) -> Optional[Exper
     return entry
 
 
+@_writes("experiences")
 async def delete_experience(exp_id: str) -> bool:
     if exp_id in _experiences:
         del _experiences[exp_id]
@@ -165,6 +250,7 @@ async def delete_experience(exp_id: str) -> bool:
     return False
 
 
+@_writes("experiences")
 async def bulk_update_experiences(experiences: List[Dict[str, Any]]) -> List[ExperienceEntry]:
     global _experiences
     _experiences = {}
@@ -195,6 +281,7 @@ async def bulk_update_experiences(experiences: List[Dict[str, Any]]) -> List[Exp
 
 
 # Skill operations
+@_reads
 async def get_skills(category: Optional[str] = None) -> List[SkillEntry]:
     skills = list(_skills.values())
     if category:
@@ -202,10 +289,12 @@ async def get_skills(category: Optional[str] = None) -> List[SkillEntry]:
     return sorted(skills, key=lambda x: x.order)
 
 
+@_reads
 async def get_skill(skill_id: str) -> Optional[SkillEntry]:
     return _skills.get(skill_id)
 
 
+@_writes("skills")
 async def create_skill(data: Dict[str, Any]) -> SkillEntry:
     now = datetime.now()
     skill_id = str(uuid.uuid4())
@@ -222,6 +311,7 @@ async def create_skill(data: Dict[str, Any]) -> SkillEntry:
     return entry
 
 
+@_writes("skills")
 async def update_skill(skill_id: str, data: Dict[str, Any]) -> Optional[SkillEntry]:
     if skill_id not in _skills:
         return None
@@ -236,6 +326,7 @@ async def update_skill(skill_id: str, data: Dict[str, Any]) -> Optional[SkillEnt
     return entry
 
 
+@_writes("skills")
 async def delete_skill(skill_id: str) -> bool:
     if skill_id in _skills:
         del _skills[skill_id]
@@ -243,6 +334,7 @@ async def delete_skill(skill_id: str) -> bool:
     return False
 
 
+@_writes("skills")
 async def bulk_update_skills(skills: List[Dict[str, Any]]) -> List[SkillEntry]:
     global _skills
     _skills = {}
@@ -270,14 +362,17 @@ async def bulk_update_skills(skills: List[Dict[str, Any]]) -> List[SkillEntry]:
 
 
 # Education operations
+@_reads
 async def get_education_list() -> List[EducationEntry]:
     return sorted(_education.values(), key=lambda x: x.order)
 
 
+@_reads
 async def get_education(edu_id: str) -> Optional[EducationEntry]:
     return _education.get(edu_id)
 
 
+@_writes("education")
 async def create_education(data: Dict[str, Any]) -> EducationEntry:
     now = datetime.now()
     edu_id = str(uuid.uuid4())
@@ -294,6 +389,7 @@ async def create_education(data: Dict[str, Any]) -> EducationEntry:
     return entry
 
 
+@_writes("education")
 async def update_education(edu_id: str, data: Dict[str, Any]) -> Optional[EducationEntry]:
     if edu_id not in _education:
         return None
@@ -308,6 +404,7 @@ async def update_education(edu_id: str, data: Dict[str, Any]) -> Optional[Educat
     return entry
 
 
+@_writes("education")
 async def delete_education(edu_id: str) -> bool:
     if edu_id in _education:
         del _education[edu_id]
@@ -315,6 +412,7 @@ async def delete_education(edu_id: str) -> bool:
     return False
 
 
+@_writes("education")
 async def bulk_update_education(education: List[Dict[str, Any]]) -> List[EducationEntry]:
     global _education
     _education = {}
@@ -344,6 +442,7 @@ async def bulk_update_education(education: List[Dict[str, Any]]) -> List[Educati
 
 
 # Achievement operations
+@_reads
 async def get_achievements(category: Optional[str] = None) -> List[AchievementEntry]:
     achievements = list(_achievements.values())
     if category:
@@ -351,10 +450,12 @@ async def get_achievements(category: Optional[str] = None) -> List[AchievementEn
     return sorted(achievements, key=lambda x: x.order)
 
 
+@_reads
 async def get_achievement(ach_id: str) -> Optional[AchievementEntry]:
     return _achievements.get(ach_id)
 
 
+@_writes("achievements")
 async def create_achievement(data: Dict[str, Any]) -> AchievementEntry:
     now = datetime.now()
     ach_id = str(uuid.uuid4())
@@ -371,6 +472,7 @@ async def create_achievement(data: Dict[str, Any]) -> AchievementEntry:
     return entry
 
 
+@_writes("achievements")
 async def update_achievement(ach_id: str, data: Dict[str, Any]) -> Optional[AchievementEntry]:
     if ach_id not in _achievements:
         return None
@@ -385,6 +487,7 @@ async def update_achievement(ach_id: str, data: Dict[str, Any]) -> Optional[Achi
     return entry
 
 
+@_writes("achievements")
 async def delete_achievement(ach_id: str) -> bool:
     if ach_id in _achievements:
         del _achievements[ach_id]
@@ -392,6 +495,7 @@ async def delete_achievement(ach_id: str) -> bool:
     return False
 
 
+@_writes("achievements")
 async def bulk_update_achievements(achievements: List[Dict[str, Any]]) -> List[AchievementEntry]:
     global _achievements
     _achievements = {}
@@ -422,14 +526,17 @@ async def bulk_update_achievements(achievements: List[Dict[str, Any]]) -> List[A
 
 
 # Certification operations
+@_reads
 async def get_certifications() -> List[CertificationEntry]:
     return sorted(_certifications.values(), key=lambda x: x.order)
 
 
+@_reads
 async def get_certification(cert_id: str) -> Optional[CertificationEntry]:
     return _certifications.get(cert_id)
 
 
+@_writes("certifications")
 async def create_certification(data: Dict[str, Any]) -> CertificationEntry:
     now = datetime.now()
     cert_id = str(uuid.uuid4())
@@ -456,6 +563,7 @@ async def create_certification(data: Dict[str, Any]) -> CertificationEntry:
     return entry
 
 
+@_writes("certifications")
 async def update_certification(cert_id: str, data: Dict[str, Any]) -> Optional[CertificationEntry]:
     if cert_id not in _certifications:
         return None
@@ -472,6 +580,7 @@ async def update_certification(cert_id: str, data: Dict[str, Any]) -> Optional[C
     return entry
 
 
+@_writes("certifications")
 async def delete_certification(cert_id: str) -> bool:
     if cert_id in _certifications:
         del _certifications[cert_id]
@@ -479,6 +588,7 @@ async def delete_certification(cert_id: str) -> bool:
     return False
 
 
+@_writes("certifications")
 async def bulk_update_certifications(certifications: List[Dict[str, Any]]) -> List[CertificationEntry]:
     global _certifications
     _certifications = {}
@@ -512,10 +622,12 @@ async def bulk_update_certifications(certifications: List[Dict[str, Any]]) -> Li
 
 
 # Contact info operations
+@_reads
 async def get_contact_info() -> ContactInfoContent:
     return _contact_info
 
 
+@_writes("contact_info")
 async def update_contact_info(data: Dict[str, Any]) -> ContactInfoContent:
     global _contact_info
     if _contact_info is None:
@@ -1,16 +1,32 @@
 import asyncio
+import functools
+import hashlib
 import logging
 import os
-import shutil
-import subprocess
-import tempfile
 import time
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
-
-from app.models.cv import CVDocument, CVStatus, CVTemplate, CompilationResult
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.core.metrics import registry as metrics_registry
+from app.core.state_store import StateLockTimeout, state_store
+from app.models.cv import (
+    CVDocument,
+    CVStatus,
+    CVTemplate,
+    CompilationResult,
+    CompileJob,
+    TexDiagnostic,
+)
+from app.services import cv_metrics, latex
+from app.services.cv_cache import CompileCache
+from app.services.cv_compiler import CompilePool, CompleteCallback
+from app.services.cv_janitor import StorageJanitor
+from app.services.cv_preview import TemplatePreviews
+from app.services.latex_format import WarmFormats, format_unusable, split_preamble
+from app.utils import async_files
 
 logger = logging.getLogger(__name__)
 
@@ -18,13 +34,11 @@ logger = logging.getLogger(__name__)
 CV_STORAGE_PATH = Path("/app/storage/cv")
 PDF_OUTPUT_PATH = Path("/app/storage/cv/pdf")
 LATEX_SOURCE_PATH = Path("/app/storage/cv/source")
+CV_BUILD_PATH = Path("/app/storage/cv/build")
+CV_FORMAT_PATH = Path("/app/storage/cv/formats")
+CV_PREVIEW_PATH = Path("/app/storage/cv/previews")
 STATIC_CV_PATH = Path("/app/static/cv/Alamin_Mahamud_CV.pdf")
 
-# Ensure directories exist
-CV_STORAGE_PATH.mkdir(parents=True, exist_ok=True)
-PDF_OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
-LATEX_SOURCE_PATH.mkdir(parents=True, exist_ok=True)
-
 
 # In-memory storage for demo (replace with database in production)
 _cv_documents: dict[str, CVDocument] = {}
@@ -32,6 +46,24 @@ _active_cv_id: Optional[str] = None
 _initialized: bool = False
 
 
+def _dump_documents() -> dict:
+    return {
+        "documents": [doc.model_dump(mode="json") for doc in _cv_documents.values()],
+        "active_cv_id": _active_cv_id,
+    }
+
+
+def _load_documents(data: dict):
+    global _cv_documents, _active_cv_id
+    _cv_documents = {item["id"]: CVDocument.model_validate(item) for item in data["documents"]}
+    _active_cv_id = data["active_cv_id"]
+
+
+# Shared across workers when a shared state backend is configured; files
+# live on the shared storage volume
+_documents_state = state_store.register("cv_documents", _dump_documents, _load_documents)
+
+
 # Default LaTeX resume template
 DEFAULT_LATEX_TEMPLATE = r"""\documentclass[11pt,a4paper,sans]{moderncv}
 
@@ -126,67 +158,280 @@ CV_TEMPLATES: List[CVTemplate] = [
 ]
 
 
-async def compile_latex(latex_source: str) -> CompilationResult:
-    """Compile LaTeX source to PDF using pdflatex."""
+# Engine options that affect the compiled output; part of the cache key
+COMPILE_OPTIONS = {"engine": settings.cv_compile_engine}
+
+# One build at a time per persistent build directory
+_build_locks: Dict[str, asyncio.Lock] = {}
+
+# Latest draft compile job per CV document
+_draft_jobs: Dict[str, str] = {}
+
+# Newest compiled PDF filenames per CV document, oldest first
+_document_pdfs: Dict[str, List[str]] = {}
+
+
+def _dump_document_pdfs() -> dict:
+    return _document_pdfs
+
+
+def _load_document_pdfs(data: dict):
+    global _document_pdfs
+    _document_pdfs = {cv_id: list(names) for cv_id, names in data.items()}
+
+
+# Shared like the documents, so every worker retains the PDFs any of them
+# compiled; kept apart so a compile doesn't republish the documents
+_document_pdfs_state = state_store.register("cv_document_pdfs", _dump_document_pdfs, _load_document_pdfs)
+
+# Serializes source file writes per CV document
+_source_locks: Dict[str, asyncio.Lock] = {}
+
+# Precompiled formats for the template preambles; only used when enabled
+warm_formats = WarmFormats(CV_FORMAT_PATH, [template.latex_template for template in CV_TEMPLATES])
+
+@functools.lru_cache(maxsize=None)
+def _template_preambles() -> Dict[str, str]:
+    """Template preambles, used to attribute compile times to a template."""
+    preambles: Dict[str, str] = {}
+    for template in CV_TEMPLATES:
+        split = split_preamble(template.latex_template)
+        if split:
+            preambles.setdefault(split[0], template.id)
+    return preambles
+
+
+def _template_label(latex_source: str) -> str:
+    """Template a source was started from, judged by its preamble, or "custom"."""
+    split = split_preamble(latex_source)
+    return _template_preambles().get(split[0], "custom") if split else "custom"
+
+
+async def prepare_storage():
+    """Create the CV storage directories; run at startup rather than on import."""
+    for path in (CV_STORAGE_PATH, PDF_OUTPUT_PATH, LATEX_SOURCE_PATH):
+        await async_files.makedirs(path)
+
+
+compile_cache = CompileCache(
+    PDF_OUTPUT_PATH,
+    max_bytes=settings.cv_cache_max_bytes,
+    max_age_seconds=settings.cv_cache_max_age_days * 24 * 3600
+)
+
+
+def _referenced_pdf_names() -> Set[str]:
+    """Filenames of PDFs that CV documents still point at."""
+    return {doc.pdf_path.split("/")[-1] for doc in _cv_documents.values() if doc.pdf_path}
+
+
+def _recent_pdf_names() -> Set[str]:
+    """Filenames of the latest compiles of each document."""
+    return {name for names in _document_pdfs.values() for name in names}
+
+
+async def _remember_pdf(cv_id: str, pdf_url: str):
+    """Record a document's latest compile, keeping only the newest few."""
+    filename = pdf_url.split("/")[-1]
+    await _document_pdfs_state.sync()
+    if _document_pdfs.get(cv_id, [])[-1:] == [filename]:
+        # Already the newest; nothing to publish
+        return
+    try:
+        async with _document_pdfs_state.write():
+            names = _document_pdfs.setdefault(cv_id, [])
+            if filename in names:
+                names.remove(filename)
+            names.append(filename)
+            del names[:-max(1, settings.cv_retention_per_document)]
+    except StateLockTimeout as e:
+        # The compile itself succeeded; the janitor's grace period still
+        # covers the PDF until the next compile records it
+        logger.warning(f"Could not record the latest PDF of CV {cv_id}: {e.detail}")
+
+
+async def _refresh_retention():
+    """Catch up with documents and compiles from other workers."""
+    await _documents_state.sync()
+    await _document_pdfs_state.sync()
+
+
+def _live_build_names() -> Set[str]:
+    return {_build_dir(cv_id).name for cv_id in _cv_documents}
+
+
+def _busy_build_names() -> Set[str]:
+    return {name for name, lock in _build_locks.items() if lock.locked()}
+
+
+def resolve_pdf_path(pdf_url: str) -> Path:
+    """Map a CV document's PDF URL to the file on disk."""
+    filename = Path(pdf_url).name
+    if pdf_url.startswith("/static/"):
+        return STATIC_CV_PATH.parent / filename
+    return PDF_OUTPUT_PATH / filename
+
+
+def _cache_key(latex_source: str, draft: bool = False) -> str:
+    return compile_cache.key(latex_source, draft=draft, **COMPILE_OPTIONS)
+
+
+async def _cached_result(latex_source: str, draft: bool = False) -> Optional[CompilationResult]:
     start_time = time.time()
-    errors: List[str] = []
-    warnings: List[str] = []
+    keys = [_cache_key(latex_source)]
+    if draft:
+        # A full compile of the same source is at least as good as a draft
+        keys.append(_cache_key(latex_source, draft=True))
+    filename = await compile_cache.lookup(*keys)
+    if not filename:
+        return None
+    cv_metrics.COMPILE_JOBS.labels("cached").inc()
+    return CompilationResult(
+        success=True,
+        pdf_path=f"/api/cv/pdf/{filename}",
+        errors=[],
+        warnings=[],
+        compilation_time_ms=int((time.time() - start_time) * 1000),
+        cached=True
+    )
 
-    # Create temporary directory for compilation
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tex_path = Path(tmpdir) / "resume.tex"
-        pdf_path = Path(tmpdir) / "resume.pdf"
 
-        # Write LaTeX source
-        with open(tex_path, "w", encoding="utf-8") as f:
-            f.write(latex_source)
+def _build_dir(cv_id: str) -> Path:
+    """Persistent build directory for a CV document's incremental builds."""
+    # Hash the ID so arbitrary client-supplied IDs can't escape the build root
+    return CV_BUILD_PATH / hashlib.sha256(cv_id.encode("utf-8")).hexdigest()[:16]
 
+
+async def _compile_latex_source(
+    latex_source: str,
+    cv_id: Optional[str] = None,
+    draft: bool = False
+) -> CompilationResult:
+    """Compile LaTeX source to PDF.
+
+    With incremental builds enabled and the ``cv_id`` of a CV document, the
+    document gets a persistent build directory so .aux files carry over
+    between edits. Drafts get a single pdflatex pass.
+    """
+    if cv_id not in _cv_documents:
+        # Deleted while the job was queued
+        cv_id = None
+    if cv_id and settings.cv_incremental_builds:
+        build_dir = _build_dir(cv_id)
+        lock = _build_locks.setdefault(build_dir.name, asyncio.Lock())
+        async with lock:
+            await async_files.makedirs(build_dir)
+            result = await _compile_in(build_dir, latex_source, draft)
+    else:
+        # Create temporary directory for compilation
+        tmpdir = await async_files.make_temp_dir()
         try:
-            # Run pdflatex twice for proper references
-            for _ in range(2):
-                result = subprocess.run(
-                    [
-                        "pdflatex",
-                        "-interaction=nonstopmode",
-                        "-output-directory", tmpdir,
-                        str(tex_path)
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                    cwd=tmpdir
-                )
+            result = await _compile_in(tmpdir, latex_source, draft)
+        finally:
+            await async_files.rmtree(tmpdir)
+
+    if cv_id and result.success:
+        await _remember_pdf(cv_id, result.pdf_path)
+    return result
 
-                # Parse output for errors and warnings
-                for line in result.stdout.split("\n"):
-                    if line.startswith("!"):
-                        errors.append(line)
-                    elif "Warning" in line:
-                        warnings.append(line)
-
-            if pdf_path.exists():
-                # Generate unique filename and copy to storage
-                output_filename = f"resume_{uuid.uuid4().hex[:8]}.pdf"
-                output_path = PDF_OUTPUT_PATH / output_filename
-                shutil.copy(pdf_path, output_path)
-
-                compilation_time = int((time.time() - start_time) * 1000)
-                return CompilationResult(
-                    success=True,
-                    pdf_path=f"/api/cv/pdf/{output_filename}",
-                    errors=[],
-                    warnings=warnings[:5],  # Limit warnings
-                    compilation_time_ms=compilation_time
+
+async def _compile_in(workdir: Path, latex_source: str, draft: bool = False) -> CompilationResult:
+    start_time = time.time()
+    result = await _run_compile(workdir, latex_source, draft, start_time)
+    cv_metrics.COMPILE_SECONDS.labels(
+        _template_label(latex_source), "success" if result.success else "failure"
+    ).observe(time.time() - start_time)
+    cv_metrics.record_diagnostics(result.diagnostics)
+    return result
+
+
+async def _run_compile(
+    workdir: Path,
+    latex_source: str,
+    draft: bool,
+    start_time: float
+) -> CompilationResult:
+    errors: List[str] = []
+    warnings: List[str] = []
+    diagnostics: List[TexDiagnostic] = []
+
+    tex_path = workdir / "resume.tex"
+    pdf_path = workdir / "resume.pdf"
+    aux_path = workdir / "resume.aux"
+    log_path = workdir / "resume.log"
+
+    engine = settings.cv_compile_engine
+    use_latexmk = engine == "latexmk" and not draft
+    max_passes = 1 if draft else max(1, settings.cv_compile_max_passes)
+
+    fmt: Optional[Path] = None
+    source = latex_source
+    if settings.cv_warm_format and not use_latexmk:
+        with cv_metrics.phase("format"):
+            warm = await warm_formats.prepare(latex_source)
+        if warm:
+            fmt, source = warm
+
+    with cv_metrics.phase("write"):
+        # Write LaTeX source
+        await async_files.write_text(tex_path, source)
+        # A PDF left over from an earlier build must not pass for this one
+        await async_files.unlink(pdf_path)
+
+    try:
+        if use_latexmk:
+            # latexmk decides on reruns itself
+            with cv_metrics.phase("latexmk"):
+                output = await latex.run_tex(latex.latexmk_args(tex_path, workdir), workdir)
+            log = latex.read_log(log_path, output)
+            errors, warnings = latex.collect_messages(log)
+            diagnostics = latex.parse_log(log)
+        else:
+            # Run pdflatex once, and again only while cross-references move
+            for pass_number in range(1, max_passes + 1):
+                aux_before = latex.aux_digest(aux_path)
+                with cv_metrics.phase(f"pass_{pass_number}"):
+                    output = await latex.run_tex(latex.pdflatex_args(tex_path, workdir, fmt), workdir)
+                    if fmt and format_unusable(output):
+                        # The end-of-dump marker is a no-op without the format
+                        await warm_formats.discard(fmt)
+                        fmt = None
+                        output = await latex.run_tex(latex.pdflatex_args(tex_path, workdir), workdir)
+                cv_metrics.TEX_PASSES.inc()
+                log = latex.read_log(log_path, output)
+                errors, warnings = latex.collect_messages(log)
+                diagnostics = latex.parse_log(log)
+                if errors or not latex.needs_rerun(log, aux_before, latex.aux_digest(aux_path)):
+                    break
+
+        if pdf_path.exists():
+            # Store under a content-addressed name so identical sources
+            # are served from the cache next time
+            key = _cache_key(latex_source, draft)
+            with cv_metrics.phase("copy"):
+                output_filename = await async_files.run_io(compile_cache.store, key, pdf_path)
+            with cv_metrics.phase("evict"):
+                await _refresh_retention()
+                await async_files.run_io(
+                    compile_cache.evict, _referenced_pdf_names() | _recent_pdf_names()
                 )
-            else:
-                errors.append("PDF file was not generated")
 
-        except subprocess.TimeoutExpired:
-            errors.append("Compilation timed out after 60 seconds")
-        except FileNotFoundError:
-            errors.append("pdflatex not found. Please install TeXLive.")
-        except Exception as e:
-            errors.append(f"Compilation error: {str(e)}")
+            compilation_time = int((time.time() - start_time) * 1000)
+            return CompilationResult(
+                success=True,
+                pdf_path=f"/api/cv/pdf/{output_filename}",
+                errors=[],
+                warnings=warnings[:5],  # Limit warnings
+                diagnostics=diagnostics,
+                compilation_time_ms=compilation_time
+            )
+        else:
+            errors.append("PDF file was not generated")
+
+    except FileNotFoundError:
+        errors.append(f"{engine} not found. Please install TeXLive.")
+    except Exception as e:
+        errors.append(f"Compilation error: {str(e)}")
 
     compilation_time = int((time.time() - start_time) * 1000)
     return CompilationResult(
@@ -194,13 +439,176 @@ async def compile_latex(latex_source: str) -> CompilationResult:
         pdf_path=None,
         errors=errors[:10],  # Limit errors
         warnings=warnings[:5],
+        diagnostics=diagnostics,
         compilation_time_ms=compilation_time
     )
 
 
+# Shared compile pool; bounds how many TeX processes run at once
+compile_pool = CompilePool(
+    _compile_latex_source,
+    workers=settings.cv_compile_workers,
+    queue_size=settings.cv_compile_queue_size,
+    timeout=settings.cv_compile_timeout
+)
+cv_metrics.register_engine(compile_pool, compile_cache, warm_formats)
+
+
+@_documents_state.reader
+async def _document_id(cv_id: Optional[str]) -> Optional[str]:
+    """``cv_id`` if it names a CV document, else None.
+
+    Only documents get build directories, draft superseding and retained
+    PDFs; any other ID compiles like an anonymous source.
+    """
+    return cv_id if cv_id in _cv_documents else None
+
+
+def _draft_finished(cv_id: str, job_id: str):
+    # A superseded draft finishing must not forget its replacement
+    if _draft_jobs.get(cv_id) == job_id:
+        del _draft_jobs[cv_id]
+
+
+def _supersede_draft(cv_id: str):
+    """Cancel the in-flight draft for a document; a newer one replaces it."""
+    job_id = _draft_jobs.pop(cv_id, None)
+    if job_id:
+        compile_pool.cancel(job_id, reason="Superseded by a newer draft")
+
+
+async def _submit(
+    latex_source: str,
+    cv_id: Optional[str],
+    draft: bool,
+    on_complete: Optional[CompleteCallback] = None
+) -> CompileJob:
+    job = await compile_pool.submit(latex_source, on_complete=on_complete, cv_id=cv_id, draft=draft)
+    if draft and cv_id:
+        _draft_jobs[cv_id] = job.id
+        compile_pool.on_finished(job.id, functools.partial(_draft_finished, cv_id, job.id))
+    return job
+
+
+async def compile_latex(
+    latex_source: str,
+    cv_id: Optional[str] = None,
+    draft: bool = False
+) -> CompilationResult:
+    """Compile LaTeX source to PDF, serving identical sources from the cache.
+
+    A draft for a ``cv_id`` cancels any draft still in flight for the same
+    document instead of queueing behind it.
+    """
+    cv_id = await _document_id(cv_id)
+    if draft and cv_id:
+        _supersede_draft(cv_id)
+    cached = await _cached_result(latex_source, draft)
+    if cached:
+        if cv_id:
+            await _remember_pdf(cv_id, cached.pdf_path)
+        return cached
+    job = await _submit(latex_source, cv_id, draft)
+    return await compile_pool.wait(job.id)
+
+
+async def submit_compile_job(
+    latex_source: str,
+    cv_id: Optional[str] = None,
+    draft: bool = False,
+    on_complete: Optional[CompleteCallback] = None
+) -> CompileJob:
+    """Queue a compile job without waiting for it to finish."""
+    cv_id = await _document_id(cv_id)
+    if draft and cv_id:
+        _supersede_draft(cv_id)
+    cached = await _cached_result(latex_source, draft)
+    if cached:
+        if cv_id:
+            await _remember_pdf(cv_id, cached.pdf_path)
+        job = compile_pool.record(cached)
+        if on_complete:
+            await on_complete(cached)
+        return job
+    return await _submit(latex_source, cv_id, draft, on_complete=on_complete)
+
+
+async def _template_pdf(latex_source: str) -> Optional[Path]:
+    result = await compile_latex(latex_source)
+    if not result.success or not result.pdf_path:
+        return None
+    return resolve_pdf_path(result.pdf_path)
+
+
+# Template thumbnails, rendered in the background from the startup hook and
+# whenever a template's LaTeX changes
+template_previews = TemplatePreviews(CV_PREVIEW_PATH, _template_pdf, dpi=settings.cv_preview_dpi)
+
+
+# Periodic cleanup of compiled PDFs and build directories; started from the
+# application startup hook
+storage_janitor = StorageJanitor(
+    pdf_dir=PDF_OUTPUT_PATH,
+    build_dir=CV_BUILD_PATH,
+    source_dir=LATEX_SOURCE_PATH,
+    referenced_pdfs=_referenced_pdf_names,
+    retained_pdfs=_recent_pdf_names,
+    live_builds=_live_build_names,
+    busy_builds=_busy_build_names,
+    refresh=_refresh_retention,
+    quota_bytes=settings.cv_storage_quota_bytes,
+    grace_seconds=settings.cv_orphan_grace_hours * 3600,
+    interval_seconds=settings.cv_janitor_interval_seconds
+)
+
+
+async def get_storage_stats() -> dict:
+    """Get storage usage and what the janitor has reclaimed."""
+    return storage_janitor.stats()
+
+
+async def run_storage_cleanup() -> dict:
+    """Run a storage cleanup pass now."""
+    return await storage_janitor.run_once()
+
+
+def get_compile_metrics() -> str:
+    """Render CV engine metrics in the Prometheus text format."""
+    return metrics_registry.render(prefix="cv_")
+
+
+async def get_compile_cache_stats() -> dict:
+    """Get hit/miss counters for the compile cache."""
+    return compile_cache.stats()
+
+
+async def get_compile_job(job_id: str) -> Optional[CompileJob]:
+    """Get a compile job by ID."""
+    return compile_pool.get_job(job_id)
+
+
+async def cancel_compile_job(job_id: str) -> bool:
+    """Cancel a queued or running compile job."""
+    return compile_pool.cancel(job_id)
+
+
+def _source_lock(cv_id: str) -> asyncio.Lock:
+    return _source_locks.setdefault(cv_id, asyncio.Lock())
+
+
+async def _save_source(cv_id: str, latex_source: str):
+    """Persist a document's LaTeX source off the event loop.
+
+    Writes go through write-then-rename, and are serialized per document so
+    an older save can never land after a newer one.
+    """
+    async with _source_lock(cv_id):
+        await async_files.write_text_atomic(LATEX_SOURCE_PATH / f"{cv_id}.tex", latex_source)
+
+
 async def initialize_default_cv():
     """Initialize with the static CV PDF if available."""
-    global _initialized, _active_cv_id
+    global _initialized
 
     if _initialized:
         return
@@ -209,26 +617,38 @@ async def initialize_default_cv():
 
     # Check if static PDF exists
     if STATIC_CV_PATH.exists():
-        doc_id = "alamin-cv-default"
-        now = datetime.now()
-
-        doc = CVDocument(
-            id=doc_id,
-            name="Alamin Mahamud - CV",
-            latex_source="",  # Will be loaded from cv.tex if needed
-            pdf_path="/static/cv/Alamin_Mahamud_CV.pdf",
-            is_active=True,
-            status=CVStatus.PUBLISHED,
-            version=1,
-            created_at=now,
-            updated_at=now
-        )
-
-        _cv_documents[doc_id] = doc
+        await _add_default_cv()
+
+
+@_documents_state.writer
+async def _add_default_cv():
+    """Add the static CV PDF as a document, unless another worker already did."""
+    global _active_cv_id
+
+    doc_id = "alamin-cv-default"
+    if doc_id in _cv_documents:
+        return
+    now = datetime.now()
+
+    doc = CVDocument(
+        id=doc_id,
+        name="Alamin Mahamud - CV",
+        latex_source="",  # Will be loaded from cv.tex if needed
+        pdf_path="/static/cv/Alamin_Mahamud_CV.pdf",
+        is_active=_active_cv_id is None,
+        status=CVStatus.PUBLISHED,
+        version=1,
+        created_at=now,
+        updated_at=now
+    )
+
+    _cv_documents[doc_id] = doc
+    if _active_cv_id is None:
         _active_cv_id = doc_id
-        logger.info(f"Initialized default CV from static PDF: {STATIC_CV_PATH}")
+    logger.info(f"Initialized default CV from static PDF: {STATIC_CV_PATH}")
 
 
+@_documents_state.reader
 async def get_active_cv() -> Optional[CVDocument]:
     """Get the currently active CV document."""
     global _active_cv_id
@@ -248,25 +668,26 @@ async def get_active_cv() -> Optional[CVDocument]:
     return None
 
 
+@_documents_state.reader
 async def get_cv_by_id(cv_id: str) -> Optional[CVDocument]:
     """Get a CV document by ID."""
     return _cv_documents.get(cv_id)
 
 
+@_documents_state.reader
 async def get_all_cvs() -> Tuple[List[CVDocument], Optional[str]]:
     """Get all CV documents and the active ID."""
     return list(_cv_documents.values()), _active_cv_id
 
 
+@_documents_state.writer
 async def create_cv_document(latex_source: str, name: str = "Resume") -> CVDocument:
     """Create a new CV document."""
     doc_id = str(uuid.uuid4())
     now = datetime.now()
 
     # Save source to file
-    source_path = LATEX_SOURCE_PATH / f"{doc_id}.tex"
-    with open(source_path, "w", encoding="utf-8") as f:
-        f.write(latex_source)
+    await _save_source(doc_id, latex_source)
 
     doc = CVDocument(
         id=doc_id,
@@ -284,11 +705,13 @@ async def create_cv_document(latex_source: str, name: str = "Resume") -> CVDocum
     return doc
 
 
+@_documents_state.writer
 async def update_cv_document(
     cv_id: str,
     latex_source: Optional[str] = None,
     name: Optional[str] = None,
-    is_active: Optional[bool] = None
+    is_active: Optional[bool] = None,
+    pdf_path: Optional[str] = None
 ) -> Optional[CVDocument]:
     """Update a CV document."""
     global _active_cv_id
@@ -301,13 +724,14 @@ async def update_cv_document(
         doc.latex_source = latex_source
         doc.version += 1
         # Update source file
-        source_path = LATEX_SOURCE_PATH / f"{cv_id}.tex"
-        with open(source_path, "w", encoding="utf-8") as f:
-            f.write(latex_source)
+        await _save_source(cv_id, latex_source)
 
     if name is not None:
         doc.name = name
 
+    if pdf_path is not None:
+        doc.pdf_path = pdf_path
+
     if is_active is not None:
         if is_active:
             # Deactivate all others
@@ -330,6 +754,7 @@ async def set_active_cv(cv_id: str) -> bool:
     return await update_cv_document(cv_id, is_active=True) is not None
 
 
+@_documents_state.writer
 async def delete_cv_document(cv_id: str) -> bool:
     """Delete a CV document."""
     global _active_cv_id
@@ -343,9 +768,17 @@ async def delete_cv_document(cv_id: str) -> bool:
         _active_cv_id = None
 
     # Delete source file
-    source_path = LATEX_SOURCE_PATH / f"{cv_id}.tex"
-    if source_path.exists():
-        source_path.unlink()
+    async with _source_lock(cv_id):
+        await async_files.unlink(LATEX_SOURCE_PATH / f"{cv_id}.tex")
+    _source_locks.pop(cv_id, None)
+
+    # Drop the incremental build directory along with the document
+    build_dir = _build_dir(cv_id)
+    await async_files.rmtree(build_dir)
+    _build_locks.pop(build_dir.name, None)
+    _draft_jobs.pop(cv_id, None)
+    async with _document_pdfs_state.write():
+        _document_pdfs.pop(cv_id, None)
 
     return True
 
@@ -361,3 +794,19 @@ async def get_template_by_id(template_id: str) -> Optional[CVTemplate]:
         if template.id == template_id:
             return template
     return None
+
+
+def template_preview_url(template: CVTemplate) -> str:
+    """Preview URL that changes whenever the template's LaTeX does."""
+    return f"{template.preview_image}?v={template_previews.key(template.latex_template)}"
+
+
+async def get_template_preview(template: CVTemplate) -> Tuple[str, Optional[Path], bool]:
+    """Get a template's preview version, its file and whether a render is pending.
+
+    Never compiles inline; a missing preview is queued for rendering.
+    """
+    key, path = template_previews.lookup(template.id, template.latex_template)
+    if path is None:
+        template_previews.schedule(template.id, template.latex_template)
+    return key, path, template_previews.pending(key)
@@ -0,0 +1,149 @@
+"""
+Content-addressed cache for compiled CV PDFs.
+
+A compiled PDF is stored under a name derived from a hash of the LaTeX
+source and the engine options that produced it, so compiling the same
+source twice returns the existing file without starting TeX.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from app.utils import async_files
+
+logger = logging.getLogger(__name__)
+
+CACHED_PDF_PATTERN = re.compile(r"^resume_[0-9a-f]{32}\.pdf$")
+
+
+def is_cached_pdf_name(filename: str) -> bool:
+    """Whether a filename belongs to the content-addressed cache."""
+    return bool(CACHED_PDF_PATTERN.match(filename))
+
+
+class CompileCache:
+    """Size- and age-bounded PDF cache keyed by source + engine options."""
+
+    def __init__(self, directory: Path, max_bytes: int, max_age_seconds: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+        self._evict_lock = threading.Lock()
+
+    @staticmethod
+    def key(latex_source: str, **options: Any) -> str:
+        """Hash the source together with the options that affect the output."""
+        digest = hashlib.sha256()
+        for name in sorted(options):
+            digest.update(f"{name}={options[name]}\0".encode("utf-8"))
+        digest.update(latex_source.encode("utf-8"))
+        return digest.hexdigest()[:32]
+
+    def filename(self, key: str) -> str:
+        return f"resume_{key}.pdf"
+
+    def path(self, key: str) -> Path:
+        return self.directory / self.filename(key)
+
+    async def lookup(self, *keys: str) -> Optional[str]:
+        """Return the cached PDF filename for the first key present, or None.
+
+        Several keys can be given when more than one cached variant would
+        satisfy the request; they count as a single lookup.
+        """
+        filename = await async_files.run_io(self._touch, keys)
+        if filename:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return filename
+
+    def _touch(self, keys: Iterable[str]) -> Optional[str]:
+        for key in keys:
+            path = self.path(key)
+            try:
+                # Bump mtime so eviction treats the entry as recently used
+                os.utime(path)
+            except FileNotFoundError:
+                continue
+            return path.name
+        return None
+
+    def store(self, key: str, pdf_path: Path) -> str:
+        """Copy a freshly compiled PDF into the cache and return its filename."""
+        target = self.path(key)
+        tmp_path = self.directory / f".{target.name}.{uuid.uuid4().hex[:8]}.tmp"
+        shutil.copy(pdf_path, tmp_path)
+        os.replace(tmp_path, target)
+        return target.name
+
+    def evict(self, protected: Iterable[str] = ()) -> int:
+        """Drop expired entries, then the least recently used until under quota.
+
+        Filenames in ``protected`` are never removed. Returns bytes reclaimed.
+        """
+        if not self._evict_lock.acquire(blocking=False):
+            # Another eviction pass is already running
+            return 0
+        try:
+            return self._evict(set(protected))
+        finally:
+            self._evict_lock.release()
+
+    def _evict(self, protected: set) -> int:
+        now = time.time()
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if not is_cached_pdf_name(entry.name):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.name))
+            total += stat.st_size
+
+        reclaimed = 0
+        entries.sort()
+        for mtime, size, name in entries:
+            expired = now - mtime > self.max_age_seconds
+            if not expired and total - reclaimed <= self.max_bytes:
+                break
+            if name in protected:
+                continue
+            try:
+                (self.directory / name).unlink()
+            except FileNotFoundError:
+                continue
+            reclaimed += size
+            self.evictions += 1
+
+        if reclaimed:
+            self.evicted_bytes += reclaimed
+            logger.info(f"Evicted {reclaimed} bytes from CV compile cache")
+        return reclaimed
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "evictions": self.evictions,
+            "evicted_bytes": self.evicted_bytes,
+            "max_bytes": self.max_bytes,
+            "max_age_seconds": self.max_age_seconds,
+        }
@@ -0,0 +1,266 @@
+"""
+Bounded worker pool for LaTeX compilation.
+
+Compile jobs are queued and picked up by a fixed number of worker tasks, so
+at most ``workers`` TeX processes run at once and a slow compile never blocks
+the event loop.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.models.cv import CompilationResult, CompileJob, CompileJobStatus
+from app.services.cv_metrics import COMPILE_JOBS, QUEUE_WAIT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+CompileFunc = Callable[..., Awaitable[CompilationResult]]
+CompleteCallback = Callable[[CompilationResult], Awaitable[None]]
+
+# Finished jobs kept around so clients can still poll their status
+MAX_FINISHED_JOBS = 256
+
+_FINISHED_STATUSES = (
+    CompileJobStatus.COMPLETED,
+    CompileJobStatus.FAILED,
+    CompileJobStatus.CANCELLED,
+)
+
+
+class CompileQueueFullError(Exception):
+    """Raised when the compile queue cannot accept more jobs."""
+
+
+class CompilePool:
+    """Fixed-size pool of compile workers fed from a bounded queue."""
+
+    def __init__(self, compile_func: CompileFunc, workers: int, queue_size: int, timeout: int):
+        self._compile_func = compile_func
+        self.workers = max(1, workers)
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._jobs: "OrderedDict[str, CompileJob]" = OrderedDict()
+        self._sources: Dict[str, str] = {}
+        self._options: Dict[str, Dict[str, Any]] = {}
+        self._callbacks: Dict[str, CompleteCallback] = {}
+        self._futures: Dict[str, asyncio.Future] = {}
+        self._running: Dict[str, asyncio.Task] = {}
+        self._cancel_reasons: Dict[str, str] = {}
+        self._stopping = False
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._queue.qsize() if self._queue else 0
+
+    @property
+    def active_jobs(self) -> int:
+        """Number of jobs currently compiling."""
+        return len(self._running)
+
+    async def start(self):
+        """Start the worker tasks on the running event loop."""
+        if self._worker_tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(), name=f"cv-compile-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(f"Started CV compile pool with {self.workers} workers")
+
+    async def stop(self):
+        """Cancel queued and running jobs and stop the workers."""
+        self._stopping = True
+        for job_id in list(self._jobs):
+            self.cancel(job_id)
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._queue = None
+        self._stopping = False
+
+    async def submit(self, latex_source: str,
+                     on_complete: Optional[CompleteCallback] = None,
+                     **options: Any) -> CompileJob:
+        """Queue a compile job and return immediately.
+
+        Extra keyword ``options`` are passed through to the compile function.
+        """
+        await self.start()
+
+        job = CompileJob(id=uuid.uuid4().hex, created_at=datetime.now())
+        try:
+            self._queue.put_nowait(job.id)
+        except asyncio.QueueFull:
+            raise CompileQueueFullError("Compile queue is full")
+
+        self._jobs[job.id] = job
+        self._sources[job.id] = latex_source
+        self._options[job.id] = options
+        self._futures[job.id] = asyncio.get_running_loop().create_future()
+        if on_complete:
+            self._callbacks[job.id] = on_complete
+        self._trim_finished()
+        return job
+
+    def record(self, result: CompilationResult) -> CompileJob:
+        """Register a job that was satisfied without compiling, e.g. from cache."""
+        now = datetime.now()
+        status = CompileJobStatus.COMPLETED if result.success else CompileJobStatus.FAILED
+        job = CompileJob(
+            id=uuid.uuid4().hex,
+            status=status,
+            result=result,
+            created_at=now,
+            started_at=now,
+            finished_at=now
+        )
+        self._jobs[job.id] = job
+        self._trim_finished()
+        return job
+
+    async def run(self, latex_source: str, **options: Any) -> CompilationResult:
+        """Queue a compile job and wait for its result."""
+        job = await self.submit(latex_source, **options)
+        return await self.wait(job.id)
+
+    async def wait(self, job_id: str) -> CompilationResult:
+        """Wait for a submitted job to finish and return its result."""
+        job = self._jobs[job_id]
+        future = self._futures.get(job_id)
+        if future is None:
+            return job.result
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The caller went away, so nobody is waiting for this compile
+            self.cancel(job_id)
+            raise
+
+    def on_finished(self, job_id: str, callback: Callable[[], None]):
+        """Call ``callback`` once the job finishes, however it ends."""
+        future = self._futures.get(job_id)
+        if future is None:
+            callback()
+        else:
+            future.add_done_callback(lambda _: callback())
+
+    def get_job(self, job_id: str) -> Optional[CompileJob]:
+        """Get a job by ID."""
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str, reason: str = "Compilation cancelled") -> bool:
+        """Cancel a queued or running job. Returns False if it already finished."""
+        job = self._jobs.get(job_id)
+        if not job or job.status in _FINISHED_STATUSES:
+            return False
+
+        if job.status == CompileJobStatus.QUEUED:
+            # The worker skips it when it comes off the queue
+            self._finish(job, CompileJobStatus.CANCELLED, self._failure(reason, 0))
+            return True
+
+        job.status = CompileJobStatus.CANCELLED
+        self._cancel_reasons[job_id] = reason
+        task = self._running.get(job_id)
+        if task:
+            task.cancel()
+        return True
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._execute(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"CV compile worker failed on job {job_id}: {e}", exc_info=True)
+            finally:
+                self._queue.task_done()
+
+    async def _execute(self, job_id: str):
+        job = self._jobs.get(job_id)
+        if not job or job.status != CompileJobStatus.QUEUED:
+            return
+
+        job.status = CompileJobStatus.RUNNING
+        job.started_at = datetime.now()
+        QUEUE_WAIT_SECONDS.observe((job.started_at - job.created_at).total_seconds())
+        start_time = time.time()
+
+        task = asyncio.create_task(
+            asyncio.wait_for(
+                self._compile_func(self._sources[job_id], **self._options[job_id]),
+                self.timeout
+            )
+        )
+        self._running[job_id] = task
+        try:
+            result = await task
+            status = CompileJobStatus.COMPLETED if result.success else CompileJobStatus.FAILED
+        except asyncio.TimeoutError:
+            status = CompileJobStatus.FAILED
+            result = self._failure(f"Compilation timed out after {self.timeout} seconds", start_time)
+        except asyncio.CancelledError:
+            task.cancel()
+            status = CompileJobStatus.CANCELLED
+            reason = self._cancel_reasons.pop(job_id, "Compilation cancelled")
+            result = self._failure(reason, start_time)
+            if self._stopping:
+                # The worker itself is being stopped
+                self._finish(job, status, result)
+                raise
+        except Exception as e:
+            status = CompileJobStatus.FAILED
+            result = self._failure(f"Compilation error: {str(e)}", start_time)
+        finally:
+            self._running.pop(job_id, None)
+
+        self._finish(job, status, result)
+
+        callback = self._callbacks.pop(job_id, None)
+        if callback and result.success:
+            try:
+                await callback(result)
+            except Exception as e:
+                logger.error(f"CV compile callback failed for job {job_id}: {e}", exc_info=True)
+
+    def _finish(self, job: CompileJob, status: CompileJobStatus, result: CompilationResult):
+        job.status = status
+        job.result = result
+        job.finished_at = datetime.now()
+        COMPILE_JOBS.labels(status.value).inc()
+        self._sources.pop(job.id, None)
+        self._options.pop(job.id, None)
+        if status == CompileJobStatus.CANCELLED:
+            self._callbacks.pop(job.id, None)
+
+        future = self._futures.pop(job.id, None)
+        if future and not future.done():
+            future.set_result(result)
+
+    def _trim_finished(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in _FINISHED_STATUSES]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+    @staticmethod
+    def _failure(message: str, start_time: float) -> CompilationResult:
+        elapsed = int((time.time() - start_time) * 1000) if start_time else 0
+        return CompilationResult(
+            success=False,
+            pdf_path=None,
+            errors=[message],
+            warnings=[],
+            compilation_time_ms=elapsed
+        )
@@ -0,0 +1,222 @@
+"""
+Background cleanup for CV storage.
+
+Compiled PDFs and incremental build directories accumulate with every edit
+session. The janitor periodically removes PDFs that are neither referenced
+by a CV document nor among the latest few for their document, drops build
+directories of documents that no longer exist, and enforces a disk quota,
+giving up recent PDFs only when nothing else is left to remove.
+LaTeX sources are the documents themselves, so they count towards usage
+but are never deleted here.
+"""
+
+import asyncio
+import logging
+import os
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _is_pdf_artifact(name: str) -> bool:
+    return (name.startswith("resume_") and name.endswith(".pdf")) or name.endswith(".tmp")
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.stat(os.path.join(root, name)).st_size
+            except FileNotFoundError:
+                continue
+    return total
+
+
+class StorageJanitor:
+    """Applies the CV storage retention policy on a fixed interval."""
+
+    def __init__(
+        self,
+        pdf_dir: Path,
+        build_dir: Path,
+        source_dir: Path,
+        referenced_pdfs: Callable[[], Set[str]],
+        retained_pdfs: Callable[[], Set[str]],
+        live_builds: Callable[[], Set[str]],
+        busy_builds: Callable[[], Set[str]],
+        quota_bytes: int,
+        grace_seconds: int,
+        interval_seconds: int,
+        refresh: Optional[Callable[[], Awaitable[None]]] = None
+    ):
+        self.pdf_dir = pdf_dir
+        self.build_dir = build_dir
+        self.source_dir = source_dir
+        self._referenced_pdfs = referenced_pdfs
+        self._retained_pdfs = retained_pdfs
+        self._live_builds = live_builds
+        self._busy_builds = busy_builds
+        self._refresh = refresh
+        self.quota_bytes = quota_bytes
+        self.grace_seconds = grace_seconds
+        self.interval_seconds = interval_seconds
+        self.total_reclaimed = 0
+        self.last_report: Optional[Dict] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the periodic cleanup task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name="cv-storage-janitor")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def run_once(self) -> Dict:
+        """Run one cleanup pass off the event loop and return its report."""
+        if self._refresh:
+            # References may have changed in another worker
+            await self._refresh()
+        # Snapshot the in-memory references on the loop; the sweep runs in a thread
+        referenced = set(self._referenced_pdfs())
+        retained = set(self._retained_pdfs()) | referenced
+        live_builds = set(self._live_builds())
+        busy_builds = set(self._busy_builds())
+        report = await asyncio.to_thread(
+            self._sweep, referenced, retained, live_builds, busy_builds
+        )
+        self.total_reclaimed += report["bytes_reclaimed"]
+        self.last_report = report
+        if report["bytes_reclaimed"]:
+            logger.info(
+                f"CV storage janitor reclaimed {report['bytes_reclaimed']} bytes "
+                f"({report['files_deleted']} files), {report['bytes_in_use']} bytes in use"
+            )
+        return report
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"CV storage janitor failed: {e}", exc_info=True)
+            await asyncio.sleep(self.interval_seconds)
+
+    def _sweep(
+        self,
+        referenced: Set[str],
+        retained: Set[str],
+        live_builds: Set[str],
+        busy_builds: Set[str]
+    ) -> Dict:
+        now = time.time()
+        deleted = 0
+        reclaimed = 0
+
+        # Candidates for quota enforcement: (retained, mtime, size, path, is_dir)
+        evictable: List[Tuple[bool, float, int, Path, bool]] = []
+        in_use = 0
+
+        for entry in os.scandir(self.pdf_dir):
+            if not entry.is_file() or not _is_pdf_artifact(entry.name):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            path = Path(entry.path)
+            expired = now - stat.st_mtime > self.grace_seconds
+            if entry.name not in retained and expired:
+                if self._remove(path):
+                    deleted += 1
+                    reclaimed += stat.st_size
+                continue
+            in_use += stat.st_size
+            if entry.name not in referenced and not entry.name.endswith(".tmp"):
+                evictable.append((entry.name in retained, stat.st_mtime, stat.st_size, path, False))
+
+        if self.build_dir.exists():
+            for entry in os.scandir(self.build_dir):
+                if not entry.is_dir():
+                    continue
+                path = Path(entry.path)
+                size = _tree_size(path)
+                mtime = entry.stat().st_mtime
+                if entry.name not in live_builds and now - mtime > self.grace_seconds:
+                    if self._remove(path, is_dir=True):
+                        deleted += 1
+                        reclaimed += size
+                    continue
+                in_use += size
+                if entry.name not in busy_builds:
+                    # Build directories only speed up the next compile
+                    evictable.append((False, mtime, size, path, True))
+
+        if self.source_dir.exists():
+            for entry in os.scandir(self.source_dir):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                # Leftovers from interrupted write-then-rename saves
+                if entry.name.endswith(".tmp") and now - stat.st_mtime > self.grace_seconds:
+                    if self._remove(Path(entry.path)):
+                        deleted += 1
+                        reclaimed += stat.st_size
+                    continue
+                in_use += stat.st_size
+
+        # Over quota: drop the oldest unretained artifacts first, then the
+        # latest-per-document ones; referenced PDFs are never removed
+        evictable.sort(key=lambda item: (item[0], item[1]))
+        for _, _, size, path, is_dir in evictable:
+            if in_use <= self.quota_bytes:
+                break
+            if self._remove(path, is_dir=is_dir):
+                deleted += 1
+                reclaimed += size
+                in_use -= size
+
+        if in_use > self.quota_bytes:
+            logger.warning(
+                f"CV storage is {in_use} bytes, over the {self.quota_bytes} byte quota, "
+                "after removing everything unreferenced"
+            )
+
+        return {
+            "ran_at": datetime.now(),
+            "files_deleted": deleted,
+            "bytes_reclaimed": reclaimed,
+            "bytes_in_use": in_use,
+            "quota_bytes": self.quota_bytes,
+        }
+
+    @staticmethod
+    def _remove(path: Path, is_dir: bool = False) -> bool:
+        try:
+            if is_dir:
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f"CV storage janitor could not remove {path}: {e}")
+            return False
+
+    def stats(self) -> Dict:
+        return {
+            "total_bytes_reclaimed": self.total_reclaimed,
+            "last_run": self.last_report,
+            "quota_bytes": self.quota_bytes,
+            "interval_seconds": self.interval_seconds,
+        }
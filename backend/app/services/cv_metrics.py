@@ -0,0 +1,93 @@
+"""
+Metrics for the CV compile engine.
+
+Phase timings, queue wait and per-template compile times are histograms so
+pool sizing and slow templates show up in percentiles, not just averages.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from app.core.metrics import registry
+from app.models.cv import TexDiagnostic
+
+COMPILE_PHASE_SECONDS = registry.histogram(
+    "cv_compile_phase_seconds",
+    "Time spent in each phase of a CV compile (write, format, pass_N, latexmk, copy, evict)",
+    ["phase"]
+)
+COMPILE_SECONDS = registry.histogram(
+    "cv_compile_seconds",
+    "End-to-end CV compile time by template and result",
+    ["template", "result"]
+)
+QUEUE_WAIT_SECONDS = registry.histogram(
+    "cv_compile_queue_wait_seconds",
+    "Time compile jobs wait in the queue before a worker picks them up",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+)
+COMPILE_JOBS = registry.counter(
+    "cv_compile_jobs_total",
+    "Finished compile jobs by status; cache hits are counted as cached",
+    ["status"]
+)
+TEX_PASSES = registry.counter(
+    "cv_compile_tex_passes_total",
+    "pdflatex passes run"
+)
+TEX_DIAGNOSTICS = registry.counter(
+    "cv_tex_diagnostics_total",
+    "Errors, warnings and bad boxes parsed from TeX logs",
+    ["level"]
+)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Time a block as one compile phase."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        COMPILE_PHASE_SECONDS.labels(name).observe(time.perf_counter() - start)
+
+
+def record_diagnostics(diagnostics: List[TexDiagnostic]):
+    for diagnostic in diagnostics:
+        TEX_DIAGNOSTICS.labels(diagnostic.level).inc()
+
+
+def register_engine(compile_pool, compile_cache, warm_formats):
+    """Expose pool and cache state that is tracked elsewhere."""
+    registry.callback(
+        "cv_compile_queue_depth", "Compile jobs waiting for a worker",
+        lambda: compile_pool.queue_depth
+    )
+    registry.callback(
+        "cv_compile_active_jobs", "Compile jobs currently running",
+        lambda: compile_pool.active_jobs
+    )
+    registry.callback(
+        "cv_compile_workers", "Size of the compile worker pool",
+        lambda: compile_pool.workers
+    )
+    registry.callback(
+        "cv_compile_cache_lookups_total", "Compile cache lookups by result",
+        lambda: {("hit",): compile_cache.hits, ("miss",): compile_cache.misses},
+        ["result"], kind="counter"
+    )
+    registry.callback(
+        "cv_compile_cache_hit_ratio", "Share of compile cache lookups that were hits",
+        lambda: compile_cache.stats()["hit_rate"]
+    )
+    registry.callback(
+        "cv_compile_cache_evicted_bytes_total", "Bytes evicted from the compile cache",
+        lambda: compile_cache.evicted_bytes, kind="counter"
+    )
+    registry.callback(
+        "cv_warm_format_compiles_total",
+        "Compiles that used a precompiled format, or fell back to the plain engine",
+        lambda: {("hit",): warm_formats.hits, ("fallback",): warm_formats.fallbacks},
+        ["result"], kind="counter"
+    )
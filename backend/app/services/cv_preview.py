@@ -0,0 +1,131 @@
+"""
+Preview thumbnails for CV templates.
+
+A template's preview is its first page rendered to PNG. Previews are cached
+on disk under a hash of the template source and render settings, so one is
+only rendered again after the template's LaTeX changes. A missing preview
+is rendered in the background when it is first asked for, not at boot, so
+starting a worker never runs TeX; requests only ever read the cache.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from app.services import latex
+
+logger = logging.getLogger(__name__)
+
+# Compiles LaTeX source and returns the PDF on disk, or None on failure
+RenderPdf = Callable[[str], Awaitable[Optional[Path]]]
+
+
+def pdftoppm_args(pdf_path: Path, output_prefix: Path, dpi: int) -> list:
+    """Rasterize the first page of a PDF to ``<output_prefix>.png``."""
+    return [
+        "pdftoppm",
+        "-png",
+        "-f", "1",
+        "-l", "1",
+        "-singlefile",
+        "-r", str(dpi),
+        str(pdf_path),
+        str(output_prefix)
+    ]
+
+
+class TemplatePreviews:
+    """Content-hashed PNG cache of template first pages."""
+
+    def __init__(self, directory: Path, render_pdf: RenderPdf, dpi: int):
+        self.directory = directory
+        self.dpi = dpi
+        self._render_pdf = render_pdf
+        self._rendering: Dict[str, asyncio.Task] = {}
+        self._failed: Set[str] = set()
+
+    def key(self, template_source: str) -> str:
+        digest = hashlib.sha256(f"dpi={self.dpi}\0".encode("utf-8"))
+        digest.update(template_source.encode("utf-8"))
+        return digest.hexdigest()[:32]
+
+    def path(self, template_id: str, key: str) -> Path:
+        return self.directory / f"preview_{template_id}_{key}.png"
+
+    def lookup(self, template_id: str, template_source: str) -> Tuple[str, Optional[Path]]:
+        """Return the preview's key and its file, if it has been rendered."""
+        key = self.key(template_source)
+        path = self.path(template_id, key)
+        return key, path if path.is_file() else None
+
+    def pending(self, key: str) -> bool:
+        """Whether a preview is being rendered, as opposed to having failed."""
+        return key in self._rendering
+
+    async def stop(self):
+        tasks = list(self._rendering.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._rendering.clear()
+
+    def schedule(self, template_id: str, template_source: str):
+        """Start rendering a preview unless it exists, failed, or is in progress."""
+        key, path = self.lookup(template_id, template_source)
+        if path or key in self._failed or key in self._rendering:
+            return
+        task = asyncio.create_task(
+            self._render(template_id, key, template_source),
+            name=f"cv-template-preview-{template_id}"
+        )
+        self._rendering[key] = task
+        task.add_done_callback(lambda _: self._rendering.pop(key, None))
+
+    async def _render(self, template_id: str, key: str, template_source: str):
+        try:
+            pdf_path = await self._render_pdf(template_source)
+            if pdf_path is None:
+                logger.warning(f"Template {template_id} failed to compile, no preview rendered")
+                self._failed.add(key)
+                return
+            if await self._rasterize(template_id, key, pdf_path):
+                logger.info(f"Rendered preview for template {template_id}")
+            else:
+                self._failed.add(key)
+        except FileNotFoundError:
+            logger.warning("pdftoppm not found, template previews are unavailable")
+            self._failed.add(key)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Rendering preview for template {template_id} failed: {e}", exc_info=True)
+            self._failed.add(key)
+
+    async def _rasterize(self, template_id: str, key: str, pdf_path: Path) -> bool:
+        await asyncio.to_thread(self.directory.mkdir, parents=True, exist_ok=True)
+        # Render next to the target so the final rename stays on one filesystem
+        workdir = Path(await asyncio.to_thread(tempfile.mkdtemp, dir=self.directory))
+        try:
+            output_prefix = workdir / "preview"
+            output = await latex.run_tex(pdftoppm_args(pdf_path, output_prefix, self.dpi), workdir)
+            rendered = output_prefix.with_suffix(".png")
+            if not rendered.exists():
+                logger.warning(f"pdftoppm produced no preview for template {template_id}: {output.strip()}")
+                return False
+            await asyncio.to_thread(self._install, template_id, key, rendered)
+            return True
+        finally:
+            await asyncio.to_thread(shutil.rmtree, workdir, True)
+
+    def _install(self, template_id: str, key: str, rendered: Path):
+        target = self.path(template_id, key)
+        os.replace(rendered, target)
+        # Previews of earlier versions of the template are never served again
+        for stale in self.directory.glob(f"preview_{template_id}_{'[0-9a-f]' * 32}.png"):
+            if stale != target:
+                stale.unlink(missing_ok=True)
@@ -0,0 +1,194 @@
+"""
+Helpers for driving TeX engines and reading their output.
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import signal
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from app.models.cv import TexDiagnostic
+
+# Log lines that mean another pass would change the output
+RERUN_PATTERN = re.compile(
+    r"Rerun to get|Rerun LaTeX|Label\(s\) may have changed|Please rerun LaTeX"
+)
+
+# "! Message" errors point at their source line with a following "l.<n> ..." line
+ERROR_LINE_PATTERN = re.compile(r"^l\.(\d+) ?(.*)$")
+# Errors in -file-line-error style: "./resume.tex:12: Message"
+FILE_LINE_ERROR_PATTERN = re.compile(r"^(?:\./)?[^\s:]+\.tex:(\d+): (.*)$")
+WARNING_PATTERN = re.compile(r"^(?:LaTeX|Package (\S+)|Class (\S+)) Warning: (.*)$")
+INPUT_LINE_PATTERN = re.compile(r"on input line (\d+)")
+BADBOX_PATTERN = re.compile(r"^((?:Over|Under)full \\[hv]box \([^)]*\)).*?lines? (\d+)")
+
+# Lines searched after a "!" error for its "l.<n>" pointer
+ERROR_CONTEXT_LINES = 12
+MAX_DIAGNOSTICS = 50
+
+# Aux entries that feed back into the next pass
+AUX_REFERENCE_PREFIXES = ("\\newlabel", "\\bibcite", "\\@writefile", "\\citation")
+
+
+async def run_tex(args: List[str], workdir: Path) -> str:
+    """Run a TeX command without blocking the event loop and return its output."""
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        cwd=str(workdir),
+        start_new_session=True
+    )
+    try:
+        stdout, _ = await process.communicate()
+    except asyncio.CancelledError:
+        # Don't leave TeX (or anything it spawned) running after a timeout
+        # or cancellation
+        if process.returncode is None:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            await process.wait()
+        raise
+    return stdout.decode("utf-8", errors="replace")
+
+
+def pdflatex_args(tex_path: Path, workdir: Path, fmt: Optional[Path] = None) -> List[str]:
+    args = ["pdflatex", "-interaction=nonstopmode"]
+    if fmt:
+        args.append(f"-fmt={fmt}")
+    return args + ["-output-directory", str(workdir), str(tex_path)]
+
+
+def format_args(preamble_path: Path, workdir: Path, jobname: str) -> List[str]:
+    """Dump a preamble into ``<jobname>.fmt`` with mylatexformat."""
+    return [
+        "pdflatex",
+        "-ini",
+        "-interaction=nonstopmode",
+        f"-jobname={jobname}",
+        "-output-directory", str(workdir),
+        "&pdflatex",
+        "mylatexformat.ltx",
+        str(preamble_path)
+    ]
+
+
+def latexmk_args(tex_path: Path, workdir: Path) -> List[str]:
+    return [
+        "latexmk",
+        "-pdf",
+        "-interaction=nonstopmode",
+        f"-outdir={workdir}",
+        str(tex_path)
+    ]
+
+
+def read_log(log_path: Path, fallback: str = "") -> str:
+    """Read a TeX .log file, falling back to captured stdout."""
+    try:
+        return log_path.read_text(encoding="utf-8", errors="replace")
+    except FileNotFoundError:
+        return fallback
+
+
+def aux_digest(aux_path: Path) -> Optional[str]:
+    """Hash the cross-reference entries of an .aux file.
+
+    Only entries that a later pass reads back are included, so the boilerplate
+    hyperref writes on every run does not force a rerun.
+    """
+    try:
+        content = aux_path.read_text(encoding="utf-8", errors="replace")
+    except FileNotFoundError:
+        return None
+    digest = hashlib.sha256()
+    for line in content.splitlines():
+        if line.startswith(AUX_REFERENCE_PREFIXES):
+            digest.update(line.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def needs_rerun(log: str, aux_before: Optional[str], aux_after: Optional[str]) -> bool:
+    """Whether another pass is needed to settle cross-references."""
+    if RERUN_PATTERN.search(log):
+        return True
+    empty = hashlib.sha256().hexdigest()
+    return (aux_before or empty) != (aux_after or empty)
+
+
+def collect_messages(log: str) -> Tuple[List[str], List[str]]:
+    """Pull error and warning lines out of TeX output."""
+    errors: List[str] = []
+    warnings: List[str] = []
+    for line in log.split("\n"):
+        if line.startswith("!"):
+            errors.append(line)
+        elif "Warning" in line:
+            warnings.append(line)
+    return errors, warnings
+
+
+def _warning_text(lines: List[str], start: int, package: Optional[str]) -> str:
+    """Join a warning with its continuation lines."""
+    parts = [lines[start]]
+    continuation = f"({package})" if package else None
+    for line in lines[start + 1:start + 6]:
+        if not line.strip() or line.startswith(("!", "LaTeX ", "Package ", "Class ")):
+            break
+        if continuation and line.startswith(continuation):
+            line = line[len(continuation):]
+        parts.append(line.strip())
+    return " ".join(part.strip() for part in parts)
+
+
+def parse_log(log: str) -> List[TexDiagnostic]:
+    """Parse a TeX log into errors, warnings and bad boxes with line numbers."""
+    diagnostics: List[TexDiagnostic] = []
+    lines = log.split("\n")
+    for index, line in enumerate(lines):
+        if len(diagnostics) >= MAX_DIAGNOSTICS:
+            break
+
+        if line.startswith("! "):
+            diagnostic = TexDiagnostic(level="error", message=line[2:].strip())
+            for follow in lines[index + 1:index + 1 + ERROR_CONTEXT_LINES]:
+                match = ERROR_LINE_PATTERN.match(follow)
+                if match:
+                    diagnostic.line = int(match.group(1))
+                    diagnostic.context = match.group(2).strip() or None
+                    break
+            diagnostics.append(diagnostic)
+            continue
+
+        match = FILE_LINE_ERROR_PATTERN.match(line)
+        if match:
+            diagnostics.append(TexDiagnostic(
+                level="error", message=match.group(2).strip(), line=int(match.group(1))
+            ))
+            continue
+
+        match = WARNING_PATTERN.match(line)
+        if match:
+            package = match.group(1) or match.group(2)
+            text = _warning_text(lines, index, package)
+            message = text.split(" Warning: ", 1)[1]
+            input_line = INPUT_LINE_PATTERN.search(message)
+            diagnostics.append(TexDiagnostic(
+                level="warning",
+                message=message,
+                line=int(input_line.group(1)) if input_line else None,
+                package=package
+            ))
+            continue
+
+        match = BADBOX_PATTERN.match(line)
+        if match:
+            diagnostics.append(TexDiagnostic(
+                level="badbox", message=match.group(1), line=int(match.group(2))
+            ))
+    return diagnostics
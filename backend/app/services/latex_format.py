@@ -0,0 +1,193 @@
+"""
+Precompiled TeX formats for the moderncv template preambles.
+
+Most of a small CV compile is spent loading the LaTeX kernel, moderncv and
+its packages. A format file dumped from the class and package lines of a
+template preamble (via mylatexformat) lets pdflatex start with all of that
+already loaded. Only preambles matching a registered template get a format;
+anything else, or a format that TeX refuses to load, falls back to the plain
+engine.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from app.services import latex
+from app.utils import async_files
+
+logger = logging.getLogger(__name__)
+
+# Preamble lines that only load the class, packages and style; these go
+# into the format. Everything after them (personal data etc.) is read at
+# compile time as usual.
+FORMAT_LINE_PATTERN = re.compile(
+    r"^\s*(?:\\documentclass|\\usepackage|\\RequirePackage|\\moderncvstyle|\\moderncvcolor)\b"
+)
+
+# Tells mylatexformat where the dumped part of the preamble ends. Spelled via
+# \csname so the source still compiles unchanged without the format.
+END_OF_DUMP = r"\csname endofdump\endcsname"
+
+# pdflatex output when a format file is missing, corrupt or from another TeX build
+FORMAT_FAILURE_PATTERN = re.compile(
+    r"I can't find the format file|Fatal format file error|was written by"
+)
+
+
+def split_preamble(latex_source: str) -> Optional[Tuple[str, int]]:
+    """Find the leading class/package lines of a document.
+
+    Returns the dumpable prefix and the index of its last line, or None if
+    the document doesn't start with a class declaration.
+    """
+    lines = latex_source.split("\n")
+    last = None
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if FORMAT_LINE_PATTERN.match(line):
+            last = index
+        elif stripped and not stripped.startswith("%"):
+            break
+    if last is None or not lines[0].lstrip().startswith("\\documentclass"):
+        return None
+    return "\n".join(lines[:last + 1]), last
+
+
+def format_unusable(output: str) -> bool:
+    """Whether pdflatex rejected the format it was given."""
+    return bool(FORMAT_FAILURE_PATTERN.search(output))
+
+
+class WarmFormats:
+    """Builds and hands out format files for known template preambles."""
+
+    def __init__(self, directory: Path, templates: Iterable[str]):
+        self.directory = directory
+        # prefix hash -> prefix, for preambles we are willing to dump
+        self._prefixes: Dict[str, str] = {}
+        for template in templates:
+            split = split_preamble(template)
+            if split:
+                self._prefixes[self._hash(split[0])] = split[0]
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._failed: Set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.fallbacks = 0
+
+    @staticmethod
+    def _hash(prefix: str) -> str:
+        return hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:16]
+
+    def path(self, prefix_hash: str) -> Path:
+        return self.directory / f"moderncv_{prefix_hash}.fmt"
+
+    async def start(self):
+        """Build the formats for all templates in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._build_all(), name="cv-warm-formats")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _build_all(self):
+        for prefix_hash in list(self._prefixes):
+            await self._ensure(prefix_hash)
+
+    async def prepare(self, latex_source: str) -> Optional[Tuple[Path, str]]:
+        """Get a format for a document and the source to compile with it.
+
+        Returns None when the document has to be compiled without a format.
+        """
+        split = split_preamble(latex_source)
+        if split is None:
+            self.fallbacks += 1
+            return None
+        prefix, last = split
+        prefix_hash = self._hash(prefix)
+        if prefix_hash not in self._prefixes:
+            self.fallbacks += 1
+            return None
+
+        fmt_path = await self._ensure(prefix_hash)
+        if fmt_path is None:
+            self.fallbacks += 1
+            return None
+
+        # Mark the end of the dumped preamble on its last line, so TeX line
+        # numbers in errors still match the user's source
+        lines = latex_source.split("\n")
+        lines[last] += END_OF_DUMP
+        self.hits += 1
+        return fmt_path, "\n".join(lines)
+
+    async def discard(self, fmt_path: Path):
+        """Drop a format pdflatex couldn't load; it is rebuilt on next use."""
+        logger.warning(f"Discarding unusable TeX format {fmt_path.name}")
+        await async_files.unlink(fmt_path)
+
+    async def _ensure(self, prefix_hash: str) -> Optional[Path]:
+        fmt_path = self.path(prefix_hash)
+        if await async_files.run_io(fmt_path.exists):
+            return fmt_path
+        if prefix_hash in self._failed:
+            return None
+
+        lock = self._locks.setdefault(prefix_hash, asyncio.Lock())
+        async with lock:
+            if await async_files.run_io(fmt_path.exists):
+                return fmt_path
+            if prefix_hash in self._failed:
+                return None
+            if await self._build(self._prefixes[prefix_hash], fmt_path):
+                return fmt_path
+            # Don't retry a build that failed until the process restarts
+            self._failed.add(prefix_hash)
+            return None
+
+    async def _build(self, prefix: str, fmt_path: Path) -> bool:
+        await async_files.makedirs(self.directory)
+        # Build next to the target so the final rename stays on one filesystem
+        workdir = Path(await async_files.run_io(tempfile.mkdtemp, dir=self.directory))
+        try:
+            preamble_path = workdir / "preamble.tex"
+            await async_files.write_text(
+                preamble_path,
+                f"{prefix}\n{END_OF_DUMP}\n\\begin{{document}}\n\\end{{document}}\n"
+            )
+            jobname = fmt_path.stem
+            output = await latex.run_tex(
+                latex.format_args(preamble_path, workdir, jobname), workdir
+            )
+            built = workdir / f"{jobname}.fmt"
+            if not await async_files.run_io(built.exists):
+                errors, _ = latex.collect_messages(output)
+                logger.warning(
+                    f"Could not build TeX format {jobname}, compiling without it: "
+                    f"{errors[:1] or output.strip().splitlines()[-1:]}"
+                )
+                return False
+            await async_files.run_io(os.replace, built, fmt_path)
+            logger.info(f"Built TeX format {jobname}")
+            return True
+        except FileNotFoundError:
+            logger.warning("pdflatex not found, compiling without a precompiled format")
+            return False
+        finally:
+            await async_files.rmtree(workdir)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "formats": sum(1 for h in self._prefixes if self.path(h).exists()),
+            "hits": self.hits,
+            "fallbacks": self.fallbacks,
+        }
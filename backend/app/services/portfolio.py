@@ -3,6 +3,7 @@ from datetime import datetime
 import uuid
 import logging
 from app.schemas.portfolio import ProjectCreate, ProjectUpdate, ProjectResponse
+from app.core.state_store import state_store
 
 logger = logging.getLogger(__name__)
 
@@ -79,15 +80,26 @@ class PortfolioService:
                 updated_at=datetime.now()
             )
         ]
-    
+
+        # Shared across workers when a shared state backend is configured
+        self._state = state_store.register("portfolio", self._dump_state, self._load_state)
+
+    def _dump_state(self) -> list:
+        return [item.model_dump(mode="json") for item in self.projects]
+
+    def _load_state(self, data: list):
+        self.projects = [ProjectResponse.model_validate(item) for item in data]
+
     async def get_all_projects(self, featured: Optional[bool] = None) -> List[ProjectResponse]:
         """Get all projects with optional filtering"""
+        await self._state.sync()
         if featured is not None:
             return [p for p in self.projects if p.featured == featured]
         return self.projects
     
     async def get_project_by_id(self, project_id: str) -> Optional[ProjectResponse]:
         """Get specific project by ID"""
+        await self._state.sync()
         for project in self.projects:
             if project.id == project_id:
                 return project
@@ -95,39 +107,42 @@ class PortfolioService:
     
     async def create_project(self, project_data: ProjectCreate) -> ProjectResponse:
         """Create a new project"""
-        try:
-            project_id = str(uuid.uuid4())
-            new_project = ProjectResponse(
-                id=project_id,
-                **project_data.dict(),
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            )
-            self.projects.append(new_project)
-            logger.info(f"Created new project: {new_project.title}")
-            return new_project
-        except Exception as e:
-            logger.error(f"Error creating project: {str(e)}")
-            raise
+        async with self._state.write():
+            try:
+                project_id = str(uuid.uuid4())
+                new_project = ProjectResponse(
+                    id=project_id,
+                    **project_data.dict(),
+                    created_at=datetime.now(),
+                    updated_at=datetime.now()
+                )
+                self.projects.append(new_project)
+                logger.info(f"Created new project: {new_project.title}")
+                return new_project
+            except Exception as e:
+                logger.error(f"Error creating project: {str(e)}")
+                raise
     
     async def update_project(self, project_id: str, update_data: ProjectUpdate) -> Optional[ProjectResponse]:
         """Update an existing project"""
-        for i, project in enumerate(self.projects):
-            if project.id == project_id:
-                update_dict = update_data.dict(exclude_unset=True)
-                if update_dict:
-                    for field, value in update_dict.items():
-                        setattr(project, field, value)
-                    project.updated_at = datetime.now()
-                    logger.info(f"Updated project: {project.title}")
-                return project
-        return None
+        async with self._state.write():
+            for i, project in enumerate(self.projects):
+                if project.id == project_id:
+                    update_dict = update_data.dict(exclude_unset=True)
+                    if update_dict:
+                        for field, value in update_dict.items():
+                            setattr(project, field, value)
+                        project.updated_at = datetime.now()
+                        logger.info(f"Updated project: {project.title}")
+                    return project
+            return None
     
     async def delete_project(self, project_id: str) -> bool:
         """Delete a project"""
-        for i, project in enumerate(self.projects):
-            if project.id == project_id:
-                del self.projects[i]
-                logger.info(f"Deleted project: {project_id}")
-                return True
-        return False
\ No newline at end of file
+        async with self._state.write():
+            for i, project in enumerate(self.projects):
+                if project.id == project_id:
+                    del self.projects[i]
+                    logger.info(f"Deleted project: {project_id}")
+                    return True
+            return False
\ No newline at end of file
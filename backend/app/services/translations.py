@@ -3,18 +3,25 @@ Translation services for handling multilingual content.
 Returns in-memory defaults when the database is not available.
 """
 
+import asyncio
 import asyncpg
 import json
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import sys
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime, timedelta
 
 from app.core.config import settings
+from app.core.db_pool import DatabasePool, db_pool
+from app.core.metrics import registry
+from app.core.response_cache import mark_degraded
+from app.core.state_store import state_store
 from app.models.translations import (
     Language, TranslationKey, TranslationValue, Translation,
     TranslatedHero, TranslatedAbout, TranslatedProject,
     TranslatedTechSkill, TranslatedAchievement, TranslatedExperience,
-    TranslatedContactInfo, TranslationsResponse, LanguagesResponse
+    TranslatedContactInfo, TranslationsResponse, LanguagesResponse,
+    ImportRowError, TranslationImportResult
 )
 
 logger = logging.getLogger(__name__)
@@ -29,74 +36,344 @@ DEFAULT_LANGUAGES = [
              created_at=datetime.utcnow(), updated_at=datetime.utcnow()),
 ]
 
+# A content table's rows with their translated fields. {table}, {where} and
+# {order_by} are fixed per call site; $1 is the table name and $2 the
+# language fallback chain, most preferred first.
+TRANSLATED_ROWS_QUERY = """
+    WITH base AS (
+        SELECT * FROM {table} {where}
+    ),
+    resolved AS (
+        SELECT DISTINCT ON (t.record_id, t.field_name)
+            t.record_id, t.field_name, t.content
+        FROM translations t
+        JOIN base ON t.record_id = base.id::text
+        WHERE t.table_name = $1 AND t.language_code = ANY($2::text[])
+        ORDER BY t.record_id, t.field_name, array_position($2::text[], t.language_code)
+    )
+    SELECT b.*, (
+        SELECT json_object_agg(r.field_name, r.content)
+        FROM resolved r
+        WHERE r.record_id = b.id::text
+    ) AS resolved_translations
+    FROM base b
+    {order_by}
+"""
 
-class TranslationService:
-    def __init__(self):
-        self.connection = None
-        self._db_available = None  # None = not checked yet
+# Bulk imports: the columns each row carries, the ones identifying it, and the
+# statements that reject rows referring to unknown rows elsewhere and upsert
+# the rest. Rows are staged in the temp table import_rows.
+IMPORT_KINDS: Dict[str, Dict[str, Any]] = {
+    "content": {
+        "columns": ["table_name", "record_id", "field_name", "language_code", "content"],
+        "identity": ["table_name", "record_id", "field_name", "language_code"],
+        "reject": """
+            DELETE FROM import_rows i
+            WHERE NOT EXISTS (SELECT 1 FROM languages l WHERE l.code = i.language_code)
+            RETURNING i.row_no, 'unknown language: ' || i.language_code AS error
+        """,
+        # One row per (table_name, language_code): rows written, and how many
+        # of them were new (xmax is 0 for a freshly inserted row)
+        "upsert": """
+            WITH upserted AS (
+                INSERT INTO translations (table_name, record_id, field_name, language_code, content, created_at, updated_at)
+                SELECT table_name, record_id, field_name, language_code, content, $1, $1
+                FROM import_rows
+                ON CONFLICT (table_name, record_id, field_name, language_code)
+                DO UPDATE SET
+                    content = EXCLUDED.content,
+                    updated_at = EXCLUDED.updated_at
+                RETURNING table_name, language_code, (xmax = 0) AS inserted
+            )
+            SELECT table_name, language_code,
+                COUNT(*) AS written,
+                COUNT(*) FILTER (WHERE inserted) AS inserted
+            FROM upserted
+            GROUP BY table_name, language_code
+        """,
+    },
+    "ui": {
+        "columns": ["key", "language_code", "value"],
+        "identity": ["key", "language_code"],
+        "reject": """
+            DELETE FROM import_rows i
+            WHERE NOT EXISTS (SELECT 1 FROM languages l WHERE l.code = i.language_code)
+               OR NOT EXISTS (SELECT 1 FROM translation_keys k WHERE k.key = i.key)
+            RETURNING i.row_no, CASE
+                WHEN NOT EXISTS (SELECT 1 FROM languages l WHERE l.code = i.language_code)
+                THEN 'unknown language: ' || i.language_code
+                ELSE 'unknown key: ' || i.key
+            END AS error
+        """,
+        "upsert": """
+            INSERT INTO translation_values (key, language_code, value, created_at, updated_at)
+            SELECT key, language_code, value, $1, $1
+            FROM import_rows
+            ON CONFLICT (key, language_code)
+            DO UPDATE SET
+                value = EXCLUDED.value,
+                updated_at = EXCLUDED.updated_at
+        """,
+    },
+}
 
-    async def get_connection(self):
-        """Get database connection, returns None if unavailable"""
-        if self._db_available is False:
-            return None
-        if self.connection:
-            return self.connection
+
+class TranslationCatalog:
+    """UI translations for every language, held in memory.
+
+    Loaded in full once, then kept current by polling for rows updated since
+    ``overlap`` before the newest ``updated_at`` seen so far. ``updated_at``
+    comes from each writer's clock and rows can commit out of timestamp order
+    (a bulk import racing a single edit, clock skew between hosts), so each
+    poll looks back over the overlap again; rows already applied are
+    skipped. Readers always get a complete dict: a reload swaps in a new one
+    per changed language instead of editing the one being served.
+    """
+
+    def __init__(self, pool: DatabasePool, poll_seconds: float, overlap_seconds: float):
+        self.pool = pool
+        self.poll_seconds = poll_seconds
+        self.overlap = timedelta(seconds=overlap_seconds)
+        self.loaded = False
+        self._languages: Dict[str, Dict[str, str]] = {}
+        self._high_water = datetime.min
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def get(self, language_code: str) -> Dict[str, str]:
+        return self._languages.get(language_code, {})
+
+    async def start(self):
         try:
-            self.connection = await asyncpg.connect(settings.database_url)
-            self._db_available = True
-            return self.connection
+            await self.refresh()
         except Exception as e:
-            logger.warning(f"Database connection unavailable for translations: {e}")
-            self._db_available = False
-            return None
+            logger.warning(f"Failed to load UI translations, retrying in the background: {e}")
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name="translation-catalog-reload")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def refresh(self):
+        """Load everything on first use, afterwards only rows changed since the last load"""
+        db = await self.pool.get()
+        if not db:
+            return
+        async with self._lock:
+            if not self.loaded:
+                rows = await db.fetch("""
+                    SELECT tv.key, tv.language_code, tv.value, tv.updated_at
+                    FROM translation_values tv
+                    JOIN translation_keys tk ON tv.key = tk.key
+                    ORDER BY tk.category, tv.key
+                """)
+            else:
+                since = self._high_water
+                if since - datetime.min > self.overlap:
+                    since -= self.overlap
+                rows = await db.fetch("""
+                    SELECT tv.key, tv.language_code, tv.value, tv.updated_at
+                    FROM translation_values tv
+                    JOIN translation_keys tk ON tv.key = tk.key
+                    WHERE tv.updated_at >= $1
+                    ORDER BY tk.category, tv.key
+                """, since)
+            changes: Dict[str, Dict[str, str]] = {}
+            for row in rows:
+                if self._languages.get(row['language_code'], {}).get(row['key']) == row['value']:
+                    continue
+                # Every language repeats the same keys; store each string once
+                changes.setdefault(row['language_code'], {})[sys.intern(row['key'])] = row['value']
+                if row['updated_at'] and row['updated_at'] > self._high_water:
+                    self._high_water = row['updated_at']
+            for language_code, values in changes.items():
+                self._languages[language_code] = {**self._languages.get(language_code, {}), **values}
+            if not self.loaded:
+                logger.info(f"Loaded {len(rows)} UI translations for {len(changes)} languages")
+            self.loaded = True
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.poll_seconds)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning(f"Failed to reload UI translations: {e}")
+
+COUNT_DRIFT = registry.counter(
+    "translation_count_drift_total",
+    "Translation counts corrected by reconciliation"
+)
+
+
+class CompletenessCounters:
+    """Translated field counts per (table_name, language_code).
+
+    translations is unique on (table_name, record_id, field_name,
+    language_code), so a pair's row count is its number of translated
+    fields. Writes adjust the counts as they commit; reconcile() recounts
+    from scratch at startup and every ``reconcile_seconds`` and corrects
+    any drift.
+    """
+
+    def __init__(self, pool: DatabasePool, reconcile_seconds: int):
+        self.pool = pool
+        self.reconcile_seconds = reconcile_seconds
+        self.loaded = False
+        # table_name -> language_code -> count
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._task: Optional[asyncio.Task] = None
+        # Shared across workers when a shared state backend is configured
+        self._state = state_store.register("translation_counts", self._dump_state, self._load_state)
+
+    def _dump_state(self) -> dict:
+        return {"loaded": self.loaded, "counts": self._counts}
+
+    def _load_state(self, data: dict):
+        self.loaded = data["loaded"]
+        self._counts = data["counts"]
+
+    async def start(self):
+        try:
+            await self.reconcile()
+        except Exception as e:
+            logger.warning(f"Failed to count translations, retrying on first use: {e}")
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name="translation-count-reconcile")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
 
-    async def close_connection(self):
-        """Close database connection"""
-        if self.connection:
-            await self.connection.close()
-            self.connection = None
+    async def adjust(self, changes: Dict[Tuple[str, str], int]):
+        """Apply committed inserts (+) and deletes (-) per (table_name, language_code)"""
+        changes = {pair: delta for pair, delta in changes.items() if delta}
+        if not changes:
+            return
+        async with self._state.write():
+            if not self.loaded:
+                # Counted in full on next use
+                return
+            for (table_name, language_code), delta in changes.items():
+                languages = self._counts.setdefault(table_name, {})
+                languages[language_code] = languages.get(language_code, 0) + delta
+
+    async def reconcile(self) -> int:
+        """Recount from the translations table; returns how many counts were wrong"""
+        db = await self.pool.get()
+        if not db:
+            return 0
+        rows = await db.fetch("""
+            SELECT table_name, language_code, COUNT(*) AS translated
+            FROM translations
+            GROUP BY table_name, language_code
+        """)
+        counts: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            counts.setdefault(row['table_name'], {})[row['language_code']] = row['translated']
+        # A write committing between the recount and this swap shows up as
+        # drift and is put right by the next reconcile
+        async with self._state.write():
+            drift = 0
+            if self.loaded:
+                pairs = {(t, l) for t, ls in (*counts.items(), *self._counts.items()) for l in ls}
+                drift = sum(
+                    1 for t, l in pairs
+                    if counts.get(t, {}).get(l, 0) != self._counts.get(t, {}).get(l, 0)
+                )
+                if drift:
+                    logger.warning(f"Corrected {drift} drifted translation counts")
+                    COUNT_DRIFT.inc(drift)
+            self._counts = counts
+            self.loaded = True
+        return drift
+
+    async def completeness(self) -> Dict[str, Dict[str, float]]:
+        """Per table, each language's translated fields as a percentage of English's"""
+        await self._state.sync()
+        if not self.loaded:
+            await self.reconcile()
+            if not self.loaded:
+                mark_degraded()
+                return {}
+        completeness = {}
+        for table_name, languages in self._counts.items():
+            total = languages.get(settings.default_language, 0)
+            if total > 0:
+                completeness[table_name] = {
+                    language_code: (translated / total) * 100
+                    for language_code, translated in languages.items()
+                }
+        return completeness
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.reconcile_seconds)
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.warning(f"Failed to reconcile translation counts: {e}")
+
+
+class TranslationService:
+    def __init__(self, pool: DatabasePool = db_pool):
+        self.pool = pool
+        self.catalog = TranslationCatalog(
+            pool, settings.translation_catalog_poll_seconds, settings.translation_catalog_overlap_seconds
+        )
+        self.counts = CompletenessCounters(pool, settings.translation_reconcile_seconds)
+
+    async def start(self):
+        await self.catalog.start()
+        await self.counts.start()
+
+    async def stop(self):
+        await self.counts.stop()
+        await self.catalog.stop()
+
+    async def get_pool(self) -> Optional[asyncpg.Pool]:
+        """Get the database pool, returns None if unavailable.
+
+        Each query checks a connection out of the pool for its own duration,
+        so concurrent requests never share a connection.
+        """
+        return await self.pool.get()
 
     async def get_languages(self) -> List[Language]:
         """Get all available languages"""
-        conn = await self.get_connection()
-        if not conn:
+        db = await self.get_pool()
+        if not db:
+            mark_degraded()
             return DEFAULT_LANGUAGES
         try:
-            rows = await conn.fetch("SELECT * FROM languages WHERE enabled = TRUE ORDER BY code")
+            rows = await db.fetch("SELECT * FROM languages WHERE enabled = TRUE ORDER BY code")
             return [Language(**dict(row)) for row in rows]
         except Exception as e:
             logger.warning(f"Failed to fetch languages from DB: {e}")
+            mark_degraded()
             return DEFAULT_LANGUAGES
 
     async def get_ui_translations(self, language_code: str = "en") -> Dict[str, str]:
-        """Get all UI translations for a specific language"""
-        conn = await self.get_connection()
-        if not conn:
-            return {}
-        try:
-            rows = await conn.fetch("""
-                SELECT tv.key, tv.value
-                FROM translation_values tv
-                JOIN translation_keys tk ON tv.key = tk.key
-                WHERE tv.language_code = $1
-                ORDER BY tk.category, tv.key
-            """, language_code)
-            return {row['key']: row['value'] for row in rows}
-        except Exception as e:
-            logger.warning(f"Failed to fetch UI translations: {e}")
-            return {}
+        """Get all UI translations for a specific language, from the in-memory catalog"""
+        return self.catalog.get(language_code)
 
     async def get_content_translations(self, table_name: str, record_ids: List[str],
                                      language_code: str = "en") -> Dict[str, Dict[str, str]]:
         """Get content translations for specific records"""
         if not record_ids:
             return {}
-        conn = await self.get_connection()
-        if not conn:
+        db = await self.get_pool()
+        if not db:
+            mark_degraded()
             return {}
         try:
             placeholders = ', '.join([f'${i+3}' for i in range(len(record_ids))])
-            rows = await conn.fetch(f"""
+            rows = await db.fetch(f"""
                 SELECT record_id, field_name, content
                 FROM translations
                 WHERE table_name = $1 AND language_code = $2 AND record_id IN ({placeholders})
@@ -110,110 +387,104 @@ class TranslationService:
             return translations
         except Exception as e:
             logger.warning(f"Failed to fetch content translations: {e}")
+            mark_degraded()
             return {}
 
+    def fallback_chain(self, language_code: str) -> List[str]:
+        """Languages to take translated fields from, most preferred first"""
+        chain = [language_code, *settings.translation_fallbacks.get(language_code, []), settings.default_language]
+        return list(dict.fromkeys(chain))
+
+    async def _fetch_translated(self, db: asyncpg.Pool, table_name: str, language_code: str,
+                                where: str = "", order_by: str = "") -> List[Dict[str, Any]]:
+        """Rows of a content table, each with its translations resolved along the fallback chain.
+
+        One statement: DISTINCT ON keeps, per field, the translation in the
+        most preferred language available, and the result is folded into a
+        JSON object next to each row.
+        """
+        rows = await db.fetch(TRANSLATED_ROWS_QUERY.format(
+            table=table_name, where=where, order_by=order_by
+        ), table_name, self.fallback_chain(language_code))
+        records = []
+        for row in rows:
+            data = dict(row)
+            translations = data.pop('resolved_translations')
+            if isinstance(translations, str):
+                translations = json.loads(translations)
+            data['translations'] = {language_code: translations} if translations else {}
+            records.append(data)
+        return records
+
     async def get_hero_with_translations(self, language_code: str = "en") -> Optional[TranslatedHero]:
         """Get hero data with translations"""
-        conn = await self.get_connection()
-        if not conn:
+        db = await self.get_pool()
+        if not db:
+            mark_degraded()
             return None
         try:
-            hero_row = await conn.fetchrow("SELECT * FROM hero WHERE id = 'hero'")
-            if not hero_row:
+            rows = await self._fetch_translated(db, "hero", language_code, where="WHERE id = 'hero'")
+            if not rows:
                 return None
-            translations = await self.get_content_translations("hero", ["hero"], language_code)
-            if language_code != "en":
-                en_translations = await self.get_content_translations("hero", ["hero"], "en")
-                if "hero" in en_translations:
-                    if "hero" not in translations:
-                        translations["hero"] = {}
-                    translations["hero"] = {**en_translations["hero"], **translations.get("hero", {})}
-            hero_data = dict(hero_row)
-            hero_data['translations'] = {language_code: translations.get("hero", {})} if translations.get("hero") else {}
+            hero_data = rows[0]
             if 'metrics' in hero_data and isinstance(hero_data['metrics'], str):
                 hero_data['metrics'] = json.loads(hero_data['metrics'])
             return TranslatedHero(**hero_data)
         except Exception as e:
             logger.warning(f"Failed to fetch hero with translations: {e}")
+            mark_degraded()
             return None
 
     async def get_about_with_translations(self, language_code: str = "en") -> Optional[TranslatedAbout]:
         """Get about data with translations"""
-        conn = await self.get_connection()
-        if not conn:
+        db = await self.get_pool()
+        if not db:
+            mark_degraded()
             return None
         try:
-            about_row = await conn.fetchrow("SELECT * FROM about WHERE id = 'about'")
-            if not about_row:
+            rows = await self._fetch_translated(db, "about", language_code, where="WHERE id = 'about'")
+            if not rows:
                 return None
-            translations = await self.get_content_translations("about", ["about"], language_code)
-            if language_code != "en":
-                en_translations = await self.get_content_translations("about", ["about"], "en")
-                if "about" in en_translations:
-                    if "about" not in translations:
-                        translations["about"] = {}
-                    translations["about"] = {**en_translations["about"], **translations.get("about", {})}
-            about_data = dict(about_row)
-            about_data['translations'] = {language_code: translations.get("about", {})} if translations.get("about") else {}
-            return TranslatedAbout(**about_data)
+            return TranslatedAbout(**rows[0])
         except Exception as e:
             logger.warning(f"Failed to fetch about with translations: {e}")
+            mark_degraded()
             return None
 
     async def get_contact_info_with_translations(self, language_code: str = "en") -> Optional[TranslatedContactInfo]:
         """Get contact info with translations"""
-        conn = await self.get_connection()
-        if not conn:
+        db = await self.get_pool()
+        if not db:
+            mark_degraded()
             return None
         try:
-            contact_row = await conn.fetchrow("SELECT * FROM contact_info WHERE id = 'contact'")
-            if not contact_row:
+            rows = await self._fetch_translated(db, "contact_info", language_code, where="WHERE id = 'contact'")
+            if not rows:
                 return None
-            translations = await self.get_content_translations("contact_info", ["contact"], language_code)
-            if language_code != "en":
-                en_translations = await self.get_content_translations("contact_info", ["contact"], "en")
-                if "contact" in en_translations:
-                    if "contact" not in translations:
-                        translations["contact"] = {}
-                    translations["contact"] = {**en_translations["contact"], **translations.get("contact", {})}
-            contact_data = dict(contact_row)
-            contact_data['translations'] = {language_code: translations.get("contact", {})} if translations.get("contact") else {}
+            contact_data = rows[0]
             if 'social_links' in contact_data and isinstance(contact_data['social_links'], str):
                 contact_data['social_links'] = json.loads(contact_data['social_links'])
             return TranslatedContactInfo(**contact_data)
         except Exception as e:
             logger.warning(f"Failed to fetch contact info with translations: {e}")
+            mark_degraded()
             return None
 
     async def get_projects_with_translations(self, language_code: str = "en",
                                            featured_only: bool = False) -> List[TranslatedProject]:
         """Get projects with translations"""
-        conn = await self.get_connection()
-        if not conn:
+        db = await self.get_pool()
+        if not db:
+            mark_degraded()
             return []
         try:
-            query = "SELECT * FROM projects"
-            params = []
-            if featured_only:
-                query += " WHERE featured = TRUE"
-            query += " ORDER BY created_at DESC"
-            project_rows = await conn.fetch(query, *params)
-            if not project_rows:
-                return []
-            project_ids = [row['id'] for row in project_rows]
-            translations = await self.get_content_translations("projects", project_ids, language_code)
-            if language_code != "en":
-                en_translations = await self.get_content_translations("projects", project_ids, "en")
-                for project_id in project_ids:
-                    if project_id in en_translations:
-                        if project_id not in translations:
-                            translations[project_id] = {}
-                        translations[project_id] = {**en_translations[project_id], **translations.get(project_id, {})}
+            rows = await self._fetch_translated(
+                db, "projects", language_code,
+                where="WHERE featured = TRUE" if featured_only else "",
+                order_by="ORDER BY b.created_at DESC"
+            )
             projects = []
-            for row in project_rows:
-                project_data = dict(row)
-                project_id = project_data['id']
-                project_data['translations'] = {language_code: translations.get(project_id, {})} if translations.get(project_id) else {}
+            for project_data in rows:
                 if 'impact' in project_data and isinstance(project_data['impact'], str):
                     project_data['impact'] = json.loads(project_data['impact'])
                 if 'stats' in project_data and isinstance(project_data['stats'], str):
@@ -222,120 +493,115 @@ class TranslationService:
             return projects
         except Exception as e:
             logger.warning(f"Failed to fetch projects with translations: {e}")
+            mark_degraded()
             return []
 
     async def get_tech_skills_with_translations(self, language_code: str = "en") -> List[TranslatedTechSkill]:
         """Get tech skills with translations"""
-        conn = await self.get_connection()
-        if not conn:
+        db = await self.get_pool()
+        if not db:
+            mark_degraded()
             return []
         try:
-            skill_rows = await conn.fetch("SELECT * FROM tech_skills ORDER BY level DESC, name")
-            if not skill_rows:
-                return []
-            skill_ids = [row['id'] for row in skill_rows]
-            translations = await self.get_content_translations("tech_skills", skill_ids, language_code)
-            if language_code != "en":
-                en_translations = await self.get_content_translations("tech_skills", skill_ids, "en")
-                for skill_id in skill_ids:
-                    if skill_id in en_translations:
-                        if skill_id not in translations:
-                            translations[skill_id] = {}
-                        translations[skill_id] = {**en_translations[skill_id], **translations.get(skill_id, {})}
-            skills = []
-            for row in skill_rows:
-                skill_data = dict(row)
-                skill_id = skill_data['id']
-                skill_data['translations'] = {language_code: translations.get(skill_id, {})} if translations.get(skill_id) else {}
-                skills.append(TranslatedTechSkill(**skill_data))
-            return skills
+            rows = await self._fetch_translated(
+                db, "tech_skills", language_code, order_by="ORDER BY b.level DESC, b.name"
+            )
+            return [TranslatedTechSkill(**skill_data) for skill_data in rows]
         except Exception as e:
             logger.warning(f"Failed to fetch tech skills with translations: {e}")
+            mark_degraded()
             return []
 
     async def get_achievements_with_translations(self, language_code: str = "en") -> List[TranslatedAchievement]:
         """Get achievements with translations"""
-        conn = await self.get_connection()
-        if not conn:
+        db = await self.get_pool()
+        if not db:
+            mark_degraded()
             return []
         try:
-            achievement_rows = await conn.fetch("SELECT * FROM achievements ORDER BY percentage DESC, created_at")
-            if not achievement_rows:
-                return []
-            achievement_ids = [row['id'] for row in achievement_rows]
-            translations = await self.get_content_translations("achievements", achievement_ids, language_code)
-            if language_code != "en":
-                en_translations = await self.get_content_translations("achievements", achievement_ids, "en")
-                for achievement_id in achievement_ids:
-                    if achievement_id in en_translations:
-                        if achievement_id not in translations:
-                            translations[achievement_id] = {}
-                        translations[achievement_id] = {**en_translations[achievement_id], **translations.get(achievement_id, {})}
-            achievements = []
-            for row in achievement_rows:
-                achievement_data = dict(row)
-                achievement_id = achievement_data['id']
-                achievement_data['translations'] = {language_code: translations.get(achievement_id, {})} if translations.get(achievement_id) else {}
-                achievements.append(TranslatedAchievement(**achievement_data))
-            return achievements
+            rows = await self._fetch_translated(
+                db, "achievements", language_code, order_by="ORDER BY b.percentage DESC, b.created_at"
+            )
+            return [TranslatedAchievement(**achievement_data) for achievement_data in rows]
         except Exception as e:
             logger.warning(f"Failed to fetch achievements with translations: {e}")
+            mark_degraded()
             return []
 
     async def get_experiences_with_translations(self, language_code: str = "en") -> List[TranslatedExperience]:
         """Get experiences with translations"""
-        conn = await self.get_connection()
-        if not conn:
+        db = await self.get_pool()
+        if not db:
+            mark_degraded()
             return []
         try:
-            experience_rows = await conn.fetch("SELECT * FROM experiences ORDER BY current DESC, created_at DESC")
-            if not experience_rows:
-                return []
-            experience_ids = [row['id'] for row in experience_rows]
-            translations = await self.get_content_translations("experiences", experience_ids, language_code)
-            if language_code != "en":
-                en_translations = await self.get_content_translations("experiences", experience_ids, "en")
-                for experience_id in experience_ids:
-                    if experience_id in en_translations:
-                        if experience_id not in translations:
-                            translations[experience_id] = {}
-                        translations[experience_id] = {**en_translations[experience_id], **translations.get(experience_id, {})}
-            experiences = []
-            for row in experience_rows:
-                experience_data = dict(row)
-                experience_id = experience_data['id']
-                experience_data['translations'] = {language_code: translations.get(experience_id, {})} if translations.get(experience_id) else {}
-                experiences.append(TranslatedExperience(**experience_data))
-            return experiences
+            rows = await self._fetch_translated(
+                db, "experiences", language_code, order_by="ORDER BY b.current DESC, b.created_at DESC"
+            )
+            return [TranslatedExperience(**experience_data) for experience_data in rows]
         except Exception as e:
             logger.warning(f"Failed to fetch experiences with translations: {e}")
+            mark_degraded()
             return []
 
+    async def get_page_bundle(self, language_code: str = "en",
+                              featured_only: bool = False) -> Optional[Dict[str, Any]]:
+        """Every homepage section with translations, fetched concurrently.
+
+        None while the database is unavailable. A section whose query fails
+        falls back on its own and marks the bundle degraded, which keeps it
+        out of the response cache.
+        """
+        if not await self.get_pool():
+            return None
+        hero, about, contact, projects, tech_skills, achievements, experiences = await asyncio.gather(
+            self.get_hero_with_translations(language_code),
+            self.get_about_with_translations(language_code),
+            self.get_contact_info_with_translations(language_code),
+            self.get_projects_with_translations(language_code, featured_only),
+            self.get_tech_skills_with_translations(language_code),
+            self.get_achievements_with_translations(language_code),
+            self.get_experiences_with_translations(language_code),
+        )
+        return {
+            "language_code": language_code,
+            "hero": hero,
+            "about": about,
+            "contact": contact,
+            "projects": projects,
+            "tech_skills": tech_skills,
+            "achievements": achievements,
+            "experiences": experiences,
+        }
+
     async def add_or_update_translation(self, table_name: str, record_id: str, field_name: str,
                                       language_code: str, content: str) -> Translation:
         """Add or update a translation"""
-        conn = await self.get_connection()
-        if not conn:
+        db = await self.get_pool()
+        if not db:
             raise Exception("Database not available for write operations")
         now = datetime.utcnow()
-        row = await conn.fetchrow("""
+        row = await db.fetchrow("""
             INSERT INTO translations (table_name, record_id, field_name, language_code, content, created_at, updated_at)
             VALUES ($1, $2, $3, $4, $5, $6, $7)
             ON CONFLICT (table_name, record_id, field_name, language_code)
             DO UPDATE SET
                 content = EXCLUDED.content,
                 updated_at = EXCLUDED.updated_at
-            RETURNING *
+            RETURNING *, (xmax = 0) AS inserted
         """, table_name, record_id, field_name, language_code, content, now, now)
-        return Translation(**dict(row))
+        translation = dict(row)
+        if translation.pop('inserted'):
+            await self.counts.adjust({(table_name, language_code): 1})
+        return Translation(**translation)
 
     async def add_or_update_ui_translation(self, key: str, language_code: str, value: str) -> TranslationValue:
         """Add or update a UI translation"""
-        conn = await self.get_connection()
-        if not conn:
+        db = await self.get_pool()
+        if not db:
             raise Exception("Database not available for write operations")
         now = datetime.utcnow()
-        row = await conn.fetchrow("""
+        row = await db.fetchrow("""
             INSERT INTO translation_values (key, language_code, value, created_at, updated_at)
             VALUES ($1, $2, $3, $4, $5)
             ON CONFLICT (key, language_code)
@@ -344,54 +610,99 @@ class TranslationService:
                 updated_at = EXCLUDED.updated_at
             RETURNING *
         """, key, language_code, value, now, now)
+        try:
+            # Serve the change from this worker right away; others pick it up on their next poll
+            await self.catalog.refresh()
+        except Exception as e:
+            logger.warning(f"Failed to reload UI translations: {e}")
         return TranslationValue(**dict(row))
 
+    def _validate_import(self, kind: str, rows: List[Any]) -> Tuple[List[tuple], List[ImportRowError]]:
+        """Records ready for COPY, plus errors for rows that are malformed or repeat an earlier row"""
+        spec = IMPORT_KINDS[kind]
+        columns, identity = spec["columns"], spec["identity"]
+        records, errors = [], []
+        seen: Dict[tuple, int] = {}
+        for row_no, row in enumerate(rows, start=1):
+            if not isinstance(row, dict):
+                errors.append(ImportRowError(row=row_no, error="expected an object"))
+                continue
+            missing = [column for column in columns if not isinstance(row.get(column), str)
+                       or (column in identity and not row[column])]
+            if missing:
+                errors.append(ImportRowError(row=row_no, error=f"missing or invalid: {', '.join(missing)}"))
+                continue
+            key = tuple(row[column] for column in identity)
+            if key in seen:
+                errors.append(ImportRowError(row=row_no, error=f"duplicate of row {seen[key]}"))
+                continue
+            seen[key] = row_no
+            records.append((row_no, *(row[column] for column in columns)))
+        return records, errors
+
+    async def import_translations(self, kind: str, rows: List[Any]) -> TranslationImportResult:
+        """Add or update many content ("content") or UI ("ui") translations at once.
+
+        Valid rows are streamed into a temp table with COPY and upserted with
+        one INSERT ... ON CONFLICT, all in one transaction. Rows that are
+        malformed, repeated or refer to an unknown language or UI key are
+        skipped and reported.
+        """
+        db = await self.get_pool()
+        if not db:
+            raise Exception("Database not available for write operations")
+        spec = IMPORT_KINDS[kind]
+        records, errors = self._validate_import(kind, rows)
+        imported = 0
+        if records:
+            columns = ", ".join(f"{column} text" for column in spec["columns"])
+            async with db.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute(f"CREATE TEMP TABLE import_rows (row_no integer, {columns}) ON COMMIT DROP")
+                    await conn.copy_records_to_table(
+                        "import_rows", records=records, columns=["row_no", *spec["columns"]]
+                    )
+                    rejected = await conn.fetch(spec["reject"])
+                    if kind == "content":
+                        written = await conn.fetch(spec["upsert"], datetime.utcnow())
+                    else:
+                        status = await conn.execute(spec["upsert"], datetime.utcnow())
+            errors.extend(ImportRowError(row=row['row_no'], error=row['error']) for row in rejected)
+            if kind == "content":
+                imported = sum(row['written'] for row in written)
+                await self.counts.adjust({
+                    (row['table_name'], row['language_code']): row['inserted'] for row in written
+                })
+            else:
+                imported = int(status.split()[-1])
+                try:
+                    await self.catalog.refresh()
+                except Exception as e:
+                    logger.warning(f"Failed to reload UI translations: {e}")
+        errors.sort(key=lambda error: error.row)
+        return TranslationImportResult(kind=kind, received=len(rows), imported=imported, errors=errors)
+
     async def delete_translation(self, table_name: str, record_id: str, field_name: str, language_code: str) -> bool:
         """Delete a translation"""
-        conn = await self.get_connection()
-        if not conn:
+        db = await self.get_pool()
+        if not db:
             raise Exception("Database not available for write operations")
-        result = await conn.execute("""
+        result = await db.execute("""
             DELETE FROM translations
             WHERE table_name = $1 AND record_id = $2 AND field_name = $3 AND language_code = $4
         """, table_name, record_id, field_name, language_code)
-        return result == "DELETE 1"
+        if result == "DELETE 1":
+            await self.counts.adjust({(table_name, language_code): -1})
+            return True
+        return False
 
     async def get_translation_completeness(self) -> Dict[str, Dict[str, float]]:
         """Get translation completeness statistics"""
-        conn = await self.get_connection()
-        if not conn:
-            return {}
         try:
-            total_keys = await conn.fetch("""
-                SELECT
-                    table_name,
-                    COUNT(DISTINCT record_id || '.' || field_name) as total_keys
-                FROM translations
-                WHERE language_code = 'en'
-                GROUP BY table_name
-            """)
-            translated_keys = await conn.fetch("""
-                SELECT
-                    table_name,
-                    language_code,
-                    COUNT(DISTINCT record_id || '.' || field_name) as translated_keys
-                FROM translations
-                GROUP BY table_name, language_code
-            """)
-            completeness = {}
-            for total_row in total_keys:
-                table_name = total_row['table_name']
-                total = total_row['total_keys']
-                completeness[table_name] = {}
-                for trans_row in translated_keys:
-                    if trans_row['table_name'] == table_name:
-                        lang_code = trans_row['language_code']
-                        translated = trans_row['translated_keys']
-                        completeness[table_name][lang_code] = (translated / total) * 100 if total > 0 else 0
-            return completeness
+            return await self.counts.completeness()
         except Exception as e:
             logger.warning(f"Failed to fetch translation completeness: {e}")
+            mark_degraded()
             return {}
 
 
@@ -0,0 +1,104 @@
+"""
+Non-blocking file operations.
+
+Storage calls run on a small dedicated thread pool so a slow or
+network-backed volume never stalls the event loop, and can't be starved
+by unrelated work on the default executor.
+"""
+
+import asyncio
+import functools
+import os
+import shutil
+import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.file_io_workers,
+            thread_name_prefix="file-io"
+        )
+    return _executor
+
+
+async def run_io(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking file operation on the file I/O executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(func, *args, **kwargs))
+
+
+def _write_bytes_atomic(path: Path, data: bytes):
+    # Write next to the target so the rename stays on one filesystem
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _copy_atomic(src: Path, dst: Path):
+    tmp_path = dst.with_name(f".{dst.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        shutil.copyfile(src, tmp_path)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+async def write_text_atomic(path: Path, text: str, encoding: str = "utf-8"):
+    """Write a file via write-then-rename, so readers never see a partial file."""
+    await run_io(_write_bytes_atomic, path, text.encode(encoding))
+
+
+async def write_text(path: Path, text: str, encoding: str = "utf-8"):
+    """Write a file in place, for scratch files nobody reads concurrently."""
+    await run_io(path.write_text, text, encoding=encoding)
+
+
+async def copy_atomic(src: Path, dst: Path):
+    """Copy a file into place via write-then-rename."""
+    await run_io(_copy_atomic, src, dst)
+
+
+async def unlink(path: Path):
+    """Remove a file if it exists."""
+    await run_io(path.unlink, missing_ok=True)
+
+
+async def rmtree(path: Path):
+    """Remove a directory tree if it exists."""
+    await run_io(shutil.rmtree, path, ignore_errors=True)
+
+
+async def makedirs(path: Path):
+    await run_io(path.mkdir, parents=True, exist_ok=True)
+
+
+async def make_temp_dir() -> Path:
+    return Path(await run_io(tempfile.mkdtemp))
+
+
+def shutdown():
+    """Stop the file I/O threads once pending operations finish."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
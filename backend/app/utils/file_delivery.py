@@ -0,0 +1,178 @@
+"""
+Conditional and range-aware file responses.
+
+Starlette's FileResponse always sends the whole body; these helpers add
+strong content-hash ETags, 304 handling for If-None-Match/If-Modified-Since
+and single-range 206 responses so repeat downloads cost no body bytes.
+"""
+
+import asyncio
+import hashlib
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import AsyncIterator, Dict, Optional, Tuple
+from urllib.parse import quote
+
+import anyio
+from fastapi import Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+
+CHUNK_SIZE = 64 * 1024
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+
+# path -> (mtime_ns, size, etag); hashes are only recomputed when a file changes
+_etag_cache: Dict[str, Tuple[int, int, str]] = {}
+_ETAG_CACHE_LIMIT = 1024
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:32]
+
+
+async def file_etag(path: Path, stat: os.stat_result) -> str:
+    """Strong ETag derived from the file's content hash."""
+    key = str(path)
+    cached = _etag_cache.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    etag = f'"{await asyncio.to_thread(_hash_file, path)}"'
+    if len(_etag_cache) >= _ETAG_CACHE_LIMIT:
+        _etag_cache.clear()
+    _etag_cache[key] = (stat.st_mtime_ns, stat.st_size, etag)
+    return etag
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches ``etag``."""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison
+    candidates = [tag.strip() for tag in header.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _not_modified_since(header: str, mtime: float) -> bool:
+    try:
+        since = parsedate_to_datetime(header).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return int(mtime) <= since
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single ``bytes=`` range. Returns None if it can't be satisfied.
+
+    Raises ValueError for ranges we don't handle, in which case the full
+    body is sent.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        raise ValueError("Only single byte ranges are supported")
+
+    start_text, _, end_text = spec.strip().partition("-")
+    if not start_text:
+        # Suffix range: the last N bytes
+        length = int(end_text)
+        if length <= 0 or size == 0:
+            # An empty file has no last N bytes to send
+            return None
+        return max(0, size - length), size - 1
+
+    start = int(start_text)
+    end = int(end_text) if end_text else size - 1
+    if start >= size or end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+async def _read_range(path: Path, start: int, end: int) -> AsyncIterator[bytes]:
+    async with await anyio.open_file(path, mode="rb") as f:
+        await f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await f.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _content_disposition(filename: str) -> str:
+    # As FileResponse does: RFC 5987 form for anything that isn't plain ASCII
+    # (or would break the quoted string)
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
+async def conditional_file_response(
+    request: Request,
+    path: Path,
+    media_type: str,
+    filename: Optional[str] = None,
+    immutable: bool = False
+) -> Response:
+    """Serve a file with ETag/Last-Modified validation and Range support."""
+    stat = await asyncio.to_thread(os.stat, path)
+    etag = await file_etag(path, stat)
+
+    headers = {
+        "ETag": etag,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL,
+        "Accept-Ranges": "bytes",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since and _not_modified_since(if_modified_since, stat.st_mtime):
+            return Response(status_code=304, headers=headers)
+
+    if filename:
+        headers["Content-Disposition"] = _content_disposition(filename)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range.strip() in (etag, headers["Last-Modified"])):
+        try:
+            byte_range = _parse_range(range_header, stat.st_size)
+        except ValueError:
+            byte_range = (0, stat.st_size - 1)
+            range_header = None
+
+        if byte_range is None:
+            headers["Content-Range"] = f"bytes */{stat.st_size}"
+            return Response(status_code=416, headers=headers)
+
+        if range_header:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+            headers["Content-Length"] = str(end - start + 1)
+            return StreamingResponse(
+                _read_range(path, start, end),
+                status_code=206,
+                media_type=media_type,
+                headers=headers
+            )
+
+    return FileResponse(
+        path=str(path),
+        media_type=media_type,
+        headers=headers,
+        stat_result=stat
+    )
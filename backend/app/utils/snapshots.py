@@ -0,0 +1,65 @@
+"""
+Pre-serialized JSON snapshots of versioned data.
+
+Data that only changes on writes is serialized once per version with orjson
+and served as bytes afterwards. The ETag is the version plus a hash of the
+body, so it is the same on every worker serving the same data and changes
+whenever the data does (including across restarts, when versions start
+over); clients revalidating an unchanged snapshot get a 304 without a body.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+from fastapi import Request, Response
+
+from app.utils.file_delivery import REVALIDATE_CACHE_CONTROL, etag_matches
+
+
+def render_snapshot(name: str, version: int, data: Any) -> Tuple[str, bytes]:
+    """Serialize ``data`` and derive its ETag, without storing it."""
+    body = orjson.dumps(data)
+    digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+    return f'"{name}-{version}-{digest}"', body
+
+
+class SnapshotStore:
+    """Serialized snapshots keyed by name, rebuilt when their version moves.
+
+    Holds at most ``max_entries`` names, dropping the least recently used.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        # name -> (version, etag, body)
+        self._snapshots: "OrderedDict[str, Tuple[int, str, bytes]]" = OrderedDict()
+
+    def lookup(self, name: str, version: int) -> Optional[Tuple[str, bytes]]:
+        """Return the ETag and body for ``name`` if it is at ``version``."""
+        snapshot = self._snapshots.get(name)
+        if snapshot is not None and snapshot[0] == version:
+            self._snapshots.move_to_end(name)
+            return snapshot[1], snapshot[2]
+        return None
+
+    def store(self, name: str, version: int, data: Any) -> Tuple[str, bytes]:
+        """Serialize ``data`` as the snapshot of ``name`` at ``version``."""
+        etag, body = render_snapshot(name, version, data)
+        self._snapshots[name] = (version, etag, body)
+        self._snapshots.move_to_end(name)
+        while len(self._snapshots) > self.max_entries:
+            self._snapshots.popitem(last=False)
+        return etag, body
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+
+def snapshot_response(request: Request, etag: str, body: bytes) -> Response:
+    """Serve a snapshot, or 304 when the client already has this version."""
+    headers = {"ETag": etag, "Cache-Control": REVALIDATE_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
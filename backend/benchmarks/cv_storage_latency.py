@@ -0,0 +1,115 @@
+"""
+Event-loop latency under concurrent CV save traffic.
+
+Runs a burst of concurrent CV source saves while a probe task measures how
+late the event loop wakes it up. "blocking" writes the source inline the way
+update_cv_document used to; "async" goes through the CV service, which
+hands the write to the file I/O executor.
+
+Use --write-delay-ms to emulate a slow or network-backed volume.
+
+    python -m benchmarks.cv_storage_latency --saves 200 --write-delay-ms 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from app.services import cv as cv_service
+from app.utils import async_files
+
+PROBE_INTERVAL = 0.001
+
+
+async def _probe(lags: list, stop: asyncio.Event):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(time.perf_counter() - start - PROBE_INTERVAL)
+
+
+def _slow_volume(delay: float):
+    """Make every source write pay an extra delay, like a network volume."""
+    original = async_files._write_bytes_atomic
+
+    def write(path, data):
+        time.sleep(delay)
+        original(path, data)
+
+    async_files._write_bytes_atomic = write
+
+
+async def _blocking_save(cv_id: str, latex_source: str, delay: float):
+    source_path = cv_service.LATEX_SOURCE_PATH / f"{cv_id}.tex"
+    time.sleep(delay)
+    with open(source_path, "w", encoding="utf-8") as f:
+        f.write(latex_source)
+
+
+async def _async_save(cv_id: str, latex_source: str, delay: float):
+    await cv_service.update_cv_document(cv_id, latex_source=latex_source)
+
+
+async def _run(mode: str, saves: int, documents: int, delay: float) -> dict:
+    docs = [
+        await cv_service.create_cv_document(cv_service.DEFAULT_LATEX_TEMPLATE, f"Bench {i}")
+        for i in range(documents)
+    ]
+    save = _blocking_save if mode == "blocking" else _async_save
+
+    lags: list = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        save(docs[i % documents].id, cv_service.DEFAULT_LATEX_TEMPLATE + f"% edit {i}\n", delay)
+        for i in range(saves)
+    ))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe
+    for doc in docs:
+        await cv_service.delete_cv_document(doc.id)
+
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    return {
+        "mode": mode,
+        "saves": saves,
+        "elapsed_s": elapsed,
+        "lag_p50_ms": statistics.median(lags_ms),
+        "lag_p99_ms": lags_ms[int(len(lags_ms) * 0.99) - 1] if len(lags_ms) > 1 else lags_ms[0],
+        "lag_max_ms": lags_ms[-1],
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--saves", type=int, default=200)
+    parser.add_argument("--documents", type=int, default=10)
+    parser.add_argument("--write-delay-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    delay = args.write_delay_ms / 1000
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cv_service.LATEX_SOURCE_PATH = Path(tmpdir)
+        _slow_volume(delay)
+
+        print(f"{'mode':<10}{'saves':>7}{'elapsed s':>11}{'lag p50 ms':>12}{'lag p99 ms':>12}{'lag max ms':>12}")
+        for mode in ("blocking", "async"):
+            r = await _run(mode, args.saves, args.documents, delay)
+            print(
+                f"{r['mode']:<10}{r['saves']:>7}{r['elapsed_s']:>11.2f}"
+                f"{r['lag_p50_ms']:>12.2f}{r['lag_p99_ms']:>12.2f}{r['lag_max_ms']:>12.2f}"
+            )
+
+    async_files.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,116 @@
+"""
+Per-request middleware overhead on a trivial endpoint.
+
+Serves a copy of /health through several stacks and times sequential
+requests over an in-process ASGI transport: no middleware, the logging and
+error middlewares as they were on BaseHTTPMiddleware ("base-http"), the
+current pure ASGI versions ("asgi"), and those plus route metrics
+("asgi+metrics"). Request logging is silenced so the numbers are the
+middleware machinery alone.
+
+    python -m benchmarks.middleware_overhead --requests 5000
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI, Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core import middleware
+from app.utils.exceptions import AppException
+
+
+class _BaseHTTPLogging(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next) -> Response:
+        start_time = time.time()
+        middleware.logger.info(f"Request: {request.method} {request.url.path}")
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        middleware.logger.info(
+            f"Response: {request.method} {request.url.path} "
+            f"- Status: {response.status_code} - Time: {process_time:.3f}s"
+        )
+        response.headers["X-Process-Time"] = str(process_time)
+        return response
+
+
+class _BaseHTTPErrors(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next) -> Response:
+        try:
+            return await call_next(request)
+        except AppException:
+            raise
+        except Exception:
+            return Response(content="Internal server error", status_code=500)
+
+
+STACKS = {
+    "none": (),
+    "base-http": (_BaseHTTPErrors, _BaseHTTPLogging),
+    "asgi": (middleware.ErrorHandlingMiddleware, middleware.LoggingMiddleware),
+    "asgi+metrics": (middleware.ErrorHandlingMiddleware, middleware.LoggingMiddleware, middleware.MetricsMiddleware),
+}
+
+
+def _build(stack) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy", "service": "bench", "version": "1.0.0"}
+
+    for cls in stack:
+        app.add_middleware(cls)
+    return app
+
+
+async def _run(name: str, requests: int, warmup: int) -> dict:
+    transport = httpx.ASGITransport(app=_build(STACKS[name]))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(warmup):
+            await client.get("/health")
+
+        timings = []
+        for _ in range(requests):
+            start = time.perf_counter()
+            response = await client.get("/health")
+            timings.append(time.perf_counter() - start)
+            assert response.status_code == 200
+
+    timings_us = sorted(t * 1e6 for t in timings)
+    return {
+        "stack": name,
+        "mean_us": statistics.fmean(timings_us),
+        "p50_us": statistics.median(timings_us),
+        "p99_us": timings_us[int(len(timings_us) * 0.99) - 1],
+        "rps": requests / sum(timings),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=200)
+    args = parser.parse_args()
+
+    middleware.logger.setLevel(logging.WARNING)
+    middleware.access_logger.setLevel(logging.WARNING)
+
+    results = [await _run(name, args.requests, args.warmup) for name in STACKS]
+    baseline = results[0]["mean_us"]
+
+    print(f"{'stack':<14}{'mean us':>10}{'p50 us':>10}{'p99 us':>10}{'req/s':>10}{'overhead us':>13}")
+    for r in results:
+        print(
+            f"{r['stack']:<14}{r['mean_us']:>10.1f}{r['p50_us']:>10.1f}{r['p99_us']:>10.1f}"
+            f"{r['rps']:>10.0f}{r['mean_us'] - baseline:>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+"""
+Where worker boot time goes.
+
+Imports app.main in a fresh interpreter with ``-X importtime`` and reports
+the most expensive app modules (self and cumulative) and third-party
+packages, then times the app's own boot phases in-process: importing
+app.main, building its routes, and running the startup hooks.
+
+    python -m benchmarks.startup_profile --top 15
+    python -m benchmarks.startup_profile --skip-startup  # no database/redis needed
+"""
+
+import argparse
+import asyncio
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def _import_times() -> list:
+    """(module, self_us, cumulative_us, depth) for each module imported by app.main."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR, capture_output=True, text=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+
+def _report_imports(rows: list, top: int):
+    app_rows = [row for row in rows if row[0] == "app" or row[0].startswith("app.")]
+    print(f"{'app module':<40}{'self ms':>10}{'cumul ms':>10}")
+    for module, self_us, cumulative_us, _ in sorted(app_rows, key=lambda r: r[1], reverse=True)[:top]:
+        print(f"{module:<40}{self_us / 1000:>10.1f}{cumulative_us / 1000:>10.1f}")
+
+    # A package's cost is charged to whichever module imported it first
+    packages = defaultdict(int)
+    for module, _, cumulative_us, _ in rows:
+        root = module.split(".")[0]
+        if root != "app" and module == root:
+            packages[root] = max(packages[root], cumulative_us)
+    print(f"\n{'third-party package':<40}{'cumul ms':>20}")
+    for package, cumulative_us in sorted(packages.items(), key=lambda p: p[1], reverse=True)[:top]:
+        print(f"{package:<40}{cumulative_us / 1000:>20.1f}")
+
+    total = sum(row[1] for row in rows)
+    app_total = sum(row[1] for row in app_rows)
+    print(f"\nimport total {total / 1000:.1f} ms, of which app code {app_total / 1000:.1f} ms")
+
+
+async def _report_boot(skip_startup: bool):
+    start = time.perf_counter()
+    from app import main
+    imported = time.perf_counter() - start
+    print(f"\n{'phase':<40}{'ms':>20}")
+    print(f"{'import app.main (in-process)':<40}{imported * 1000:>20.1f}")
+    print(f"{'routes registered':<40}{len(main.app.routes):>20}")
+    if skip_startup:
+        return
+    start = time.perf_counter()
+    await main.startup_event()
+    print(f"{'startup hooks':<40}{(time.perf_counter() - start) * 1000:>20.1f}")
+    await main.shutdown_event()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--skip-startup", action="store_true", help="don't run the startup hooks")
+    args = parser.parse_args()
+
+    _report_imports(_import_times(), args.top)
+    asyncio.run(_report_boot(args.skip_startup))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+from starlette.requests import Request
+
+
+def make_request(path: str = "/", query: str = "", headers: dict = None, method: str = "GET") -> Request:
+    """A bare Starlette request, for code that only reads the URL and headers."""
+    return Request({
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query.encode("latin-1"),
+        "headers": [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in (headers or {}).items()],
+    })
@@ -0,0 +1,88 @@
+import os
+import time
+
+import pytest
+
+from app.services.cv_cache import CompileCache, is_cached_pdf_name
+
+
+@pytest.fixture
+def cache(tmp_path):
+    directory = tmp_path / "cache"
+    directory.mkdir()
+    return CompileCache(directory, max_bytes=1000, max_age_seconds=3600)
+
+
+def _store(cache, tmp_path, source, size=100, age=0.0):
+    compiled = tmp_path / "resume.pdf"
+    compiled.write_bytes(b"x" * size)
+    filename = cache.store(cache.key(source), compiled)
+    if age:
+        stamp = time.time() - age
+        os.utime(cache.directory / filename, (stamp, stamp))
+    return filename
+
+
+def test_key_depends_on_source_and_options():
+    key = CompileCache.key("doc", engine="pdflatex")
+    assert key == CompileCache.key("doc", engine="pdflatex")
+    assert key != CompileCache.key("doc", engine="latexmk")
+    assert key != CompileCache.key("doc", engine="pdflatex", draft=True)
+    assert is_cached_pdf_name(f"resume_{key}.pdf")
+
+
+@pytest.mark.asyncio
+async def test_lookup_hit_and_miss(cache, tmp_path):
+    filename = _store(cache, tmp_path, "doc")
+
+    assert await cache.lookup(cache.key("doc")) == filename
+    assert await cache.lookup(cache.key("other")) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lookup_takes_first_present_key_as_one_lookup(cache, tmp_path):
+    filename = _store(cache, tmp_path, "draft")
+
+    assert await cache.lookup(cache.key("full"), cache.key("draft")) == filename
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 0
+
+
+@pytest.mark.asyncio
+async def test_lookup_refreshes_mtime(cache, tmp_path):
+    filename = _store(cache, tmp_path, "doc", age=600)
+    before = (cache.directory / filename).stat().st_mtime
+
+    await cache.lookup(cache.key("doc"))
+
+    assert (cache.directory / filename).stat().st_mtime > before
+
+
+def test_evict_drops_least_recently_used_over_quota(cache, tmp_path):
+    _store(cache, tmp_path, "a", size=400, age=300)
+    middle = _store(cache, tmp_path, "b", size=400, age=200)
+    newest = _store(cache, tmp_path, "c", size=400, age=100)
+
+    assert cache.evict() == 400
+    assert sorted(os.listdir(cache.directory)) == sorted([middle, newest])
+
+
+def test_evict_drops_expired_entries_under_quota(cache, tmp_path):
+    expired = _store(cache, tmp_path, "a", size=10, age=7200)
+    fresh = _store(cache, tmp_path, "b", size=10)
+
+    assert cache.evict() == 10
+    remaining = os.listdir(cache.directory)
+    assert fresh in remaining and expired not in remaining
+
+
+def test_evict_keeps_protected_entries(cache, tmp_path):
+    protected = _store(cache, tmp_path, "a", size=600, age=300)
+    other = _store(cache, tmp_path, "b", size=600, age=200)
+
+    assert cache.evict(protected={protected}) == 600
+    remaining = os.listdir(cache.directory)
+    assert protected in remaining and other not in remaining
+    assert cache.stats()["evictions"] == 1
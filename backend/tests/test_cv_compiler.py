@@ -0,0 +1,146 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from app.models.cv import CompilationResult, CompileJobStatus
+from app.services.cv_compiler import CompilePool, CompileQueueFullError
+
+
+class StubCompiler:
+    """Compile function that blocks on sources starting with "block" until released."""
+
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.calls = []
+
+    async def __call__(self, latex_source: str, **options) -> CompilationResult:
+        self.calls.append((latex_source, options))
+        if latex_source.startswith("block"):
+            self.started.set()
+            await self.release.wait()
+        return CompilationResult(success=True, pdf_path=f"/api/cv/pdf/{latex_source}.pdf")
+
+
+@pytest_asyncio.fixture
+async def pool_factory():
+    pools = []
+
+    def factory(compile_func, workers=1, queue_size=4, timeout=5):
+        pool = CompilePool(compile_func, workers=workers, queue_size=queue_size, timeout=timeout)
+        pools.append(pool)
+        return pool
+
+    yield factory
+    for pool in pools:
+        await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_run_passes_options_through(pool_factory):
+    compiler = StubCompiler()
+    pool = pool_factory(compiler)
+
+    result = await pool.run("doc", cv_id="abc", draft=True)
+
+    assert result.success
+    assert compiler.calls == [("doc", {"cv_id": "abc", "draft": True})]
+
+
+@pytest.mark.asyncio
+async def test_submit_rejects_when_queue_is_full(pool_factory):
+    compiler = StubCompiler()
+    pool = pool_factory(compiler, workers=1, queue_size=1)
+
+    running = await pool.submit("block")
+    await compiler.started.wait()
+    queued = await pool.submit("next")
+    with pytest.raises(CompileQueueFullError):
+        await pool.submit("overflow")
+
+    compiler.release.set()
+    assert (await pool.wait(running.id)).success
+    assert (await pool.wait(queued.id)).success
+    assert pool.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_job_fails_after_timeout(pool_factory):
+    compiler = StubCompiler()
+    pool = pool_factory(compiler, timeout=0.05)
+
+    job = await pool.submit("block")
+    result = await pool.wait(job.id)
+
+    assert not result.success
+    assert "timed out" in result.errors[0]
+    assert pool.get_job(job.id).status == CompileJobStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_cancel_running_job(pool_factory):
+    compiler = StubCompiler()
+    pool = pool_factory(compiler)
+
+    job = await pool.submit("block")
+    await compiler.started.wait()
+    assert pool.cancel(job.id, reason="Superseded")
+    result = await pool.wait(job.id)
+
+    assert not result.success
+    assert result.errors == ["Superseded"]
+    assert pool.get_job(job.id).status == CompileJobStatus.CANCELLED
+    assert pool.active_jobs == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_queued_job_never_compiles(pool_factory):
+    compiler = StubCompiler()
+    pool = pool_factory(compiler, workers=1)
+
+    running = await pool.submit("block")
+    await compiler.started.wait()
+    queued = await pool.submit("queued")
+    assert pool.cancel(queued.id)
+    compiler.release.set()
+    await pool.wait(running.id)
+
+    assert (await pool.wait(queued.id)).errors == ["Compilation cancelled"]
+    assert [source for source, _ in compiler.calls] == ["block"]
+    assert not pool.cancel(queued.id)
+
+
+@pytest.mark.asyncio
+async def test_on_finished_runs_however_the_job_ends(pool_factory):
+    compiler = StubCompiler()
+    pool = pool_factory(compiler)
+    finished = []
+
+    job = await pool.submit("block")
+    pool.on_finished(job.id, lambda: finished.append(job.id))
+    await compiler.started.wait()
+    pool.cancel(job.id)
+    await pool.wait(job.id)
+    await asyncio.sleep(0)
+
+    assert finished == [job.id]
+    # Already finished: called right away
+    pool.on_finished(job.id, lambda: finished.append("again"))
+    assert finished == [job.id, "again"]
+
+
+@pytest.mark.asyncio
+async def test_on_complete_only_for_successful_jobs(pool_factory):
+    compiler = StubCompiler()
+    pool = pool_factory(compiler)
+    completed = []
+
+    async def on_complete(result):
+        completed.append(result.pdf_path)
+
+    job = await pool.submit("doc", on_complete=on_complete)
+    await pool.wait(job.id)
+    await asyncio.sleep(0)
+
+    assert completed == ["/api/cv/pdf/doc.pdf"]
@@ -0,0 +1,113 @@
+import pytest
+
+from app.utils.file_delivery import _parse_range, conditional_file_response, etag_matches
+from tests.helpers import make_request
+
+
+@pytest.mark.parametrize("header, size, expected", [
+    ("bytes=0-99", 1000, (0, 99)),
+    ("bytes=100-", 1000, (100, 999)),
+    ("bytes=900-5000", 1000, (900, 999)),
+    ("bytes=-100", 1000, (900, 999)),
+    ("bytes=-5000", 1000, (0, 999)),
+    ("bytes=1000-", 1000, None),
+    ("bytes=50-10", 1000, None),
+    ("bytes=-0", 1000, None),
+    # An empty file has no range to send, suffix or not
+    ("bytes=-5", 0, None),
+    ("bytes=0-", 0, None),
+])
+def test_parse_range(header, size, expected):
+    assert _parse_range(header, size) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=0-1,5-6", "items=0-1", "bytes=a-b"])
+def test_parse_range_rejects_unsupported(header):
+    with pytest.raises(ValueError):
+        _parse_range(header, 1000)
+
+
+def test_etag_matches():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc", "def"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"def"', '"abc"')
+    assert not etag_matches(None, '"abc"')
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(bytes(range(256)) * 4)
+    return path
+
+
+async def _respond(path, **headers):
+    return await conditional_file_response(make_request("/cv.pdf", headers=headers), path, "application/pdf")
+
+
+@pytest.mark.asyncio
+async def test_full_response_carries_validators(pdf):
+    response = await _respond(pdf)
+
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["accept-ranges"] == "bytes"
+    assert "last-modified" in response.headers
+
+
+@pytest.mark.asyncio
+async def test_not_modified_for_matching_etag(pdf):
+    etag = (await _respond(pdf)).headers["etag"]
+
+    response = await _respond(pdf, **{"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_not_modified_since(pdf):
+    last_modified = (await _respond(pdf)).headers["last-modified"]
+
+    assert (await _respond(pdf, **{"If-Modified-Since": last_modified})).status_code == 304
+    # If-None-Match wins over If-Modified-Since
+    response = await _respond(pdf, **{"If-None-Match": '"other"', "If-Modified-Since": last_modified})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_partial_content(pdf):
+    response = await _respond(pdf, Range="bytes=10-19")
+
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 10-19/1024"
+    assert response.headers["content-length"] == "10"
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    assert body == bytes(range(10, 20))
+
+
+@pytest.mark.asyncio
+async def test_range_ignored_when_if_range_is_stale(pdf):
+    response = await _respond(pdf, Range="bytes=10-19", **{"If-Range": '"stale"'})
+
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_unsatisfiable_range(pdf):
+    response = await _respond(pdf, Range="bytes=5000-")
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */1024"
+
+
+@pytest.mark.asyncio
+async def test_suffix_range_of_empty_file_is_unsatisfiable(tmp_path):
+    empty = tmp_path / "empty.pdf"
+    empty.write_bytes(b"")
+
+    response = await _respond(empty, Range="bytes=-10")
+
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */0"
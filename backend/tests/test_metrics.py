@@ -0,0 +1,80 @@
+import pytest
+
+from app.core.metrics import Registry
+
+
+@pytest.fixture
+def registry():
+    return Registry()
+
+
+def test_counter_with_labels(registry):
+    requests = registry.counter("requests_total", "Requests", ["route", "status"])
+    requests.labels("/a", "200").inc()
+    requests.labels("/a", "200").inc(2)
+    requests.labels("/b", "500").inc()
+
+    assert registry.render() == (
+        "# HELP requests_total Requests\n"
+        "# TYPE requests_total counter\n"
+        'requests_total{route="/a",status="200"} 3\n'
+        'requests_total{route="/b",status="500"} 1\n'
+    )
+
+
+def test_gauge_without_labels(registry):
+    in_flight = registry.gauge("in_flight", "In flight")
+    in_flight.inc()
+    in_flight.inc()
+    in_flight.dec()
+
+    assert registry.render().splitlines()[-1] == "in_flight 1"
+
+
+def test_histogram_buckets_are_cumulative(registry):
+    latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        latency.observe(value)
+
+    assert registry.render().splitlines()[2:] == [
+        'latency_seconds_bucket{le="0.1"} 2',
+        'latency_seconds_bucket{le="1"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        "latency_seconds_sum 2.65",
+        "latency_seconds_count 4",
+    ]
+
+
+def test_callback_is_read_at_render_time(registry):
+    depth = {"value": 1}
+    registry.callback("queue_depth", "Queue depth", lambda: depth["value"])
+    registry.callback("lookups_total", "Lookups", lambda: {("hit",): 3, ("miss",): 1}, ["result"], kind="counter")
+    depth["value"] = 5
+
+    lines = registry.render().splitlines()
+    assert "queue_depth 5" in lines
+    assert "# TYPE lookups_total counter" in lines
+    assert 'lookups_total{result="hit"} 3' in lines
+
+
+def test_label_values_are_escaped(registry):
+    registry.counter("paths_total", "Paths", ["path"]).labels('a"b\\c\nd').inc()
+
+    assert 'paths_total{path="a\\"b\\\\c\\nd"} 1' in registry.render().splitlines()
+
+
+def test_render_by_prefix(registry):
+    registry.counter("cv_jobs_total", "Jobs")
+    registry.counter("http_requests_total", "Requests")
+
+    rendered = registry.render(prefix="cv_")
+    assert "cv_jobs_total" in rendered
+    assert "http_requests_total" not in rendered
+
+
+def test_duplicate_and_mislabelled_metrics_are_rejected(registry):
+    counter = registry.counter("jobs_total", "Jobs", ["status"])
+    with pytest.raises(ValueError):
+        registry.counter("jobs_total", "Jobs")
+    with pytest.raises(ValueError):
+        counter.labels("done", "extra")
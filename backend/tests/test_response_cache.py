@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+from fastapi.responses import JSONResponse
+
+from app.core.response_cache import ResponseCache, mark_degraded
+from tests.helpers import make_request
+
+
+class Endpoint:
+    """Handler returning a counter, so tests can tell cached bodies from fresh ones."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, request):
+        self.calls += 1
+        return JSONResponse({"call": self.calls})
+
+
+@pytest.fixture
+def cache():
+    # No redis_url: the local tier only
+    return ResponseCache(max_entries=2, ttl_seconds=60)
+
+
+@pytest.mark.asyncio
+async def test_second_request_is_a_hit(cache):
+    endpoint = Endpoint()
+
+    first = await cache.serve("projects", make_request("/projects"), endpoint)
+    second = await cache.serve("projects", make_request("/projects"), endpoint)
+
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert second.body == first.body
+    assert endpoint.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_query_order_does_not_matter(cache):
+    endpoint = Endpoint()
+
+    await cache.serve("projects", make_request("/projects", "a=1&b=2"), endpoint)
+    response = await cache.serve("projects", make_request("/projects", "b=2&a=1"), endpoint)
+
+    assert response.headers["x-cache"] == "HIT"
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_only_its_tag(cache):
+    projects, skills = Endpoint(), Endpoint()
+    await cache.serve("projects", make_request("/projects"), projects)
+    await cache.serve("skills", make_request("/skills"), skills)
+
+    await cache.invalidate("projects")
+
+    assert (await cache.serve("projects", make_request("/projects"), projects)).headers["x-cache"] == "MISS"
+    assert (await cache.serve("skills", make_request("/skills"), skills)).headers["x-cache"] == "HIT"
+
+
+@pytest.mark.asyncio
+async def test_miss_racing_an_invalidation_is_not_stored(cache):
+    invalidated = asyncio.Event()
+
+    async def slow_endpoint(request):
+        # A write lands while the read is still building its response
+        await cache.invalidate("projects")
+        invalidated.set()
+        return JSONResponse({"stale": True})
+
+    response = await cache.serve("projects", make_request("/projects"), slow_endpoint)
+
+    assert invalidated.is_set()
+    assert "x-cache" not in response.headers
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_degraded_responses_are_not_cached(cache):
+    async def fallback_endpoint(request):
+        mark_degraded()
+        return JSONResponse({"fallback": True})
+
+    response = await cache.serve("projects", make_request("/projects"), fallback_endpoint)
+
+    assert response.headers["cache-control"] == "no-store"
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached(cache):
+    async def failing_endpoint(request):
+        return JSONResponse({"detail": "nope"}, status_code=500)
+
+    await cache.serve("projects", make_request("/projects"), failing_endpoint)
+
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_call(cache):
+    release = asyncio.Event()
+    calls = 0
+
+    async def slow_endpoint(request):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return JSONResponse({"ok": True})
+
+    first = asyncio.create_task(cache.serve("projects", make_request("/projects"), slow_endpoint))
+    second = asyncio.create_task(cache.serve("projects", make_request("/projects"), slow_endpoint))
+    await asyncio.sleep(0)
+    release.set()
+    responses = await asyncio.gather(first, second)
+
+    assert calls == 1
+    assert responses[0].body == responses[1].body
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted(cache):
+    endpoint = Endpoint()
+    for path in ("/a", "/b"):
+        await cache.serve("projects", make_request(path), endpoint)
+    # Touch /a so /b is the oldest
+    await cache.serve("projects", make_request("/a"), endpoint)
+    await cache.serve("projects", make_request("/c"), endpoint)
+
+    assert (await cache.serve("projects", make_request("/a"), endpoint)).headers["x-cache"] == "HIT"
+    assert (await cache.serve("projects", make_request("/b"), endpoint)).headers["x-cache"] == "MISS"
@@ -0,0 +1,191 @@
+import asyncio
+
+import orjson
+import pytest
+
+from app.core.state_store import MemoryBackend, StateLockTimeout, StateStore
+
+
+class FakeLock:
+    def __init__(self, backend):
+        self.backend = backend
+        self.extensions = 0
+
+    async def acquire(self):
+        if self.backend.lock_held:
+            return False
+        self.backend.lock_held = True
+        return True
+
+    async def release(self):
+        self.backend.lock_held = False
+
+    async def extend(self, additional_time, replace_ttl=False):
+        self.extensions += 1
+
+
+class FakeBackend:
+    """In-memory stand-in for RedisBackend, shared by several stores like Redis would be."""
+
+    shared = True
+    available = True
+    lock_ttl = 0.03
+
+    def __init__(self):
+        self.snapshots = {}
+        self.saves = 0
+        self.lock_held = False
+        self.locks = []
+
+    def failed(self, error):
+        raise AssertionError(f"backend marked failed: {error}")
+
+    async def version(self, name):
+        snapshot = self.snapshots.get(name)
+        return snapshot[0] if snapshot else None
+
+    async def load(self, name):
+        return self.snapshots.get(name)
+
+    async def save(self, name, data):
+        version = (await self.version(name) or 0) + 1
+        self.snapshots[name] = (version, data)
+        self.saves += 1
+        return version
+
+    def lock(self, name):
+        lock = FakeLock(self)
+        self.locks.append(lock)
+        return lock
+
+    async def keep_locked(self, lock):
+        while True:
+            await asyncio.sleep(self.lock_ttl / 3)
+            await lock.extend(self.lock_ttl, replace_ttl=True)
+
+
+class Counter:
+    """A piece of module-style state registered with a store."""
+
+    def __init__(self, store):
+        self.value = 0
+        self.state = store.register("counter", self.dump, self.load)
+
+    def dump(self):
+        return {"value": self.value}
+
+    def load(self, data):
+        self.value = data["value"]
+
+
+@pytest.fixture
+def backend():
+    return FakeBackend()
+
+
+def _worker(backend):
+    return Counter(StateStore(backend, poll_seconds=60))
+
+
+@pytest.mark.asyncio
+async def test_write_publishes_to_other_workers(backend):
+    first, second = _worker(backend), _worker(backend)
+
+    async with first.state.write():
+        first.value += 1
+    second.state.invalidate(first.state.version)
+    await second.state.sync()
+
+    assert second.value == 1
+    assert orjson.loads(backend.snapshots["counter"][1]) == {"value": 1}
+
+
+@pytest.mark.asyncio
+async def test_write_starts_from_the_latest_shared_copy(backend):
+    first, second = _worker(backend), _worker(backend)
+    async with first.state.write():
+        first.value += 1
+
+    # No invalidation reached the second worker; the write reloads anyway
+    async with second.state.write():
+        second.value += 1
+
+    assert second.value == 2
+    assert orjson.loads(backend.snapshots["counter"][1]) == {"value": 2}
+
+
+@pytest.mark.asyncio
+async def test_failed_write_is_not_published(backend):
+    worker = _worker(backend)
+    async with worker.state.write():
+        worker.value = 1
+    saves = backend.saves
+
+    with pytest.raises(RuntimeError):
+        async with worker.state.write():
+            worker.value = 99
+            raise RuntimeError("half applied")
+
+    assert backend.saves == saves
+    assert not backend.lock_held
+    # The half-applied change is replaced by the shared copy on the next read
+    await worker.state.sync()
+    assert worker.value == 1
+
+
+@pytest.mark.asyncio
+async def test_lock_timeout_raises_503(backend):
+    worker = _worker(backend)
+    await worker.state.sync()
+    backend.lock_held = True
+    saves = backend.saves
+
+    with pytest.raises(StateLockTimeout) as excinfo:
+        async with worker.state.write():
+            worker.value = 1
+
+    assert excinfo.value.status_code == 503
+    assert worker.value == 0
+    assert backend.saves == saves
+
+
+@pytest.mark.asyncio
+async def test_lock_is_extended_during_slow_writes(backend):
+    worker = _worker(backend)
+
+    async with worker.state.write():
+        await asyncio.sleep(backend.lock_ttl)
+
+    assert backend.locks[-1].extensions > 0
+    assert not backend.lock_held
+
+
+@pytest.mark.asyncio
+async def test_decorators(backend):
+    worker = _worker(backend)
+
+    @worker.state.writer
+    async def increment():
+        worker.value += 1
+
+    @worker.state.reader
+    async def read():
+        return worker.value
+
+    await increment()
+    await increment()
+
+    assert await read() == 2
+    assert orjson.loads(backend.snapshots["counter"][1]) == {"value": 2}
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_keeps_state_local():
+    worker = Counter(StateStore(MemoryBackend(), poll_seconds=60))
+
+    async with worker.state.write():
+        worker.value = 3
+    await worker.state.sync()
+
+    assert worker.value == 3
+    assert worker.state.version == 0